@@ -26,17 +26,27 @@ __author__ = "TenderIntel Team"
 __email__ = "team@tenderintel.org"
 __license__ = "MIT"
 
+import importlib
+
 # Core imports for public API
-from .core.client import TenderIntelClient
 from .core.models import (
     TenderRecord,
     SearchResult,
     CompetitiveIntelligence,
     MarketAnalysis
 )
-from .search.sqlite_fts5_engine import SQLiteFTS5Engine
 from .search.synonym_manager import SynonymManager
-from .scraper.tenderx_integration import TenderXIntegratedScraper, TenderXAdapter
+
+# The client, engine and scraper are imported on first attribute access
+# (PEP 562), so "import tenderintel" does not pay for loading the search
+# engine, the scraper and what they import (pyahocorasick among them)
+# until one of them is used
+_LAZY_EXPORTS = {
+    'TenderIntelClient': '.core.client',
+    'SQLiteFTS5Engine': '.search.sqlite_fts5_engine',
+    'TenderXIntegratedScraper': '.scraper.tenderx_integration',
+    'TenderXAdapter': '.scraper.tenderx_integration'
+}
 
 # Version info tuple for programmatic access
 VERSION_INFO = tuple(map(int, __version__.split('.')))
@@ -62,6 +72,17 @@ __all__ = [
     "TenderXAdapter"
 ]
 
+def __getattr__(name):
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value  # Cache so later lookups skip __getattr__
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
+
 def get_version() -> str:
     """Get the current version of TenderIntel."""
     return __version__
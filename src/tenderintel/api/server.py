@@ -39,7 +39,7 @@ from typing import List, Dict, Any, Optional
 from tenderintel.search.manager import UnifiedSearchManager
 from tenderintel.search.search_engine_interface import SearchFilters
 from tenderintel.config import load_config
-from tenderintel.core.database_manager import DatabaseManager
+from tenderintel.core.database_manager import DatabaseManager, PAGE_SIZE_BYTES
 from tenderintel.scraper.tenderx_integration import TenderXIntegratedScraper
 from tenderintel.analytics.financial_analysis_engine import FinancialAnalysisEngine
 from tenderintel.analytics.currency_normalizer import CurrencyNormalizer, DealSizeClassifier
@@ -118,10 +118,13 @@ app.add_middleware(
 # Initialize core services with absolute paths
 # Fix path resolution using project root
 db_path = project_root / "data" / "tenders.db"
-database_manager = DatabaseManager(str(db_path))
+config = load_config()
+database_manager = DatabaseManager(
+    str(db_path),
+    page_size=config.get('search', {}).get('sqlite', {}).get('page_size', PAGE_SIZE_BYTES)
+)
 
 # Initialize unified search manager (handles engine selection automatically)
-config = load_config()
 search_manager = UnifiedSearchManager(config)
 tenderx_scraper = TenderXIntegratedScraper()
 
@@ -532,17 +535,17 @@ async def scrape_cppp_tenders(
                 "test_mode": test_mode
             },
             "competitive_intelligence": {
-                "service_categories_found": len(set(t.get("service_category") for t in enhanced_tenders)),
-                "firms_detected": len(set(firm for t in enhanced_tenders for firm in t.get("detected_firms", []))),
-                "regions_covered": len(set(t.get("region") for t in enhanced_tenders))
+                "service_categories_found": len(set(t.service_category for t in enhanced_tenders)),
+                "firms_detected": len(set(firm for t in enhanced_tenders for firm in t.detected_firms)),
+                "regions_covered": len(set(t.region for t in enhanced_tenders))
             },
             "sample_tenders": [
                 {
-                    "tender_id": t.get("tender_id"),
-                    "title": t.get("title", "")[:100] + "..." if len(t.get("title", "")) > 100 else t.get("title", ""),
-                    "service_category": t.get("service_category"),
-                    "detected_firms": t.get("detected_firms", []),
-                    "complexity": t.get("complexity_level")
+                    "tender_id": t.tender_id,
+                    "title": t.title[:100] + "..." if len(t.title) > 100 else t.title,
+                    "service_category": t.service_category,
+                    "detected_firms": t.detected_firms,
+                    "complexity": t.complexity_level
                 }
                 for t in enhanced_tenders[:3]
             ]
@@ -23,6 +23,11 @@ def get_default_config() -> Dict[str, Any]:
             # Default: sqlite (no external dependencies required)
             'engine': 'sqlite',
             
+            # Seconds the manager reuses engine statistics and filter options
+            # (engine health is always checked live)
+            'engine_info_cache_ttl_s': 30,
+            'filter_options_cache_ttl_s': 300,
+            
             # Synonym expansion settings
             'synonyms': {
                 'file': 'config/synonyms.yaml',
@@ -94,11 +99,15 @@ def get_sqlite_config() -> Dict[str, Any]:
         'enable_wal': True,  # Write-Ahead Logging for better concurrency
         'cache_size_kb': 64000,  # 64MB cache for better performance
         'mmap_size_mb': 256,  # 256MB memory-mapped I/O
-        'page_size': 4096,  # Standard page size
+        'page_size': 8192,  # Applied by DatabaseManager when the database is created
         'temp_store': 'memory',  # Temporary tables in memory
         'synchronous': 'normal',  # Balance between safety and speed
         'optimize_on_startup': True,  # Run ANALYZE on startup
-        'connection_pool_size': 5  # Number of reusable connections
+        'connection_pool_size': 5,  # Number of reusable connections
+        'busy_timeout_ms': 5000,  # Wait on a locked database before failing
+        'wal_checkpoint_interval_s': 30,  # Passive WAL checkpoint interval (0 disables)
+        'filter_options_ttl_s': 60,  # Seconds to reuse computed filter options
+        'health_cache_ttl_s': 5  # Seconds to reuse the last health check result
     }
 
 
@@ -126,6 +135,7 @@ def get_opensearch_config() -> Dict[str, Any]:
         'max_retries': 3,
         'retry_on_timeout': True,
         'http_compress': True,
+        'pool_size': 32,  # Keep-alive connections per node
         
         # Index configuration
         'index_prefix': 'tenders',
@@ -139,6 +149,18 @@ def get_opensearch_config() -> Dict[str, Any]:
         'bulk_chunk_size': 1000,
         'bulk_queue_size': 4,
         'request_timeout': 60,
+        'msearch_batch_size': 0,  # Phrases per _msearch sub-query (0 = single query)
+        'search_preference': '_local',  # Shard copy routing for searches
+        'concurrent_segment_search': 'auto',  # Cluster setting: auto, all or none
+        'response_cache_ttl': 30,  # Seconds to reuse identical search responses (0 = off)
+        'response_cache_size': 512,
+        'track_total_hits': None,  # None = server default, 'page' = stop just past the page, or a number
+        'manage_index_template': True,  # Install aoc_date/tender_id sort mapping template
+        'search_timeout': '2s',  # Per-search shard timeout (partial results after)
+        'terminate_after': 0,  # Max docs collected per shard (0 = no cap)
+        'circuit_failure_threshold': 5,  # Failed searches within the window that open the circuit
+        'circuit_window_s': 10,
+        'circuit_cooldown_s': 30,
         
         # Analyzer settings
         'analyzer': {
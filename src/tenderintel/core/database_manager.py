@@ -6,20 +6,52 @@ Creates optimized FTS5 virtual table for title-only search with BM25 ranking
 
 import sqlite3
 import os
+import threading
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Sequence
 import logging
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Column order expected by bulk_insert() rows
+TENDER_COLUMNS = (
+    "title", "org", "status", "aoc_date", "tender_id", "url",
+    "service_category", "value_range", "region", "department_type",
+    "complexity", "keywords"
+)
+
+# Memory-map up to 2 GiB of the database so FTS5 index pages are read
+# straight from the page cache instead of through read() syscalls
+MMAP_SIZE_BYTES = 2 * 1024 * 1024 * 1024
+
+# Larger pages mean fewer page lookups per postings-list scan; SQLite only
+# honours this before the first table is created. Default for the
+# search.sqlite.page_size setting
+PAGE_SIZE_BYTES = 8192
+
+# The FTS5 virtual table and the shadow tables SQLite creates for it
+FTS5_TABLES = (
+    "tenders", "tenders_data", "tenders_idx",
+    "tenders_content", "tenders_docsize", "tenders_config"
+)
+
 class DatabaseManager:
     """Manages SQLite FTS5 database creation and optimization"""
     
-    def __init__(self, db_path: str = "engine/tenders.db"):
+    def __init__(self, db_path: str = "engine/tenders.db", page_size: int = PAGE_SIZE_BYTES):
         self.db_path = Path(db_path)
+        self.page_size = int(page_size)
         self.db_path.parent.mkdir(exist_ok=True)
+        # SQLite allows a single writer; serialize bulk loads from this process
+        self._write_lock = threading.Lock()
+    
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection to the tender database with memory-mapped I/O"""
+        conn = sqlite3.connect(self.db_path)
+        conn.execute(f"PRAGMA mmap_size = {MMAP_SIZE_BYTES}")
+        return conn
     
     def create_database(self) -> Dict[str, Any]:
         """
@@ -31,7 +63,10 @@ class DatabaseManager:
         logger.info(f"Creating FTS5 database at: {self.db_path}")
         
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
+                # Page size must be set before any table exists (and before WAL)
+                conn.execute(f"PRAGMA page_size = {self.page_size}")
+                
                 # Enable foreign keys and other optimizations
                 conn.execute("PRAGMA foreign_keys = ON")
                 conn.execute("PRAGMA journal_mode = WAL")  # Better concurrent access
@@ -149,14 +184,57 @@ class DatabaseManager:
             logger.error(f"Database creation failed: {e}")
             raise
     
+    def bulk_insert(self, rows: Sequence[Sequence[Any]]) -> int:
+        """
+        Insert many tender rows inside a single write transaction
+        
+        Rows must follow TENDER_COLUMNS order. Wrapping executemany in
+        BEGIN IMMEDIATE ... COMMIT pays for one commit (and one fsync) for the
+        whole batch instead of one per row.
+        
+        Returns:
+            Number of rows inserted
+        """
+        if not rows:
+            return 0
+        
+        columns = ", ".join(TENDER_COLUMNS)
+        placeholders = ", ".join("?" * len(TENDER_COLUMNS))
+        
+        with self._write_lock:
+            conn = self._connect()
+            conn.isolation_level = None  # Manage the transaction explicitly
+            try:
+                conn.execute("BEGIN IMMEDIATE")
+                cursor = conn.executemany(
+                    f"INSERT INTO tenders({columns}) VALUES ({placeholders})", rows
+                )
+                conn.execute("COMMIT")
+                inserted = cursor.rowcount
+            except Exception as e:
+                # BEGIN IMMEDIATE itself fails when another writer holds the lock
+                if conn.in_transaction:
+                    conn.execute("ROLLBACK")
+                logger.error(f"Bulk insert failed: {e}")
+                raise
+            finally:
+                conn.close()
+        
+        logger.info(f"Bulk inserted {inserted} tender records")
+        return inserted
+    
     def validate_database_structure(self) -> Dict[str, Any]:
         """Validate that FTS5 database was created correctly with all optimizations"""
         
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             # Check FTS5 table exists and is configured correctly
-            tables = conn.execute("""
-                SELECT name FROM sqlite_master WHERE type='table' AND name LIKE '%tenders%'
-            """).fetchall()
+            placeholders = ", ".join("?" * len(FTS5_TABLES))
+            existing_tables = {
+                row[0] for row in conn.execute(
+                    f"SELECT name FROM sqlite_master WHERE name IN ({placeholders})",
+                    FTS5_TABLES
+                )
+            }
             
             # Verify FTS5 configuration
             fts5_info = conn.execute("""
@@ -179,7 +257,7 @@ class DatabaseManager:
             validation_result = {
                 'database_path': str(self.db_path),
                 'database_size_bytes': db_size,
-                'tables_created': [t[0] for t in tables],
+                'tables_created': [t for t in FTS5_TABLES if t in existing_tables],
                 'fts5_configured': len(fts5_info) > 0,
                 'bm25_configured': True,  # If we got here, it worked
                 'basic_query_test': test_query[0] == 0,  # Should be 0 for empty table
@@ -262,7 +340,7 @@ class DatabaseManager:
             return {'status': 'not_created', 'error': 'Database file does not exist'}
         
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 # Get record count
                 record_count = conn.execute("SELECT COUNT(*) FROM tenders").fetchone()[0]
                 
@@ -309,40 +387,35 @@ class DatabaseManager:
         """Get available filter options from reference tables"""
         
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                # Get service categories
-                categories = conn.execute("""
-                    SELECT category_name, description, color_code 
-                    FROM service_categories 
-                    ORDER BY category_name
-                """).fetchall()
-                
-                # Get value ranges
-                value_ranges = conn.execute("""
-                    SELECT range_code, range_label 
-                    FROM value_ranges 
-                    ORDER BY min_value
-                """).fetchall()
-                
-                # Get regions
-                regions = conn.execute("""
-                    SELECT region_code, region_name, state 
-                    FROM regions 
-                    ORDER BY region_name
-                """).fetchall()
+            with self._connect() as conn:
+                # sqlite3.Row lets us build the response dicts straight off the
+                # cursor without materializing an intermediate tuple list
+                conn.row_factory = sqlite3.Row
                 
                 return {
                     "service_categories": [
-                        {"code": cat[0], "label": cat[1], "color": cat[2]} 
-                        for cat in categories
+                        {"code": row["category_name"], "label": row["description"], "color": row["color_code"]}
+                        for row in conn.execute("""
+                            SELECT category_name, description, color_code 
+                            FROM service_categories 
+                            ORDER BY category_name
+                        """)
                     ],
                     "value_ranges": [
-                        {"code": vr[0], "label": vr[1]} 
-                        for vr in value_ranges
+                        {"code": row["range_code"], "label": row["range_label"]}
+                        for row in conn.execute("""
+                            SELECT range_code, range_label 
+                            FROM value_ranges 
+                            ORDER BY min_value
+                        """)
                     ],
                     "regions": [
-                        {"code": reg[0], "label": reg[1], "state": reg[2]} 
-                        for reg in regions
+                        {"code": row["region_code"], "label": row["region_name"], "state": row["state"]}
+                        for row in conn.execute("""
+                            SELECT region_code, region_name, state 
+                            FROM regions 
+                            ORDER BY region_name
+                        """)
                     ]
                 }
                 
@@ -0,0 +1,57 @@
+import os
+import shelve
+import threading
+from PIL import Image
+
+# CAPTCHA images are drawn from a recycled pool of templates, so answers that
+# the portal accepted once are remembered by image hash and reused
+CACHE_PATH = os.getenv("TENDERINTEL_CAPTCHA_CACHE", os.path.join(os.getcwd(), "captcha_cache"))
+
+_cache = None
+_cache_lock = threading.Lock()
+
+def _get_cache():
+    global _cache
+    if _cache is None:
+        _cache = shelve.open(CACHE_PATH)
+    return _cache
+
+def image_hash(image, size=8):
+    """
+    Difference hash of a CAPTCHA image: compare neighbouring pixels of a
+    downscaled grayscale copy. Returns a 64-bit hex string for size=8.
+    """
+    small = image.convert("L").resize((size + 1, size), Image.LANCZOS)
+    pixels = small.tobytes()  # One byte per pixel in "L" mode
+    bits = 0
+    for row in range(size):
+        offset = row * (size + 1)
+        for col in range(size):
+            bits = (bits << 1) | (pixels[offset + col] > pixels[offset + col + 1])
+    return f"{bits:0{size * size // 4}x}"
+
+def lookup_captcha(key):
+    """Return the accepted answer for this image hash, if any"""
+    if not key:
+        return None
+    with _cache_lock:
+        return _get_cache().get(key)
+
+def remember_captcha(key, text):
+    """Store an answer once the portal has accepted it"""
+    if not key or not text:
+        return
+    with _cache_lock:
+        cache = _get_cache()
+        cache[key] = text
+        cache.sync()
+
+def forget_captcha(key):
+    """Drop a cached answer that the portal rejected"""
+    if not key:
+        return
+    with _cache_lock:
+        cache = _get_cache()
+        if key in cache:
+            del cache[key]
+            cache.sync()
@@ -1,63 +1,160 @@
+import itertools
+import logging
+import os
+import string
+from collections import namedtuple
 import pytesseract
 from PIL import Image, ImageFilter, ImageOps
 from io import BytesIO
+from .captcha_cache import image_hash, lookup_captcha
+from selenium.common.exceptions import StaleElementReferenceException, TimeoutException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+
+logger = logging.getLogger(__name__)
+
+CaptchaSolution = namedtuple("CaptchaSolution", ["text", "confidence", "cache_key"])
+
+# Answers below this OCR confidence are refreshed instead of submitted
+MIN_CONFIDENCE = 0.55
+
+CAPTCHA_IMAGE = (By.ID, "captchaImage")
+CAPTCHA_REFRESH = (By.ID, "captcha")
+
+# Debug image dumps are opt-in; they cost a PNG encode + disk write per image
+DEBUG = os.getenv("TENDERINTEL_CAPTCHA_DEBUG") == "1"
+DEBUG_DIR = "/tmp/captcha"
+DEBUG_RING_SIZE = 20  # Keep only the images of the last N CAPTCHAs
+
+_debug_slots = itertools.cycle(range(DEBUG_RING_SIZE))
+
+# Tesseract options shared by every strategy; only the page segmentation mode varies
+CHAR_WHITELIST = string.ascii_uppercase + string.ascii_lowercase + string.digits
+TESSERACT_CONFIG = "--psm {psm} --oem 3 -c tessedit_char_whitelist=" + CHAR_WHITELIST
+
+def _threshold_table(cutoff):
+    """Grayscale -> black/white lookup table for Image.point"""
+    return [0 if x < cutoff else 255 for x in range(256)]
+
+_THRESHOLD_140 = _threshold_table(140)
+_THRESHOLD_120 = _threshold_table(120)
+_THRESHOLD_100 = _threshold_table(100)
+
+def _preprocess_standard(img):
+    """Standard preprocessing"""
+    return img.convert("L").point(_THRESHOLD_140, '1')
+
+def _preprocess_no_invert(img):
+    """No inversion (for light backgrounds)"""
+    return img.convert("L").point(_THRESHOLD_120, '1').filter(ImageFilter.MedianFilter())
+
+def _preprocess_high_contrast(img):
+    """Different threshold"""
+    return img.convert("L").point(_THRESHOLD_100, '1')
+
+# OCR strategies, tried in order until one yields a plausible CAPTCHA
+STRATEGIES = (
+    {"name": "standard", "preprocess": _preprocess_standard, "config": TESSERACT_CONFIG.format(psm=8)},
+    {"name": "no_invert", "preprocess": _preprocess_no_invert, "config": TESSERACT_CONFIG.format(psm=7)},
+    {"name": "high_contrast", "preprocess": _preprocess_high_contrast, "config": TESSERACT_CONFIG.format(psm=6)},
+)
+
+def _save_debug_image(image, slot, name):
+    """Write a CAPTCHA image into the debug ring buffer"""
+    os.makedirs(DEBUG_DIR, exist_ok=True)
+    image.save(os.path.join(DEBUG_DIR, f"captcha_{slot:02d}_{name}.png"))
+
+def refresh_captcha(browser, timeout=5):
+    """
+    Click the CAPTCHA refresh button and wait for the new image instead of
+    sleeping a fixed interval. Returns the current captchaImage element.
+    """
+    old_images = browser.find_elements(*CAPTCHA_IMAGE)
+    old_src = old_images[0].get_attribute("src") if old_images else None
+
+    refresh_button = WebDriverWait(browser, timeout).until(
+        EC.element_to_be_clickable(CAPTCHA_REFRESH)
+    )
+    refresh_button.click()
+
+    def _image_replaced(driver):
+        try:
+            return old_images[0].get_attribute("src") != old_src
+        except StaleElementReferenceException:
+            return True
+
+    if old_images:
+        try:
+            WebDriverWait(browser, 2).until(_image_replaced)
+        except TimeoutException:
+            pass  # Image reloaded in place under the same URL
+
+    return WebDriverWait(browser, 10).until(
+        EC.presence_of_element_located(CAPTCHA_IMAGE)
+    )
+
+def _run_ocr(image, config):
+    """OCR an image; returns (text, confidence) with confidence in 0..1"""
+    data = pytesseract.image_to_data(image, config=config, output_type=pytesseract.Output.DICT)
+    words = [
+        (word.strip(), float(conf))
+        for word, conf in zip(data["text"], data["conf"])
+        if word.strip() and float(conf) >= 0
+    ]
+    text = "".join(word for word, _ in words)
+    confidence = sum(conf for _, conf in words) / len(words) / 100 if words else 0.0
+    return text, confidence
 
 def solve_captcha(browser, captcha_element):
     """
     Captures and solves CAPTCHA from the given browser and CAPTCHA element.
-    Returns the cleaned CAPTCHA text with multiple OCR strategies.
+    Returns a CaptchaSolution(text, confidence, cache_key): the cleaned CAPTCHA
+    text with multiple OCR strategies, tesseract's mean word confidence (0-1),
+    and the image hash to pass to remember_captcha/forget_captcha once the
+    portal has accepted or rejected the answer.
     """
+    cache_key = None
     try:
         # Get CAPTCHA image as PNG from the element
         captcha_png = captcha_element.screenshot_as_png
         original_image = Image.open(BytesIO(captcha_png))
 
+        # Skip OCR entirely for images we have already solved
+        cache_key = image_hash(original_image)
+        cached_text = lookup_captcha(cache_key)
+        if cached_text:
+            logger.debug(f"CAPTCHA cache hit: '{cached_text}'")
+            return CaptchaSolution(cached_text, 1.0, cache_key)
+
         # Save original for debugging
-        original_image.save("captcha_original.png")
-
-        # Try multiple OCR strategies
-        strategies = [
-            # Strategy 1: Standard preprocessing
-            {
-                "name": "standard",
-                "preprocess": lambda img: img.convert("L").point(lambda x: 0 if x < 140 else 255, '1'),
-                "config": r'--psm 8 --oem 3 -c tessedit_char_whitelist=ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789'
-            },
-            # Strategy 2: No inversion (for light backgrounds)
-            {
-                "name": "no_invert", 
-                "preprocess": lambda img: img.convert("L").point(lambda x: 0 if x < 120 else 255, '1').filter(ImageFilter.MedianFilter()),
-                "config": r'--psm 7 --oem 3 -c tessedit_char_whitelist=ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789'
-            },
-            # Strategy 3: Different threshold
-            {
-                "name": "high_contrast",
-                "preprocess": lambda img: img.convert("L").point(lambda x: 0 if x < 100 else 255, '1'),
-                "config": r'--psm 6 --oem 3 -c tessedit_char_whitelist=ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789'
-            }
-        ]
+        debug_slot = next(_debug_slots) if DEBUG else None
+        if DEBUG:
+            _save_debug_image(original_image, debug_slot, "original")
 
         best_result = ""
+        best_confidence = 0.0
         
-        for strategy in strategies:
+        for strategy in STRATEGIES:
             try:
                 # Apply preprocessing
                 processed_image = strategy["preprocess"](original_image.copy())
-                processed_image.save(f"captcha_{strategy['name']}.png")
+                if DEBUG:
+                    _save_debug_image(processed_image, debug_slot, strategy["name"])
                 
                 # Run OCR
-                captcha_text = pytesseract.image_to_string(processed_image, config=strategy["config"])
-                captcha_text = captcha_text.strip().replace(" ", "").replace("\n", "")
+                captcha_text, confidence = _run_ocr(processed_image, strategy["config"])
                 
-                print(f"[OCR-{strategy['name']}] Result: '{captcha_text}' (length: {len(captcha_text)})")
+                logger.debug(f"[OCR-{strategy['name']}] Result: '{captcha_text}' (length: {len(captcha_text)}, confidence: {confidence:.2f})")
                 
                 # Check if result looks valid (6 characters is typical for CPPP)
                 if len(captcha_text) == 6 and captcha_text.isalnum():
-                    print(f"✅ OCR SUCCESS with {strategy['name']} strategy")
-                    return captcha_text
+                    logger.debug(f"OCR success with {strategy['name']} strategy")
+                    return CaptchaSolution(captcha_text, confidence, cache_key)
                 elif len(captcha_text) >= 4:  # Keep best partial result
                     if len(captcha_text) > len(best_result):
                         best_result = captcha_text
+                        best_confidence = confidence
                         
             except Exception as e:
                 print(f"[OCR-{strategy['name']}] Failed: {e}")
@@ -66,12 +163,12 @@ def solve_captcha(browser, captcha_element):
         # If we have a partial result, use it
         if best_result and len(best_result) >= 4:
             print(f"⚠️ Using best OCR result: '{best_result}'")
-            return best_result
+            return CaptchaSolution(best_result, best_confidence, cache_key)
             
         # Last resort: return empty to trigger retry logic
         print("❌ All OCR strategies failed")
-        return ""
+        return CaptchaSolution("", 0.0, cache_key)
         
     except Exception as e:
         print(f"❌ Complete CAPTCHA solving error: {e}")
-        return ""
+        return CaptchaSolution("", 0.0, cache_key)
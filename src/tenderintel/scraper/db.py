@@ -1,3 +1,5 @@
+import threading
+from functools import lru_cache
 from supabase import create_client
 from dotenv import load_dotenv
 import os
@@ -7,32 +9,166 @@ load_dotenv()
 SUPABASE_URL = os.getenv("SUPABASE_URL")
 SUPABASE_KEY = os.getenv("SUPABASE_KEY")
 
-# Initialize Supabase client only if credentials are available
-supabase = None
-if SUPABASE_URL and SUPABASE_KEY:
+# Number of buffered records that triggers an automatic flush
+BATCH_SIZE = 50
+
+# Seconds between background flushes while a flusher thread is running
+FLUSH_INTERVAL = 5.0
+
+
+@lru_cache(maxsize=1)
+def _get_client():
+    """Build the Supabase client on first use (None if not configured)"""
+    if not SUPABASE_URL or not SUPABASE_KEY:
+        print("⚠️ Supabase credentials not found in .env - database features disabled")
+        return None
     try:
-        supabase = create_client(SUPABASE_URL, SUPABASE_KEY)
+        client = create_client(SUPABASE_URL, SUPABASE_KEY)
         print("✅ Supabase client initialized")
+        return client
     except Exception as e:
         print(f"⚠️ Failed to initialize Supabase client: {e}")
-else:
-    print("⚠️ Supabase credentials not found in .env - database features disabled")
+        return None
 
-def insert_tender_record(tender_id, s3_url):
-    """Insert tender record to Supabase (optional - requires .env configuration)"""
-    if not supabase:
+
+def fetch_existing_tender_ids(tender_ids=None, page_size=1000):
+    """Return the set of tender IDs already stored in Supabase.
+
+    With ``tender_ids`` only those IDs are checked in one ``in`` query;
+    otherwise every stored ID is fetched, ``page_size`` rows per request
+    (the scraper always passes the IDs it is about to process).
+    """
+    client = _get_client()
+    if client is None:
+        return set()
+
+    try:
+        if tender_ids is not None:
+            if not tender_ids:
+                return set()
+            response = client.table("tenders").select("tender_id").in_("tender_id", list(tender_ids)).execute()
+            return {row["tender_id"] for row in response.data}
+
+        existing = set()
+        start = 0
+        while True:
+            response = client.table("tenders").select("tender_id").range(start, start + page_size - 1).execute()
+            existing.update(row["tender_id"] for row in response.data)
+            if len(response.data) < page_size:
+                return existing
+            start += page_size
+    except Exception as e:
+        print(f"⚠️ Could not fetch existing tender IDs: {e}")
+        return set()
+
+
+# Records waiting to be posted in the next batch (shared by scraper workers)
+_buffer = []
+_buffer_lock = threading.Lock()
+
+_flusher = None
+_flusher_stop = threading.Event()
+_flusher_wake = threading.Event()
+
+
+def insert_tender_records(records):
+    """Upsert a batch of tender records to Supabase in a single request.
+
+    PostgREST accepts an array body, so the whole batch costs one HTTP round
+    trip. Conflicts on ``tender_id`` update the existing row, so re-runs are
+    safe. If the batch is rejected, rows are retried one at a time so a single
+    bad record does not drop the rest.
+    """
+    client = _get_client()
+    if client is None:
         print("⚠️ Supabase not configured - skipping database insert")
         return None
-        
-    data = {
-        "tender_id": tender_id,
-        "s3_url": s3_url
-    }
+
+    if not records:
+        return []
 
     try:
-        response = supabase.table("tenders").insert(data).execute()
-        print("✅ Inserted:", response.data)
+        response = client.table("tenders").upsert(records, on_conflict="tender_id").execute()
+        print(f"✅ Upserted {len(response.data)} records")
         return response.data
     except Exception as e:
-        print("❌ Error inserting data:", e)
+        print(f"❌ Batch insert failed ({e}) - retrying {len(records)} records individually")
+
+    inserted = []
+    for record in records:
+        try:
+            response = client.table("tenders").upsert(record, on_conflict="tender_id").execute()
+            inserted.extend(response.data)
+        except Exception as e:
+            print(f"❌ Error inserting {record.get('tender_id')}: {e}")
+    return inserted
+
+
+def insert_tender_record(tender_id, s3_url):
+    """Queue a tender record for insertion (optional - requires .env configuration)
+
+    Records are buffered and posted in batches of ``BATCH_SIZE``, by the
+    background flusher if one is running (see ``start_flusher``). Call
+    ``flush()`` at the end of a scraping session to post the remainder.
+    """
+    if _get_client() is None:
+        print("⚠️ Supabase not configured - skipping database insert")
         return None
+
+    with _buffer_lock:
+        _buffer.append({
+            "tender_id": tender_id,
+            "s3_url": s3_url
+        })
+        should_flush = len(_buffer) >= BATCH_SIZE
+
+    if should_flush:
+        if _flusher is not None:
+            _flusher_wake.set()
+            return None
+        return flush()
+    return None
+
+
+def flush():
+    """Post all buffered tender records in BATCH_SIZE chunks and clear the buffer"""
+    with _buffer_lock:
+        records = _buffer[:]
+        _buffer.clear()
+
+    posted = []
+    for start in range(0, len(records), BATCH_SIZE):
+        posted.extend(insert_tender_records(records[start:start + BATCH_SIZE]) or [])
+    return posted
+
+
+def _flush_loop(interval):
+    while not _flusher_stop.is_set():
+        _flusher_wake.wait(interval)
+        _flusher_wake.clear()
+        try:
+            flush()
+        except Exception as e:
+            print(f"❌ Background flush failed: {e}")
+
+
+def start_flusher(interval=FLUSH_INTERVAL):
+    """Post buffered records from a background thread every ``interval``
+    seconds, or as soon as ``BATCH_SIZE`` records are waiting."""
+    global _flusher
+    if _flusher is not None:
+        return
+    _flusher_stop.clear()
+    _flusher = threading.Thread(target=_flush_loop, args=(interval,), name="supabase-flusher", daemon=True)
+    _flusher.start()
+
+
+def stop_flusher():
+    """Stop the background flusher and post whatever is still buffered"""
+    global _flusher
+    if _flusher is not None:
+        _flusher_stop.set()
+        _flusher_wake.set()
+        _flusher.join()
+        _flusher = None
+    return flush()
@@ -1,173 +1,466 @@
 import os
+import queue
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+import requests
+
+try:
+    from watchdog.events import PatternMatchingEventHandler
+    from watchdog.observers import Observer
+except ImportError:
+    PatternMatchingEventHandler = object
+    Observer = None
+from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from .s3_uploader import upload_to_s3
-from .captcha_solver import solve_captcha
-from .db import insert_tender_record
+from .s3_uploader import s3_enabled, upload_fileobj_to_s3, upload_to_s3_async, wait_for_uploads
+from .captcha_solver import CAPTCHA_IMAGE, MIN_CONFIDENCE, refresh_captcha, solve_captcha
+from .captcha_cache import forget_captcha, remember_captcha
+from .retry import record_failed_tender, retry
+from .db import fetch_existing_tender_ids, insert_tender_record, flush as flush_tender_records
+
+# Chunk size for streaming zip downloads to disk
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Value cell next to the innermost "Tender ID" label cell
+TENDER_ID_SCRIPT = """
+return document.evaluate(
+    "//td[not(.//td) and normalize-space(.)='Tender ID']/following-sibling::td[1]",
+    document, null, XPathResult.STRING_TYPE, null
+).stringValue;
+"""
+
+# Signs that the CAPTCHA-accepted page is already triggering the download
+AUTO_DOWNLOAD = (By.XPATH, (
+    "//meta[translate(@http-equiv, 'REFRESH', 'refresh')='refresh']"
+    " | //iframe[contains(@src, '.zip') or contains(@src, 'download')]"
+))
+
+# Locators used on every tender page
+DOWNLOAD_LINK = (By.XPATH, "//a[contains(text(), 'Download as zip file')]")
+TENDER_ID_LOCATOR = (By.XPATH, '//*[@id="content"]/table/tbody/tr[2]/td/table/tbody/tr/td[2]/table/tbody/tr[4]/td/table[2]/tbody/tr/td/table/tbody/tr[2]/td/table/tbody/tr[3]/td[2]/b')
+CAPTCHA_INPUT = (By.ID, "captchaText")
+SUBMIT_BUTTON = (By.ID, "Submit")
+INVALID_CAPTCHA = (By.XPATH, "//td[@class='td_space']//b[contains(text(), 'Invalid Captcha')]")
+
+MAX_CAPTCHA_ATTEMPTS = 10
+
+# Failures worth retrying: page load timeouts and network-level errors.
+# Other WebDriverExceptions (missing or stale elements) mean the page is not
+# what we expected, and retrying would not change that
+TRANSIENT_ERRORS = (TimeoutException, requests.ConnectionError, requests.Timeout)
+
+# One keep-alive HTTP session per worker thread
+_http_local = threading.local()
+
+
+def _get_http_session():
+    session = getattr(_http_local, "session", None)
+    if session is None:
+        session = requests.Session()
+        _http_local.session = session
+    return session
+
 
+def process_tenders(browsers, tender_links, tender_ids=None):
+    """
+    Process tender links across a pool of browsers.
 
-def process_tenders(browser, tender_links):
-    base_url = "https://eprocure.gov.in"
-    download_dir = os.path.join(os.getcwd(), "downloads")
-    original_window = browser.current_window_handle
-    for index, tender_link in enumerate(tender_links):
+    ``browsers`` is a list of ``(browser, download_dir)`` pairs as returned by
+    ``initialize_browser_pool``; each worker owns one browser (and one tab) and
+    its own download directory so zip files never collide.
+
+    ``tender_ids`` are the IDs shown on the listing page for these links; they
+    are checked against Supabase in one query. Without them each tender is
+    checked on its own once its page has been read.
+    """
+    pool = queue.Queue()
+    for worker in browsers:
+        pool.put(worker)
+
+    total = len(tender_links)
+
+    # One lookup for this listing's IDs up front so tenders ingested by earlier
+    # runs are skipped before any CAPTCHA, download or upload work is done
+    existing_ids = None
+    if tender_ids:
+        existing_ids = fetch_existing_tender_ids(tender_ids=tender_ids)
+        if existing_ids:
+            print(f"[⏭️] {len(existing_ids)} tenders already ingested; they will be skipped")
+
+    def _process_one(item):
+        index, tender_link = item
+        browser, download_dir = pool.get()
         try:
-            print(f"Processing tender {index + 1}/{len(tender_links)}")
-
-            # Open link in new tab
-            browser.execute_script("window.open(arguments[0]);", tender_link)
-            browser.switch_to.window(browser.window_handles[-1])
-            
-
-            # Wait for tender ID element (update the selector as needed)
-            tender_id_elem = WebDriverWait(browser, 10).until(
-                EC.presence_of_element_located((By.XPATH, '//*[@id="content"]/table/tbody/tr[2]/td/table/tbody/tr/td[2]/table/tbody/tr[4]/td/table[2]/tbody/tr/td/table/tbody/tr[2]/td/table/tbody/tr[3]/td[2]/b'))
-            )
-            tender_id = tender_id_elem.text.strip()
-            print(f"Tender ID: {tender_id}")
-
-            # Check for 'Download as Zip' link
-            try:
-                download_link_elem = WebDriverWait(browser, 5).until(
-                EC.element_to_be_clickable((By.XPATH, "//a[contains(text(), 'Download as zip file')]"))
-                )
-                print("Found download link. Clicking to navigate to captcha page...")
-                download_link_elem.click()
-                time.sleep(2)  # Wait for the page to load
-
-                # Check if CAPTCHA is present (which means it didn't go straight to download)
-                is_captcha_present = False
-                try:
-                    WebDriverWait(browser, 3).until(
-                        EC.presence_of_element_located((By.ID, "captchaImage"))
-                    )
-                    is_captcha_present = True
-                    print("[🔒] CAPTCHA page detected. Proceeding to solve CAPTCHA...")
-                except:
-                    print("[🔓] CAPTCHA page not detected. Assuming download started directly.")
-                if is_captcha_present:
-                    # Now solve captcha on download page
-                    MAX_ATTEMPTS = 10
-                    attempts = 0
-
-                    while attempts < MAX_ATTEMPTS:
-                        attempts += 1
-                        print(f"[Attempt {attempts}] Solving CAPTCHA...")
-
-                        # Click the refresh button to get a new CAPTCHA
+            print(f"Processing tender {index + 1}/{total}")
+            process_tender(browser, download_dir, tender_link, existing_ids)
+        finally:
+            pool.put((browser, download_dir))
+
+    with ThreadPoolExecutor(max_workers=len(browsers)) as executor:
+        # Consume the iterator so worker exceptions surface here
+        list(executor.map(_process_one, enumerate(tender_links)))
+
+    # Let in-flight uploads finish so their records make it into the flush
+    wait_for_uploads()
+
+    # Post any records still buffered from this session
+    try:
+        flush_tender_records()
+    except Exception as e:
+        print(f"[❌] Failed to flush records to Supabase: {e}")
+
+
+def process_tender(browser, download_dir, tender_link, existing_ids=None):
+    """
+    Download a single tender's zip, upload it to S3 and record it.
+    ``existing_ids`` are already-ingested IDs from the listing lookup; if it is
+    None this tender's ID is looked up on its own.
+    """
+    try:
+        tender_id = _fetch_tender_page(browser, tender_link)
+        print(f"Tender ID: {tender_id}")
+
+        if existing_ids is None:
+            existing_ids = fetch_existing_tender_ids(tender_ids=[tender_id])
+        if tender_id in existing_ids:
+            print(f"[⏭️] Tender {tender_id} already ingested, skipping")
+            return
+
+        # Check for 'Download as Zip' link
+        zip_file_path = None
+        streamed_to_s3 = False
+        try:
+            download_link_elem = WebDriverWait(browser, 5).until(EC.element_to_be_clickable(DOWNLOAD_LINK))
+            print("Found download link. Clicking to navigate to captcha page...")
+            download_started = time.time()
+            download_link_elem.click()
+
+            # Check if CAPTCHA is present (which means it didn't go straight to download)
+            wait_for_page_change(browser, download_link_elem, timeout=5)
+            is_captcha_present = bool(browser.find_elements(*CAPTCHA_IMAGE))
+            if is_captcha_present:
+                print("[🔒] CAPTCHA page detected. Proceeding to solve CAPTCHA...")
+            else:
+                print("[🔓] CAPTCHA page not detected. Assuming download started directly.")
+            if is_captcha_present:
+                # Now solve captcha on download page
+                attempts = 0
+                previous_key = None
+                captcha_accepted = False
+
+                while attempts < MAX_CAPTCHA_ATTEMPTS:
+                    attempts += 1
+                    print(f"[Attempt {attempts}] Solving CAPTCHA...")
+
+                    # Click the refresh button to get a new CAPTCHA
+                    try:
+                        captcha_element = refresh_captcha(browser)
+                    except Exception as e:
+                        print("[!] Failed to click CAPTCHA refresh button:", e)
+                        break
+
+                    # Solve the CAPTCHA
+                    # Use improved OCR for automatic CAPTCHA solving
+                    captcha_text, confidence, captcha_key = solve_captcha(browser, captcha_element)
+                    
+                    # The same image again means the refresh has not landed yet
+                    if captcha_key and captcha_key == previous_key:
+                        print("[!] CAPTCHA image unchanged after refresh. Retrying...")
+                        time.sleep(0.2)
+                        continue
+                    previous_key = captcha_key
+                    
+                    # If OCR fails, skip this download and continue
+                    if not captcha_text or len(captcha_text.strip()) < 4:
+                        print("[⚠️] OCR failed completely, skipping download for this tender")
+                        break  # Exit the CAPTCHA retry loop, move to next tender
+
+                    print(f"[✓] CAPTCHA text: '{captcha_text}'")
+                    # Check if CAPTCHA text length is valid
+                    if len(captcha_text.strip()) != 6:
+                        print(f"[!] CAPTCHA length doesnt match to 6 ('{captcha_text}'). Retrying...")
+                        continue
+
+                    # Don't spend a server round trip on an answer OCR is unsure of
+                    if confidence < MIN_CONFIDENCE:
+                        print(f"[!] Low OCR confidence ({confidence:.2f}) for '{captcha_text}'. Retrying...")
+                        continue
+
+                    if not _submit_captcha(browser, captcha_text):
+                        print("[!] Invalid CAPTCHA detected. Retrying...")
+                        forget_captcha(captcha_key)
+                        continue
+                    print("[✓] CAPTCHA accepted.")
+                    remember_captcha(captcha_key, captcha_text)
+                    captcha_accepted = True
+                    break
+
+                if not captcha_accepted:
+                    print("[❌] CAPTCHA not solved, skipping download for this tender")
+                    record_failed_tender(tender_link, "CAPTCHA not solved")
+                    return
+
+                # Pages that start the download themselves (meta refresh or a
+                # download iframe) need no second click
+                download_started = time.time()
+                download_link_elem = None
+                if browser.find_elements(*AUTO_DOWNLOAD):
+                    print("[📥] Download started automatically after CAPTCHA")
+                else:
+                    try:
+                        download_link_elem = WebDriverWait(browser, 1).until(EC.element_to_be_clickable(DOWNLOAD_LINK))
+                    except TimeoutException:
+                        print("[📥] No second download link; assuming the download started automatically")
+
+                if download_link_elem is not None:
+                    # Fetch the zip ourselves with the browser's session cookies;
+                    # fall back to Chrome's download flow if that is not possible
+                    zip_url = download_link_elem.get_attribute("href")
+                    if zip_url and zip_url.startswith("http"):
                         try:
-                            refresh_button = WebDriverWait(browser, 5).until(
-                                EC.element_to_be_clickable((By.ID, "captcha"))
-                            )
-                            refresh_button.click()
-                            time.sleep(1)  # Allow time for new image to load
+                            if s3_enabled():
+                                # Stream into S3 with no local staging
+                                s3_url = stream_zip_to_s3(browser, zip_url, tender_id)
+                                if not s3_url:
+                                    raise Exception("upload_fileobj_to_s3 returned None")
+                                streamed_to_s3 = True
+                                print(f"[✅] Streamed zip to S3 with ID: {tender_id}")
+                                insert_tender_record(tender_id, s3_url)
+                                print(f"[💾] Queued record for Supabase DB for ID: {tender_id}")
+                            else:
+                                zip_file_path = download_zip_direct(browser, zip_url, download_dir, tender_id)
+                                print(f"[📦] Downloaded file path: {zip_file_path}")
                         except Exception as e:
-                            print("[!] Failed to click CAPTCHA refresh button:", e)
-                            break
-
-                        # Solve the CAPTCHA
-                        captcha_element = WebDriverWait(browser, 10).until(
-                            EC.presence_of_element_located((By.ID, "captchaImage")) 
-                        )
-                        # Use improved OCR for automatic CAPTCHA solving
-                        captcha_text = solve_captcha(browser, captcha_element)
-                        
-                        # If OCR fails, skip this download and continue
-                        if not captcha_text or len(captcha_text.strip()) < 4:
-                            print("[⚠️] OCR failed completely, skipping download for this tender")
-                            break  # Exit the CAPTCHA retry loop, move to next tender
-
-                        print(f"[✓] CAPTCHA text: '{captcha_text}'")
-                        # Check if CAPTCHA text length is valid
-                        if len(captcha_text.strip()) != 6:
-                            print(f"[!] CAPTCHA length doesnt match to 6 ('{captcha_text}'). Retrying...")
-                            continue
-
-                        # Fill CAPTCHA input
-                        captcha_input = browser.find_element(By.ID, "captchaText")
-                        captcha_input.clear()
-                        captcha_input.send_keys(captcha_text)
-
-                        # Click Search button
-                        search_button = browser.find_element(By.ID, "Submit")
-                        search_button.click()
-                        time.sleep(2)
-
-                        # Check for error message (instead of relying on alert)
-                        try:
-                            error_element = browser.find_element(
-                                By.XPATH, "//td[@class='td_space']//b[contains(text(), 'Invalid Captcha')]"
-                            )
-                            print("[!] Invalid CAPTCHA detected. Retrying...")
-                            continue
-                        except:
-                            print("[✓] CAPTCHA accepted.")
-                            break
-
-                    # Wait and click download button (adjust selector as needed)
-                    download_link_elem = WebDriverWait(browser, 5).until(
-                    EC.element_to_be_clickable((By.XPATH, "//a[contains(text(), 'Download as zip file')]"))
-                    )
-                    print("Found download link. Clicking to initiate download...")
-                    download_link_elem.click()
-                    print("Download initiated...")
-
-                # OPTIONAL: wait for file to appear in downloads
-                time.sleep(5)  # or use logic to confirm file is downloaded
+                            print(f"[!] Direct download failed ({e}), falling back to browser download")
+
+                    if zip_file_path is None and not streamed_to_s3 and _browser_downloads_reachable():
+                        print("Found download link. Clicking to initiate download...")
+                        download_started = time.time()
+                        download_link_elem.click()
+                        print("Download initiated...")
 
+            if zip_file_path is None and not streamed_to_s3 and not _browser_downloads_reachable():
+                print("[❌] Browser download is on the Selenium Grid node, not here; only direct downloads work with SELENIUM_HUB")
+                record_failed_tender(tender_link, "Browser download unavailable with SELENIUM_HUB")
+                return
+
+            if zip_file_path is None and not streamed_to_s3:
                 try:
-                    zip_file_path = wait_for_zip_file(download_dir)
+                    zip_file_path = wait_for_zip_file(download_dir, since=download_started)
                     print(f"[📦] Downloaded file path: {zip_file_path}")
                 except Exception as e:
                     print(f"[❌] Failed to download ZIP file: {e}")
-                    zip_file_path = None
 
-                if zip_file_path:
-                    try:
-                        s3_url = upload_to_s3(zip_file_path, tender_id)
-                        if s3_url:
-                            print(f"[✅] Uploaded {zip_file_path} to S3 with ID: {tender_id}")
-                        else:
-                            raise Exception("upload_to_s3 returned None")
-                    except Exception as e:
-                        print(f"[❌] Failed to upload ZIP to S3: {e}")
-                        s3_url = None
+            if zip_file_path:
+                # Upload in the background; the record is saved once it lands
+                future = upload_to_s3_async(zip_file_path, tender_id)
+                future.add_done_callback(_record_upload(zip_file_path, tender_id))
 
-                    if s3_url:
-                        try:
-                            insert_tender_record(tender_id, s3_url)
-                            print(f"[💾] Saved record to Supabase DB for ID: {tender_id}")
-                        except Exception as e:
-                            print(f"[❌] Failed to insert record into Supabase: {e}")
 
+        except Exception as e:
+            print(f"No 'Download as Zip' link found or captcha solving failed: {e}")
+            record_failed_tender(tender_link, e)
+
+    except Exception as e:
+        print(f"Error processing tender at {tender_link}: {e}")
+        record_failed_tender(tender_link, e)
+
+
+@retry(exceptions=TRANSIENT_ERRORS)
+def _load_page(browser, url):
+    """Navigate to a page; only the load itself is retried"""
+    browser.get(url)
+
+
+def _fetch_tender_page(browser, tender_link):
+    """Load a tender page and return its tender ID"""
+    _load_page(browser, tender_link)
+
+    # Read the tender ID in one script call (browser.get has already
+    # waited for the page load); fall back to the absolute path
+    tender_id = (browser.execute_script(TENDER_ID_SCRIPT) or "").strip()
+    if not tender_id:
+        tender_id_elem = WebDriverWait(browser, 10).until(EC.presence_of_element_located(TENDER_ID_LOCATOR))
+        tender_id = tender_id_elem.text.strip()
+    return tender_id
 
-            except Exception as e:
-                print(f"No 'Download as Zip' link found or captcha solving failed: {e}")
 
-            
+def _submit_captcha(browser, captcha_text):
+    """
+    Fill in and submit a CAPTCHA answer; True if the portal accepted it.
+    Not retried: after the click the answer is spent, so a failure goes back
+    to the caller's CAPTCHA loop for a fresh image
+    """
+    # Fill CAPTCHA input
+    captcha_input = browser.find_element(*CAPTCHA_INPUT)
+    captcha_input.clear()
+    captcha_input.send_keys(captcha_text)
 
-            # Close tab
-            browser.close()
-            browser.switch_to.window(original_window)
+    # Click Search button
+    search_button = browser.find_element(*SUBMIT_BUTTON)
+    search_button.click()
+    wait_for_page_change(browser, search_button)
 
+    # Check for error message (instead of relying on alert)
+    return not browser.find_elements(*INVALID_CAPTCHA)
+
+
+def _record_upload(zip_file_path, tender_id):
+    """Build the done-callback that records a finished S3 upload"""
+    def _callback(future):
+        try:
+            s3_url = future.result()
+            if not s3_url:
+                raise Exception("upload_to_s3 returned None")
+            print(f"[✅] Uploaded {zip_file_path} to S3 with ID: {tender_id}")
+        except Exception as e:
+            print(f"[❌] Failed to upload ZIP to S3: {e}")
+            return
+
+        try:
+            insert_tender_record(tender_id, s3_url)
+            print(f"[💾] Queued record for Supabase DB for ID: {tender_id}")
         except Exception as e:
-            print(f"Error processing tender at {tender_link}: {e}")
-            # Close tab and return to main window
-            if len(browser.window_handles) > 1:
-                browser.close()
-                browser.switch_to.window(original_window)
+            print(f"[❌] Failed to insert record into Supabase: {e}")
 
+    return _callback
 
 
-def wait_for_zip_file(download_dir, timeout=30):
-    print("[⏳] Waiting for zip file to appear in downloads...")
+def _session_for(browser):
+    """This worker's HTTP session, carrying the browser's cookies and user agent"""
+    session = _get_http_session()
+    session.cookies.clear()
+    for cookie in browser.get_cookies():
+        session.cookies.set(cookie["name"], cookie["value"],
+                            domain=cookie.get("domain"), path=cookie.get("path", "/"))
+    session.headers["User-Agent"] = browser.execute_script("return navigator.userAgent;")
+    return session
+
+
+def _browser_downloads_reachable():
+    """
+    Chrome saves downloads on the machine it runs on. With a Selenium Grid
+    (SELENIUM_HUB) that is the grid node, so wait_for_zip_file can never see
+    the zip and only the direct-download path works.
+    """
+    return not os.getenv("SELENIUM_HUB")
+
+
+def stream_zip_to_s3(browser, zip_url, tender_id, timeout=60):
+    """
+    Pipe a tender zip from the portal straight into S3 without touching
+    local disk. Returns the S3 URL, or None if the upload failed.
+    """
+    session = _session_for(browser)
+    with session.get(zip_url, stream=True, timeout=timeout) as response:
+        response.raise_for_status()
+        response.raw.decode_content = True
+        return upload_fileobj_to_s3(response.raw, tender_id)
+
+
+def download_zip_direct(browser, zip_url, download_dir, tender_id, timeout=60):
+    """
+    Stream a tender zip over HTTP using the browser's session cookies.
+    Completion is known from Content-Length, so there is no need to poll the
+    download directory. Returns the path of the written file.
+    """
+    session = _session_for(browser)
+
+    zip_path = os.path.join(download_dir, f"{tender_id.replace('/', '_')}.zip")
+    with session.get(zip_url, stream=True, timeout=timeout) as response:
+        response.raise_for_status()
+        expected_size = int(response.headers.get("Content-Length", 0))
+        written = 0
+        with open(zip_path, "wb") as f:
+            for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                f.write(chunk)
+                written += len(chunk)
+
+    if expected_size and written != expected_size:
+        os.remove(zip_path)
+        raise IOError(f"Incomplete download: {written}/{expected_size} bytes")
+    return zip_path
+
+
+def wait_for_page_change(browser, element, timeout=10):
+    """
+    Wait until ``element`` is detached, i.e. the click that preceded this call
+    has navigated away. Returns False if the page did not change in time.
+    """
+    try:
+        WebDriverWait(browser, timeout).until(EC.staleness_of(element))
+        return True
+    except TimeoutException:
+        return False
+
+
+def _latest_zip(download_dir, since=None):
+    """Newest .zip in download_dir (created at or after ``since``), or None"""
+    latest_path, latest_ctime = None, None
+    with os.scandir(download_dir) as entries:
+        for entry in entries:
+            if not entry.name.endswith(".zip"):
+                continue
+            ctime = entry.stat().st_ctime
+            if since is not None and ctime < since:
+                continue
+            if latest_ctime is None or ctime > latest_ctime:
+                latest_path, latest_ctime = entry.path, ctime
+    return latest_path
+
+
+def _poll_for_zip_file(download_dir, timeout, since):
     end_time = time.time() + timeout
     while time.time() < end_time:
-        files = [f for f in os.listdir(download_dir) if f.endswith(".zip")]
-        if files:
-            latest_file = max(files, key=lambda f: os.path.getctime(os.path.join(download_dir, f)))
-            return os.path.join(download_dir, latest_file)
+        zip_path = _latest_zip(download_dir, since)
+        if zip_path:
+            return zip_path
         time.sleep(1)
     raise TimeoutError("ZIP file not downloaded within the timeout.")
+
+
+def wait_for_zip_file(download_dir, timeout=30, since=None):
+    """
+    Wait for Chrome to finish a .zip download in ``download_dir``.
+
+    Uses filesystem events (inotify/FSEvents via watchdog) so the file is
+    picked up the moment Chrome renames its .crdownload file; falls back to
+    polling when watchdog is not installed. ``since`` ignores zips created
+    before the download was started.
+    """
+    print("[⏳] Waiting for zip file to appear in downloads...")
+    if Observer is None:
+        return _poll_for_zip_file(download_dir, timeout, since)
+
+    finished = threading.Event()
+    result = {}
+
+    class _ZipHandler(PatternMatchingEventHandler):
+        def on_created(self, event):
+            self._found(event.src_path)
+
+        def on_moved(self, event):
+            self._found(event.dest_path)
+
+        def _found(self, path):
+            if path.endswith(".zip"):
+                result["path"] = path
+                finished.set()
+
+    observer = Observer()
+    observer.schedule(_ZipHandler(patterns=["*.zip"], ignore_directories=True), download_dir)
+    observer.start()
+    try:
+        # The download may have completed before the observer was watching
+        zip_path = _latest_zip(download_dir, since)
+        if zip_path:
+            return zip_path
+        if not finished.wait(timeout):
+            raise TimeoutError("ZIP file not downloaded within the timeout.")
+        return result["path"]
+    finally:
+        observer.stop()
+        observer.join()
@@ -0,0 +1,65 @@
+import functools
+import json
+import os
+import threading
+import time
+
+# Tenders that still failed after all retries, for a follow-up run to resume
+FAILED_TENDERS_PATH = os.path.join(os.getcwd(), "failed_tenders.json")
+_failed_lock = threading.Lock()
+
+def retry(*, exceptions, attempts=3, base=1.0):
+    """
+    Retry the wrapped call on ``exceptions`` with exponential backoff
+    (base, 2*base, 4*base, ... seconds). The last failure is re-raised.
+    ``exceptions`` has no default: name the transient errors explicitly, and
+    only wrap steps that are safe to repeat.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            for attempt in range(1, attempts + 1):
+                try:
+                    return func(*args, **kwargs)
+                except exceptions as e:
+                    if attempt == attempts:
+                        raise
+                    delay = base * (2 ** (attempt - 1))
+                    print(f"[↻] {func.__name__} failed ({e}); retry {attempt}/{attempts - 1} in {delay:.0f}s")
+                    time.sleep(delay)
+        return wrapper
+    return decorator
+
+def record_failed_tender(tender_link, error):
+    """Append a tender that could not be processed to FAILED_TENDERS_PATH"""
+    with _failed_lock:
+        failed = []
+        if os.path.exists(FAILED_TENDERS_PATH):
+            try:
+                with open(FAILED_TENDERS_PATH) as f:
+                    failed = json.load(f)
+            except (OSError, ValueError):
+                failed = []
+        failed.append({
+            "url": tender_link,
+            "error": str(error),
+            "failed_at": time.strftime("%Y-%m-%dT%H:%M:%S")
+        })
+        with open(FAILED_TENDERS_PATH, "w") as f:
+            json.dump(failed, f, indent=2)
+
+def take_failed_tenders():
+    """
+    Return the tender links recorded by a previous run and clear the file;
+    links that fail again are re-recorded by this run.
+    """
+    with _failed_lock:
+        if not os.path.exists(FAILED_TENDERS_PATH):
+            return []
+        try:
+            with open(FAILED_TENDERS_PATH) as f:
+                links = [entry["url"] for entry in json.load(f)]
+        except (OSError, ValueError, KeyError):
+            links = []
+        os.remove(FAILED_TENDERS_PATH)
+        return links
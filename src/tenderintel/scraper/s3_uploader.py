@@ -1,6 +1,12 @@
 import boto3
 import os
-from botocore.exceptions import NoCredentialsError
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
+from botocore.exceptions import ConnectionClosedError, EndpointConnectionError, NoCredentialsError
+from .retry import retry
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -9,19 +15,58 @@ AWS_ACCESS_KEY = os.getenv("AWS_ACCESS_KEY")
 AWS_SECRET_KEY = os.getenv("AWS_SECRET_KEY")
 BUCKET_NAME = os.getenv("S3_BUCKET")
 
+# Small zips go up as a single PUT; large ones in parallel 8 MB parts
+MB = 1024 * 1024
+TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=16 * MB,
+    multipart_chunksize=8 * MB,
+    max_concurrency=10,
+    use_threads=True
+)
+
 # Initialize S3 client only if credentials are available
 s3 = None
 if AWS_ACCESS_KEY and AWS_SECRET_KEY:
     try:
         s3 = boto3.client('s3',
                           aws_access_key_id=AWS_ACCESS_KEY,
-                          aws_secret_access_key=AWS_SECRET_KEY)
+                          aws_secret_access_key=AWS_SECRET_KEY,
+                          # Room for concurrent parts across background uploads
+                          config=Config(max_pool_connections=32))
         print("✅ AWS S3 client initialized")
     except Exception as e:
         print(f"⚠️ Failed to initialize S3 client: {e}")
 else:
     print("⚠️ AWS credentials not found in .env - S3 upload features disabled")
 
+def s3_enabled():
+    """True when S3 credentials and a bucket are configured"""
+    return bool(s3 and BUCKET_NAME)
+
+def upload_fileobj_to_s3(fileobj, tender_id):
+    """Upload a file-like object (e.g. an HTTP response body) to S3 in
+    multipart chunks, without staging it on disk"""
+    if not s3_enabled():
+        print("⚠️ S3 not configured - skipping file upload")
+        return None
+
+    file_name = f"{tender_id}.zip"
+    try:
+        s3.upload_fileobj(fileobj, BUCKET_NAME, file_name, Config=TRANSFER_CONFIG)
+        s3_url = f"https://{BUCKET_NAME}.s3.amazonaws.com/{file_name}"
+        print(f"✅ Uploaded to S3: {s3_url}")
+        return s3_url
+    except NoCredentialsError:
+        print("❌ AWS credentials not available")
+        return None
+    except Exception as e:
+        print(f"❌ S3 upload error: {e}")
+        return None
+
+@retry(exceptions=(EndpointConnectionError, ConnectionClosedError))
+def _put_file(file_path, file_name):
+    s3.upload_file(file_path, BUCKET_NAME, file_name, Config=TRANSFER_CONFIG)
+
 def upload_to_s3(file_path, tender_id):
     """Upload file to S3 (optional - requires .env configuration)"""
     if not s3 or not BUCKET_NAME:
@@ -30,7 +75,7 @@ def upload_to_s3(file_path, tender_id):
         
     file_name = f"{tender_id}.zip"
     try:
-        s3.upload_file(file_path, BUCKET_NAME, file_name)
+        _put_file(file_path, file_name)
         s3_url = f"https://{BUCKET_NAME}.s3.amazonaws.com/{file_name}"
         print(f"✅ Uploaded to S3: {s3_url}")
         return s3_url
@@ -43,3 +88,34 @@ def upload_to_s3(file_path, tender_id):
     except Exception as e:
         print(f"❌ S3 upload error: {e}")
         return None
+
+
+# Background uploads let the scraper move on to the next tender while the
+# previous zip is still in flight
+MAX_PENDING_UPLOADS = 16
+_upload_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix="s3-upload")
+_pending = deque()
+_pending_lock = threading.Lock()
+
+def upload_to_s3_async(file_path, tender_id):
+    """
+    Queue an upload on the background pool and return its Future (resolving
+    to the S3 URL or None). Blocks on the oldest upload once more than
+    MAX_PENDING_UPLOADS are outstanding.
+    """
+    future = _upload_pool.submit(upload_to_s3, file_path, tender_id)
+
+    with _pending_lock:
+        _pending.append(future)
+        oldest = _pending.popleft() if len(_pending) > MAX_PENDING_UPLOADS else None
+
+    if oldest is not None:
+        oldest.result()
+    return future
+
+def wait_for_uploads():
+    """Block until every queued upload has finished"""
+    with _pending_lock:
+        futures = list(_pending)
+        _pending.clear()
+    wait(futures)
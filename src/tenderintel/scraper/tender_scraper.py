@@ -1,5 +1,7 @@
+import re
 import time
 import os
+from concurrent.futures import ThreadPoolExecutor
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
@@ -10,36 +12,100 @@ from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import Select
-from .captcha_solver import solve_captcha
+from .captcha_solver import MIN_CONFIDENCE, refresh_captcha, solve_captcha
+from .captcha_cache import forget_captcha, remember_captcha
 from selenium.common.exceptions import NoAlertPresentException
 
 from urllib.parse import urljoin
-from .downloader import process_tenders
-
-def initialize_browser():
+from .downloader import MAX_CAPTCHA_ATTEMPTS, process_tenders, wait_for_page_change
+from .db import start_flusher, stop_flusher
+from .retry import take_failed_tenders
+
+# Hosts serving tender pages and CAPTCHA images
+PORTAL_HOSTS = ("etenders.gov.in", "eprocure.gov.in")
+
+# Third-party trackers and decorative assets blocked in every browser. Image
+# extensions are not blocked wholesale so the CAPTCHA image keeps loading.
+BLOCKED_URL_PATTERNS = [
+    "*google-analytics.com*",
+    "*googletagmanager.com*",
+    "*doubleclick.net*",
+    "*banner*",
+]
+
+# Number of browsers processing tenders in parallel
+POOL_SIZE = int(os.getenv("TENDERINTEL_SCRAPER_WORKERS", "4"))
+
+# Persistent Chrome profiles keep session cookies and the HTTP cache between
+# runs; each worker needs its own because Chrome locks a profile in use
+PROFILE_ROOT = os.path.expanduser(os.getenv("TENDERINTEL_CHROME_PROFILES", "~/.tenderintel"))
+DISK_CACHE_SIZE = 100 * 1024 * 1024
+
+def initialize_browser(download_dir=None, worker_id=0):
     chrome_options = Options()
     #chrome_options.add_argument("--headless")  # Optional: run in headless mode
     chrome_options.add_argument("--disable-gpu")
     chrome_options.add_argument("--no-sandbox")
+    chrome_options.add_argument(f"--user-data-dir={os.path.join(PROFILE_ROOT, f'chrome-profile-{worker_id}')}")
+    chrome_options.add_argument(f"--disk-cache-size={DISK_CACHE_SIZE}")
     
     # Set up download directory
-    download_dir = os.path.join(os.getcwd(), "downloads")
+    if download_dir is None:
+        download_dir = os.path.join(os.getcwd(), "downloads")
     os.makedirs(download_dir, exist_ok=True)
 
     prefs = {
         "download.default_directory": download_dir,
         "download.prompt_for_download": False,
         "download.directory_upgrade": True,
-        "safebrowsing.enabled": True
+        "safebrowsing.enabled": True,
+        # The scraper only reads the tender tables and the CAPTCHA image, so
+        # skip fetching and rendering everything else
+        "profile.managed_default_content_settings.images": 2,
+        "profile.managed_default_content_settings.stylesheets": 2,
+        "profile.managed_default_content_settings.fonts": 2,
+        "profile.managed_default_content_settings.plugins": 2,
+        "profile.managed_default_content_settings.popups": 2,
+        # Keep images from the portals themselves so the CAPTCHA still renders
+        "profile.content_settings.exceptions.images": {
+            f"[*.]{host},*": {"setting": 1} for host in PORTAL_HOSTS
+        }
     }
     chrome_options.add_experimental_option("prefs", prefs)
 
-    # Correct way to use ChromeDriverManager with Service
-    service = Service(ChromeDriverManager().install())
-    browser = webdriver.Chrome(service=service, options=chrome_options)
+    selenium_hub = os.getenv("SELENIUM_HUB")
+    if selenium_hub:
+        # Long-running Selenium Grid: no driver install or local Chrome start
+        browser = webdriver.Remote(command_executor=selenium_hub, options=chrome_options)
+    else:
+        # Use a preinstalled driver if given, otherwise let ChromeDriverManager
+        # resolve it (cached under ~/.wdm after the first run)
+        driver_path = os.getenv("CHROMEDRIVER_PATH") or ChromeDriverManager().install()
+        service = Service(driver_path)
+        browser = webdriver.Chrome(service=service, options=chrome_options)
+
+    # Drop analytics beacons and banners at the network layer; this also
+    # covers script-initiated requests that the content prefs do not
+    try:
+        browser.execute_cdp_cmd("Network.enable", {})
+        browser.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+        browser.execute_cdp_cmd("Network.setCacheDisabled", {"cacheDisabled": False})
+    except Exception as e:
+        print(f"[!] Could not enable request blocking: {e}")
 
     return browser
 
+def initialize_browser_pool(size=POOL_SIZE):
+    """
+    Start ``size`` browsers, each with its own download directory.
+    Returns a list of (browser, download_dir) pairs for process_tenders.
+    """
+    workers = []
+    for i in range(size):
+        download_dir = os.path.join(os.getcwd(), "downloads", f"worker_{i}")
+        workers.append((initialize_browser(download_dir, worker_id=i), download_dir))
+    return workers
+
 def open_website(browser):
     url = "https://etenders.gov.in/eprocure/app"
     browser.get(url)
@@ -61,30 +127,30 @@ def search_open_tenders(browser):
         select = Select(tender_type_dropdown)
         select.select_by_visible_text("Open Tender")
 
-        MAX_ATTEMPTS = 10
         attempts = 0
+        previous_key = None
 
-        while attempts < MAX_ATTEMPTS:
+        while attempts < MAX_CAPTCHA_ATTEMPTS:
             attempts += 1
             print(f"[Attempt {attempts}] Solving CAPTCHA...")
 
             # Click the refresh button to get a new CAPTCHA
             try:
-                refresh_button = WebDriverWait(browser, 5).until(
-                    EC.element_to_be_clickable((By.ID, "captcha"))
-                )
-                refresh_button.click()
-                time.sleep(1)  # Allow time for new image to load
+                captcha_element = refresh_captcha(browser)
             except Exception as e:
                 print("[!] Failed to click CAPTCHA refresh button:", e)
                 break
 
             # Solve the CAPTCHA
-            captcha_element = WebDriverWait(browser, 10).until(
-                EC.presence_of_element_located((By.ID, "captchaImage")) 
-            )
             # Use improved OCR with multiple strategies (no manual fallback)
-            captcha_text = solve_captcha(browser, captcha_element)
+            captcha_text, confidence, captcha_key = solve_captcha(browser, captcha_element)
+            
+            # The same image again means the refresh has not landed yet
+            if captcha_key and captcha_key == previous_key:
+                print("[!] CAPTCHA image unchanged after refresh. Retrying...")
+                time.sleep(0.2)
+                continue
+            previous_key = captcha_key
             
             # If OCR completely fails, try refreshing CAPTCHA and retry
             if not captcha_text or len(captcha_text.strip()) < 4:
@@ -97,6 +163,11 @@ def search_open_tenders(browser):
                 print(f"[!] CAPTCHA too short ('{captcha_text}'). Retrying...")
                 continue
 
+            # Don't spend a server round trip on an answer OCR is unsure of
+            if confidence < MIN_CONFIDENCE:
+                print(f"[!] Low OCR confidence ({confidence:.2f}) for '{captcha_text}'. Retrying...")
+                continue
+
             # Fill CAPTCHA input
             captcha_input = browser.find_element(By.ID, "captchaText")
             captcha_input.clear()
@@ -105,18 +176,18 @@ def search_open_tenders(browser):
             # Click Search button
             search_button = browser.find_element(By.ID, "submit")
             search_button.click()
-            time.sleep(2)
+            wait_for_page_change(browser, search_button)
 
             # Check for error message (instead of relying on alert)
-            try:
-                error_element = browser.find_element(
-                    By.XPATH, "//td[@class='alerttext']//b[contains(text(),'Invalid Captcha')]"
-                )
+            if browser.find_elements(
+                By.XPATH, "//td[@class='alerttext']//b[contains(text(),'Invalid Captcha')]"
+            ):
                 print("[!] Invalid CAPTCHA detected. Retrying...")
+                forget_captcha(captcha_key)
                 continue
-            except:
-                print("[✓] CAPTCHA accepted.")
-                break
+            print("[✓] CAPTCHA accepted.")
+            remember_captcha(captcha_key, captcha_text)
+            break
 
 
         
@@ -126,13 +197,30 @@ def search_open_tenders(browser):
         print(f"Error during search: {e}")
 
 
+# Collects the href and cell text of all tender detail links on a results
+# page; the cell reads "[Title] [Ref.No.] [Tender ID]"
+TENDER_LINKS_SCRIPT = """
+return Array.from(
+    document.querySelectorAll("td > a[title*='View Tender Information']")
+).map(a => [a.href, a.parentElement.innerText]);
+"""
+
+# Last bracketed value of a results cell
+LISTING_TENDER_ID = re.compile(r"\[([^\[\]]+)\]\s*$")
+
+def listing_tender_id(cell_text):
+    """Tender ID from a results cell's text, or None if it is not shown"""
+    match = LISTING_TENDER_ID.search(cell_text or "")
+    return match.group(1).strip() if match else None
+
 def extract_all_tender_links(browser):
     """
     Extracts all tender detail links from paginated results.
-    Returns a list of full tender URLs.
+    Returns the full tender URLs and the tender IDs shown next to them.
     """
     base_url = "https://eprocure.gov.in"
     tender_links = []
+    tender_ids = []
     MAX_PAGES = 1 # Set to 1 for testing; change to a higher number for full scraping
     current_page = 0
 
@@ -143,15 +231,16 @@ def extract_all_tender_links(browser):
                 EC.presence_of_element_located((By.XPATH, "//td/a[contains(@title, 'View Tender Information')]"))
             )
 
-            # Get all anchor tags inside <td> with matching title
-            link_elements = browser.find_elements(By.XPATH, "//td/a[contains(@title, 'View Tender Information')]")
+            # Read every matching href in one script call rather than one
+            # WebDriver round trip per link; .href is already absolute
+            rows = browser.execute_script(TENDER_LINKS_SCRIPT)
+            for href, cell_text in rows:
+                tender_links.append(urljoin(base_url, href))
+                tender_id = listing_tender_id(cell_text)
+                if tender_id:
+                    tender_ids.append(tender_id)
 
-            for link in link_elements:
-                relative_href = link.get_attribute("href")
-                full_url = urljoin(base_url, relative_href)
-                tender_links.append(full_url)
-
-            print(f"[Page {current_page}] Found {len(link_elements)} links.")
+            print(f"[Page {current_page}] Found {len(rows)} links.")
 
             if current_page == MAX_PAGES:
                 break  # Stop if we've reached max allowed pages
@@ -162,10 +251,8 @@ def extract_all_tender_links(browser):
                 break
 
             next_button.click()
-            #next_page = current_page + 1
-            #WebDriverWait(browser, 10).until(
-            #EC.text_to_be_present_in_element((By.XPATH, '//*[@id="informal_19"]/b'), str(next_page)))
-            time.sleep(2)  # Wait for the next page to load
+            # Wait for the next page to replace the current results
+            wait_for_page_change(browser, next_button)
 
 
             current_page += 1
@@ -174,21 +261,33 @@ def extract_all_tender_links(browser):
             print(f"No more pages or error: {e}")
             break
 
-    return tender_links
+    return tender_links, tender_ids
 
 
-def main_function():
-    # Initialize the browser
-    browser = initialize_browser()
-
-    # Open the website
+def start_session(browser):
+    """Open the portal and run the tender search so the browser holds a session"""
     open_website(browser)
-
-    # Search for open tenders
     search_open_tenders(browser)
 
-    # Extract all tender links
-    #tender_links = extract_all_tender_links(browser)
+def start_sessions(workers):
+    """
+    Establish a portal session in every browser of the pool, in parallel.
+    Tender links are only valid within a session, and each browser has its own
+    profile and cookies, so every worker has to search for itself.
+    """
+    with ThreadPoolExecutor(max_workers=len(workers)) as executor:
+        # Consume the iterator so setup exceptions surface here
+        list(executor.map(start_session, [browser for browser, _ in workers]))
+
+
+def main_function():
+    # Initialize the browser pool and give every browser its own session
+    workers = initialize_browser_pool()
+    start_sessions(workers)
+
+    # Fixed test links; extract_all_tender_links(workers[0][0]) returns the
+    # links and listing tender IDs for a full run
+    tender_ids = None
     tender_links = [
     "https://etenders.gov.in/eprocure/app?component=%24DirectLink_0&page=FrontEndAdvancedSearchResult&service=direct&session=T&sp=SJF6CyWn8RggyMYtNn0%2BHhw%3D%3D",
     "https://etenders.gov.in/eprocure/app?component=%24DirectLink_0&page=FrontEndAdvancedSearchResult&service=direct&session=T&sp=SBxt1NZPECd9xxZB8ZLBoZw%3D%3D",
@@ -196,15 +295,25 @@ def main_function():
     "https://etenders.gov.in/eprocure/app?component=%24DirectLink_0&page=FrontEndAdvancedSearchResult&service=direct&session=T&sp=SWrhuhHbz4IM55Ys06%2FezHQ%3D%3D"
     ]
 
+    # Resume tenders that failed in the previous run
+    for link in take_failed_tenders():
+        if link not in tender_links:
+            tender_links.append(link)
+
     print(f"\nTotal tenders found: {len(tender_links)}")
     for i, link in enumerate(tender_links, start=1):
         print(f"{i}. {link}")
 
-    # Process the tenders
-    process_tenders(browser, tender_links)
+    # Process the tenders, posting Supabase records in the background
+    start_flusher()
+    try:
+        process_tenders(workers, tender_links, tender_ids)
+    finally:
+        stop_flusher()
 
     input("Press Enter to close browser...")
-    browser.quit()
+    for worker_browser, _ in workers:
+        worker_browser.quit()
 
 if __name__ == "__main__":
     main_function()
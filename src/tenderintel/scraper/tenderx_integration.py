@@ -13,80 +13,338 @@ Integration Architecture:
 
 import sys
 import os
+import itertools
 import json
+import logging
 import sqlite3
+import string
+import time
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import asdict, dataclass, field, fields
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from functools import lru_cache
+from typing import List, Dict, Any, FrozenSet, Optional, Union
 from pathlib import Path
 
-# Add TenderX backend to path for imports
-sys.path.append(os.path.join(os.path.dirname(__file__), "../tenderX/backend"))
-sys.path.append(os.path.join(os.path.dirname(__file__), "../tenderX/backend/scraper"))
+import ahocorasick
 
 # Import our enhanced search capabilities
 from ..search.synonym_manager import SynonymManager
 
+logger = logging.getLogger(__name__)
+
+# FTS5 insert query matching actual schema; value range and department type
+# are the same for every scraped tender, so they are literals, not parameters
+INSERT_TENDER_SQL = """
+INSERT INTO tenders (
+    tender_id, title, org, status, aoc_date, url,
+    service_category, value_range, region, 
+    department_type, complexity, keywords
+) VALUES (?, ?, ?, ?, ?, ?, ?, '5_to_25_lakh', ?, 'central', ?, ?)
+"""
+
+# Applied once when the adapter's connection is opened
+CONNECTION_PRAGMAS = """
+PRAGMA journal_mode=WAL;
+PRAGMA synchronous=NORMAL;
+PRAGMA temp_store=MEMORY;
+PRAGMA cache_size=-65536;
+"""
+
+# FTS5 tables cannot carry a UNIQUE index, so a batch looks up which of its
+# IDs are already saved before inserting. Every ingest path writes tenders
+# directly, so the table itself is the only reliable record of saved IDs.
+# One lookup covers up to SAVED_IDS_CHUNK IDs (SQLite allows 999 parameters
+# on older builds)
+SAVED_IDS_CHUNK = 500
+SAVED_IDS_SQL = "SELECT tender_id FROM tenders WHERE tender_id IN ({placeholders})"
+
+# Canonical service categories: (category_id, display name, competitor firms,
+# keywords). Firms are based on our service umbrellas.
+SERVICE_CATEGORIES = (
+    ("cloud_ai_ml", "Cloud AI/ML",
+     ("Cyfuture Cloud", "Softlabs Group", "fxis.ai", "DataToBiz", "Talentica Software",
+      "Quytech", "Rapyder", "Amazon AWS", "Microsoft Azure", "AWS", "Azure"),
+     ("machine learning", "artificial intelligence", "ml platform", "ai platform", "deep learning", "neural network")),
+    ("compute_hardware", "Compute & Hardware",
+     ("Intel India", "Acer", "Dell", "Arrow Electronics", "Tonbo Imaging"),
+     ("server", "hardware", "compute", "processor", "workstation", "blade server")),
+    ("application_integration", "Application & Integration",
+     ("Cognizant", "Infosys", "Wipro", "HCL Technologies", "Tata Consultancy Services",
+      "TCS", "Capgemini", "NTT DATA", "Deloitte"),
+     ("application development", "system integration", "software development", "api integration")),
+    ("storage_backup", "Storage & Backup", (),
+     ("storage", "backup", "data protection", "archive", "disaster recovery")),
+    ("security_compliance", "Security & Compliance",
+     ("Tech Mahindra", "Secure Network Solutions", "ControlCase", "TUV India", "Sattrix", "IBM Security"),
+     ("security", "firewall", "cybersecurity", "compliance", "audit", "vulnerability")),
+    ("cloud_management", "Cloud Management",
+     ("AWS", "Azure", "Tata Communications", "Datacipher", "Aspire Systems", "Microland"),
+     ("cloud management", "devops", "orchestration", "automation", "monitoring")),
+    ("networking_connectivity", "Networking & Connectivity",
+     ("Cisco", "Tata Communications", "Reliance Jio", "Vodafone Idea", "BSNL", "TCS",
+      "Wipro", "IBM", "HCL", "L&T"),
+     ("network", "connectivity", "router", "switch", "wifi", "broadband")),
+    ("data_analytics", "Data & Analytics",
+     ("Wipro", "HCL Technologies", "Mu Sigma", "SG Analytics", "Accenture", "TCS",
+      "Infosys", "Fractal Analytics"),
+     ("data analytics", "business intelligence", "data warehouse", "big data", "analytics")),
+    ("database_services", "Database Services", (),
+     ("database", "mysql", "postgresql", "nosql", "database management")),
+    ("identity_access", "Identity & Access Management", (),
+     ("identity", "access management", "authentication", "authorization", "iam")),
+    ("business_systems", "Business Systems & Software", (),
+     ("erp", "crm", "business software", "enterprise software")),
+    ("communication_messaging", "Communication & Messaging", (),
+     ("communication", "messaging", "email", "collaboration")),
+    ("data_center", "Data Center & Infrastructure", (),
+     ("data center", "infrastructure", "colocation", "hosting")),
+    ("it_service_management", "IT Service Management", (),
+     ("itsm", "service management", "helpdesk", "it support")),
+    ("iot_automation", "IoT & Automation", (),
+     ("iot", "automation", "smart devices", "sensors", "industrial automation")),
+)
+
+# Subcategories, checked in this order
+SUBCATEGORY_KEYWORDS = (
+    ("Networking Infrastructure", ("local area network", "lan", "ethernet", "switch")),
+    ("API & Integration", ("api", "application programming interface", "rest")),
+    ("Security Solutions", ("security", "firewall", "cybersecurity")),
+    ("Cloud Services", ("cloud", "aws", "azure")),
+)
+
+# Basic region mapping
+REGION_KEYWORDS = (
+    ("Delhi", ("delhi", "new delhi", "nd")),
+    ("Maharashtra", ("maharashtra", "mumbai", "pune")),
+    ("Karnataka", ("karnataka", "bangalore", "bengaluru")),
+    ("Tamil Nadu", ("tamil nadu", "chennai")),
+    ("Uttar Pradesh", ("uttar pradesh", "lucknow", "noida")),
+    ("Gujarat", ("gujarat", "ahmedabad")),
+    ("West Bengal", ("west bengal", "kolkata")),
+    ("Rajasthan", ("rajasthan", "jaipur")),
+    ("National", ("india", "national", "central", "ministry")),
+)
+
+# Technology stack keywords
+TECH_KEYWORDS = (
+    ("Cloud", ("aws", "azure", "google cloud", "cloud platform")),
+    ("Database", ("mysql", "postgresql", "oracle", "sql server", "mongodb")),
+    ("Programming", ("java", "python", ".net", "nodejs", "php")),
+    ("Infrastructure", ("kubernetes", "docker", "linux", "windows server")),
+    ("Security", ("ssl", "encryption", "firewall", "antivirus")),
+    ("Networking", ("cisco", "juniper", "router", "switch", "wifi")),
+)
+
+# Complexity indicators by level, in priority order
+COMPLEXITY_INDICATORS = (
+    ("High", ("enterprise", "nationwide", "pan india", "multi-state", "complex", "advanced")),
+    ("Medium", ("state-wide", "regional", "integration", "deployment", "implementation")),
+    ("Low", ("maintenance", "support", "basic", "simple", "routine")),
+)
+
+# Punctuation that occurs inside keywords (".net", "l&t", "multi-state"); it is
+# kept inside words and only stripped from the edges of title words. Keywords
+# with it on an edge are matched as phrases instead, so ".net" never matches
+# the word "net"
+KEYWORD_PUNCTUATION = ".&-"
+
+# Lowercases ASCII letters and turns all other punctuation into spaces in one
+# str.translate pass
+_NORMALIZE_TABLE = str.maketrans({
+    **{c: " " for c in string.punctuation if c not in KEYWORD_PUNCTUATION},
+    **{c: c.lower() for c in string.ascii_uppercase}
+})
+
+def normalize_text(text: str) -> str:
+    """Lowercase text and replace punctuation with spaces for keyword matching"""
+    return text.translate(_NORMALIZE_TABLE)
+
+# Title _extract_tender_metadata_from_link uses until real page extraction lands
+PLACEHOLDER_TITLE = "Sample Network Infrastructure Tender"
+
+# Treat placeholder titles like missing ones and skip the detectors (off by
+# default so integration runs still exercise the full path)
+SKIP_PLACEHOLDER_TITLES = os.getenv("TENDERINTEL_SKIP_PLACEHOLDER_TITLES", "").lower() in ("1", "true", "yes")
+
+# Batches at least this large are enhanced in a process pool
+PARALLEL_ENHANCE_THRESHOLD = 5000
+
+# Common English words that carry no procurement meaning; never expanded
+STOPWORDS = frozenset(
+    "a an and are as at be by for from has he in is it its of on that the to was were will with".split()
+)
+
+# Slotted records on Python 3.10+, where dataclass supports it
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_SLOTS)
+class EnhancedTender:
+    """
+    Tender record with our intelligent enhancements applied
+    
+    Defaults match what save_enhanced_tender stores for missing values;
+    tender_id and published_date are filled in at save time when None.
+    """
+    tender_id: Optional[str] = None
+    title: str = "Unknown Title"
+    organization: str = "Unknown Organization"
+    department: Optional[str] = None
+    tender_value: Optional[float] = None
+    status: str = "Published AOC"
+    published_date: Optional[str] = None
+    closing_date: Optional[str] = None
+    tender_url: str = ""
+    source: str = "CPPP"
+    scraped_at: Optional[str] = None
+    
+    # Our enhancements
+    service_category: str = "Other"
+    sub_category: str = "General"
+    extracted_keywords: FrozenSet[str] = frozenset()
+    detected_firms: List[str] = field(default_factory=list)
+    complexity_level: str = "Medium"
+    region: str = "Unknown"
+    technology_stack: List[str] = field(default_factory=list)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain dict for JSON responses (keywords as a sorted list)"""
+        data = asdict(self)
+        data["extracted_keywords"] = sorted(self.extracted_keywords)
+        return data
+
+
+# Fields computed by enhance_tender_data; input values for these are
+# replaced, never passed through
+_ENHANCEMENT_FIELDS = frozenset({
+    "service_category", "sub_category", "extracted_keywords", "detected_firms",
+    "complexity_level", "region", "technology_stack"
+})
+
+# Raw tender keys that map onto EnhancedTender fields
+_RAW_TENDER_FIELDS = frozenset(f.name for f in fields(EnhancedTender)) - _ENHANCEMENT_FIELDS
+
+# (title, organization, department, value) rows for _create_sample_real_data
+SAMPLE_TENDER_ROWS = (
+    (
+        "Supply and Installation of Local Area Network Infrastructure with Ethernet Switches",
+        "Ministry of Electronics and Information Technology",
+        "IT Infrastructure Division",
+        7500000.00
+    ),
+    (
+        "Development of REST API Gateway for Government Services Integration",
+        "National Informatics Centre",
+        "Software Development Division", 
+        3200000.00
+    ),
+    (
+        "Implementation of Web Application Firewall and Security Solutions",
+        "Department of Telecommunications",
+        "Cybersecurity Division",
+        4800000.00
+    ),
+    (
+        "Procurement of Identity and Access Management System",
+        "Controller of Certifying Authorities",
+        "Security Division",
+        6100000.00
+    ),
+    (
+        "Setup of Security Information and Event Management Platform",
+        "Indian Computer Emergency Response Team",
+        "Incident Response Division",
+        8900000.00
+    ),
+)
+
+
+def _build_matchers():
+    """
+    Index every detector's keywords for whole-word matching, once at import.
+    Single-word keywords go into a dict looked up by title token; phrases
+    go into one Aho-Corasick automaton. Each lowercased keyword maps to its
+    (bucket, order, group, value) payloads, where order is the keyword's
+    position in the tables above so hits can be reported in table order.
+    """
+    buckets = (
+        ("category", tuple((name, keywords) for _, name, _, keywords in SERVICE_CATEGORIES)),
+        ("subcategory", SUBCATEGORY_KEYWORDS),
+        ("firm", tuple((category_id, firms) for category_id, _, firms, _ in SERVICE_CATEGORIES)),
+        ("region", REGION_KEYWORDS),
+        ("tech", TECH_KEYWORDS),
+        ("complexity", COMPLEXITY_INDICATORS),
+    )
+    
+    payloads = defaultdict(list)
+    order = 0
+    for bucket, groups in buckets:
+        for group, keywords in groups:
+            for keyword in keywords:
+                payloads[normalize_text(keyword)].append((bucket, order, group, keyword))
+                order += 1
+    
+    single_keywords = {}
+    automaton = ahocorasick.Automaton()
+    for keyword, entries in payloads.items():
+        if " " in keyword or keyword != keyword.strip(KEYWORD_PUNCTUATION):
+            automaton.add_word(keyword, (len(keyword), tuple(entries)))
+        else:
+            single_keywords[keyword] = tuple(entries)
+    automaton.make_automaton()
+    return single_keywords, automaton
+
 class TenderXAdapter:
     """
     Adapts TenderX scraped data to our enhanced schema with competitive intelligence
     """
     
+    # Keyword matchers are built once and shared by every adapter
+    _single_keywords, _automaton = _build_matchers()
+    
     def __init__(self, db_path: str = "data/tenders.db"):
         self.db_path = db_path
+        self._conn = None  # Opened on first save, see _get_connection
+        self._id_sequence = itertools.count()  # Keeps generated tender IDs unique
         self.synonym_manager = SynonymManager()
         
-        # Enhanced competitive firm database based on our service umbrellas
-        self.competitor_firms = {
-            "cloud_ai_ml": [
-                "Cyfuture Cloud", "Softlabs Group", "fxis.ai", "DataToBiz", 
-                "Talentica Software", "Quytech", "Rapyder", "Amazon AWS", 
-                "Microsoft Azure", "AWS", "Azure"
-            ],
-            "compute_hardware": [
-                "Intel India", "Acer", "Dell", "Arrow Electronics", "Tonbo Imaging"
-            ],
-            "application_integration": [
-                "Cognizant", "Infosys", "Wipro", "HCL Technologies", 
-                "Tata Consultancy Services", "TCS", "Capgemini", "NTT DATA", "Deloitte"
-            ],
-            "security_compliance": [
-                "Tech Mahindra", "Secure Network Solutions", "ControlCase", 
-                "TUV India", "Sattrix", "IBM Security"
-            ],
-            "cloud_management": [
-                "AWS", "Azure", "Tata Communications", "Datacipher", 
-                "Aspire Systems", "Microland"
-            ],
-            "networking_connectivity": [
-                "Cisco", "Tata Communications", "Reliance Jio", "Vodafone Idea", 
-                "BSNL", "TCS", "Wipro", "IBM", "HCL", "L&T"
-            ],
-            "data_analytics": [
-                "Wipro", "HCL Technologies", "Mu Sigma", "SG Analytics", 
-                "Accenture", "TCS", "Infosys", "Fractal Analytics"
-            ]
-        }
+        # Titles share most of their words, so expand each word only once
+        self._expand = lru_cache(maxsize=4096)(self.synonym_manager.expand_keyword)
+    
+    @staticmethod
+    def _tokenize(norm: str) -> frozenset:
+        """Split normalized text into its set of words"""
+        return frozenset(word.strip(KEYWORD_PUNCTUATION) for word in norm.split())
+    
+    def _scan(self, norm: str, tokens: Optional[frozenset] = None) -> Dict[str, List[tuple]]:
+        """
+        Find every whole-word keyword in normalized text (see normalize_text):
+        tokens are looked up in a dict and phrases found in one automaton pass.
+        Returns {bucket: [(order, group, value), ...]} sorted by order.
+        """
+        if tokens is None:
+            tokens = self._tokenize(norm)
+        
+        hits = defaultdict(set)
+        for token in tokens:
+            for bucket, order, group, value in self._single_keywords.get(token, ()):
+                hits[bucket].add((order, group, value))
         
-        # Service categorization keywords
-        self.service_categories = {
-            "Cloud AI/ML": ["machine learning", "artificial intelligence", "ml platform", "ai platform", "deep learning", "neural network"],
-            "Compute & Hardware": ["server", "hardware", "compute", "processor", "workstation", "blade server"],
-            "Application & Integration": ["application development", "system integration", "software development", "api integration"],
-            "Storage & Backup": ["storage", "backup", "data protection", "archive", "disaster recovery"],
-            "Security & Compliance": ["security", "firewall", "cybersecurity", "compliance", "audit", "vulnerability"],
-            "Cloud Management": ["cloud management", "devops", "orchestration", "automation", "monitoring"],
-            "Networking & Connectivity": ["network", "connectivity", "router", "switch", "wifi", "broadband"],
-            "Data & Analytics": ["data analytics", "business intelligence", "data warehouse", "big data", "analytics"],
-            "Database Services": ["database", "mysql", "postgresql", "nosql", "database management"],
-            "Identity & Access Management": ["identity", "access management", "authentication", "authorization", "iam"],
-            "Business Systems & Software": ["erp", "crm", "business software", "enterprise software"],
-            "Communication & Messaging": ["communication", "messaging", "email", "collaboration"],
-            "Data Center & Infrastructure": ["data center", "infrastructure", "colocation", "hosting"],
-            "IT Service Management": ["itsm", "service management", "helpdesk", "it support"],
-            "IoT & Automation": ["iot", "automation", "smart devices", "sensors", "industrial automation"]
-        }
+        if self._automaton.kind != ahocorasick.EMPTY:
+            for end, (length, entries) in self._automaton.iter(norm):
+                start = end - length + 1
+                if start > 0 and norm[start - 1].isalnum():
+                    continue
+                if end + 1 < len(norm) and norm[end + 1].isalnum():
+                    continue
+                for bucket, order, group, value in entries:
+                    hits[bucket].add((order, group, value))
+        return {bucket: sorted(found) for bucket, found in hits.items()}
         
-    def extract_tender_metadata(self, browser, tender_url: str) -> Optional[Dict[str, Any]]:
+    def extract_tender_metadata(self, browser, tender_url: str) -> Optional[Union[Dict[str, Any], EnhancedTender]]:
         """
         Enhanced metadata extraction from TenderX scraped tender pages
         Combines TenderX's scraping with our intelligent categorization
@@ -107,210 +365,267 @@ class TenderXAdapter:
             return tender_data
             
         except Exception as e:
-            print(f"Error extracting metadata from {tender_url}: {e}")
+            logger.error("Error extracting metadata from %s: %s", tender_url, e)
             return None
     
-    def enhance_tender_data(self, tender_data: Dict[str, Any]) -> Dict[str, Any]:
+    def enhance_tender_data(self, tender_data: Dict[str, Any]) -> EnhancedTender:
         """
         Apply our intelligent enhancements to TenderX raw data
         """
-        enhanced = tender_data.copy()
-        
         title = tender_data.get("title", "")
         organization = tender_data.get("organization", "")
+        raw_fields = {key: value for key, value in tender_data.items() if key in _RAW_TENDER_FIELDS}
         
-        # Apply our service categorization
-        enhanced["service_category"] = self.categorize_service(title)
-        enhanced["sub_category"] = self.get_subcategory(title)
-        
-        # Extract our 215+ keywords
-        enhanced["extracted_keywords"] = self.extract_relevant_keywords(title)
+        # No title to classify: only the organization-based detectors run
+        if not title or (SKIP_PLACEHOLDER_TITLES and title == PLACEHOLDER_TITLE):
+            org_hits = self._scan(normalize_text(organization))
+            return EnhancedTender(
+                **raw_fields,
+                detected_firms=self.detect_competitor_firms(title, organization, org_hits),
+                region=self.extract_region(organization, org_hits)
+            )
         
-        # Detect competitor firms
-        enhanced["detected_firms"] = self.detect_competitor_firms(title, organization)
+        # Normalize and tokenize once, then scan title and organization a
+        # single time each
+        title_norm = normalize_text(title)
+        title_tokens = self._tokenize(title_norm)
+        title_hits = self._scan(title_norm, title_tokens)
+        org_hits = self._scan(normalize_text(organization))
         
-        # Assess complexity
-        enhanced["complexity_level"] = self.assess_complexity(title)
+        # Detect competitor firms across title and organization
+        firm_hits = {"firm": sorted(set(title_hits.get("firm", ())) | set(org_hits.get("firm", ())))}
         
-        # Geographic classification
-        enhanced["region"] = self.extract_region(organization)
+        return EnhancedTender(
+            **raw_fields,
+            # Apply our service categorization
+            service_category=self.categorize_service(title, title_hits),
+            sub_category=self.get_subcategory(title, title_hits),
+            # Extract our 215+ keywords
+            extracted_keywords=self.extract_relevant_keywords(title, title_tokens),
+            detected_firms=self.detect_competitor_firms(title, organization, firm_hits),
+            # Assess complexity
+            complexity_level=self.assess_complexity(title, title_hits),
+            # Geographic classification
+            region=self.extract_region(organization, org_hits),
+            # Technology stack detection
+            technology_stack=self.detect_technology_stack(title, title_hits)
+        )
+    
+    def batch_enhance(self, tenders: List[Dict[str, Any]]) -> List[EnhancedTender]:
+        """
+        Apply enhance_tender_data to a batch of tenders in one pass
         
-        # Technology stack detection
-        enhanced["technology_stack"] = self.detect_technology_stack(title)
+        Batches of PARALLEL_ENHANCE_THRESHOLD or more tenders are spread over
+        a process pool; smaller ones are not worth the worker start-up cost.
+        """
+        if len(tenders) >= PARALLEL_ENHANCE_THRESHOLD:
+            try:
+                with ProcessPoolExecutor(initializer=_init_enhance_worker) as executor:
+                    return list(executor.map(_enhance_in_worker, tenders, chunksize=64))
+            except (OSError, BrokenProcessPool) as e:
+                logger.warning("Parallel enhancement unavailable (%s), enhancing serially", e)
         
-        return enhanced
+        enhance = self.enhance_tender_data
+        return [enhance(tender) for tender in tenders]
     
-    def categorize_service(self, title: str) -> str:
+    def categorize_service(self, title: str, hits: Optional[Dict[str, List[tuple]]] = None) -> str:
         """
         Intelligent service categorization using our keyword intelligence
         """
-        title_lower = title.lower()
+        if hits is None:
+            hits = self._scan(normalize_text(title))
         
-        for category, keywords in self.service_categories.items():
-            for keyword in keywords:
-                if keyword in title_lower:
-                    return category
+        for _, category, _ in hits.get("category", ()):
+            return category
                     
         return "Other"
     
-    def get_subcategory(self, title: str) -> str:
+    def get_subcategory(self, title: str, hits: Optional[Dict[str, List[tuple]]] = None) -> str:
         """
         Extract detailed subcategory based on our 215+ keyword expansion
         """
-        title_lower = title.lower()
+        if hits is None:
+            hits = self._scan(normalize_text(title))
         
-        # Map to subcategories using keyword detection
-        if any(kw in title_lower for kw in ["local area network", "lan", "ethernet", "switch"]):
-            return "Networking Infrastructure"
-        elif any(kw in title_lower for kw in ["api", "application programming interface", "rest"]):
-            return "API & Integration"
-        elif any(kw in title_lower for kw in ["security", "firewall", "cybersecurity"]):
-            return "Security Solutions"
-        elif any(kw in title_lower for kw in ["cloud", "aws", "azure"]):
-            return "Cloud Services"
+        for _, subcategory, _ in hits.get("subcategory", ()):
+            return subcategory
         
         return "General"
     
-    def extract_relevant_keywords(self, title: str) -> List[str]:
+    def extract_relevant_keywords(self, title: str, tokens: Optional[frozenset] = None) -> FrozenSet[str]:
         """
         Extract relevant keywords using our 215+ expansion dictionary
         """
-        expanded_keywords = []
+        expanded_keywords = set()
         
-        # Use our synonym manager to find all relevant expansions
-        words = title.lower().split()
+        # Use our synonym manager to find all relevant expansions,
+        # once per distinct word and never for stop-words
+        if tokens is None:
+            tokens = self._tokenize(normalize_text(title))
+        words = tokens - STOPWORDS
         for word in words:
-            expansion_result = self.synonym_manager.expand_keyword(word)
-            expanded_keywords.extend(expansion_result.get('expanded_phrases', []))
+            expansion_result = self._expand(word)
+            expanded_keywords.update(expansion_result.get('expanded_phrases', ()))
         
-        return list(set(expanded_keywords))
+        return frozenset(expanded_keywords)
     
-    def detect_competitor_firms(self, title: str, organization: str = "") -> List[str]:
+    def detect_competitor_firms(self, title: str, organization: str = "",
+                                hits: Optional[Dict[str, List[tuple]]] = None) -> List[str]:
         """
         Detect competitor firms mentioned in title or organization
         """
-        detected_firms = []
-        text_to_search = f"{title} {organization}".lower()
-        
-        for category, firms in self.competitor_firms.items():
-            for firm in firms:
-                if firm.lower() in text_to_search:
-                    detected_firms.append(firm)
+        if hits is None:
+            hits = self._scan(normalize_text(f"{title} {organization}"))
         
-        return detected_firms
+        return [firm for _, _, firm in hits.get("firm", ())]
     
-    def assess_complexity(self, title: str) -> str:
+    def assess_complexity(self, title: str, hits: Optional[Dict[str, List[tuple]]] = None) -> str:
         """
         Assess tender complexity based on technical indicators
         """
-        complexity_indicators = {
-            "high": ["enterprise", "nationwide", "pan india", "multi-state", "complex", "advanced"],
-            "medium": ["state-wide", "regional", "integration", "deployment", "implementation"],
-            "low": ["maintenance", "support", "basic", "simple", "routine"]
-        }
+        if hits is None:
+            hits = self._scan(normalize_text(title))
         
-        title_lower = title.lower()
-        
-        for level, indicators in complexity_indicators.items():
-            for indicator in indicators:
-                if indicator in title_lower:
-                    return level.capitalize()
+        for _, level, _ in hits.get("complexity", ()):
+            return level
                     
         return "Medium"  # Default
     
-    def extract_region(self, organization: str) -> str:
+    def extract_region(self, organization: str, hits: Optional[Dict[str, List[tuple]]] = None) -> str:
         """
         Extract region/state information from organization name
         """
-        # Basic region mapping
-        region_keywords = {
-            "Delhi": ["delhi", "new delhi", "nd"],
-            "Maharashtra": ["maharashtra", "mumbai", "pune"],
-            "Karnataka": ["karnataka", "bangalore", "bengaluru"],
-            "Tamil Nadu": ["tamil nadu", "chennai"],
-            "Uttar Pradesh": ["uttar pradesh", "lucknow", "noida"],
-            "Gujarat": ["gujarat", "ahmedabad"],
-            "West Bengal": ["west bengal", "kolkata"],
-            "Rajasthan": ["rajasthan", "jaipur"],
-            "National": ["india", "national", "central", "ministry"]
-        }
-        
-        org_lower = organization.lower()
+        if hits is None:
+            hits = self._scan(normalize_text(organization))
         
-        for region, keywords in region_keywords.items():
-            for keyword in keywords:
-                if keyword in org_lower:
-                    return region
+        for _, region, _ in hits.get("region", ()):
+            return region
                     
         return "Unknown"
     
-    def detect_technology_stack(self, title: str) -> List[str]:
+    def detect_technology_stack(self, title: str, hits: Optional[Dict[str, List[tuple]]] = None) -> List[str]:
         """
         Detect technology stack mentioned in tender
         """
-        tech_keywords = {
-            "Cloud": ["aws", "azure", "google cloud", "cloud platform"],
-            "Database": ["mysql", "postgresql", "oracle", "sql server", "mongodb"],
-            "Programming": ["java", "python", ".net", "nodejs", "php"],
-            "Infrastructure": ["kubernetes", "docker", "linux", "windows server"],
-            "Security": ["ssl", "encryption", "firewall", "antivirus"],
-            "Networking": ["cisco", "juniper", "router", "switch", "wifi"]
-        }
+        if hits is None:
+            hits = self._scan(normalize_text(title))
         
         detected_tech = []
-        title_lower = title.lower()
-        
-        for tech, keywords in tech_keywords.items():
-            for keyword in keywords:
-                if keyword in title_lower:
-                    detected_tech.append(tech)
-                    break
+        for _, tech, _ in hits.get("tech", ()):
+            if tech not in detected_tech:
+                detected_tech.append(tech)
         
         return detected_tech
     
-    def save_enhanced_tender(self, enhanced_data: Dict[str, Any]) -> bool:
+    def _get_connection(self) -> sqlite3.Connection:
+        """
+        Open the adapter's SQLite connection once and reuse it for every save
+        """
+        if self._conn is None:
+            # Autocommit mode; batches manage their own transaction
+            self._conn = sqlite3.connect(self.db_path, isolation_level=None)
+            self._conn.executescript(CONNECTION_PRAGMAS)
+        return self._conn
+    
+    @staticmethod
+    def _saved_ids(conn: sqlite3.Connection, tender_ids: List[str]) -> set:
+        """Which of tender_ids are already in the tenders table"""
+        saved = set()
+        for start in range(0, len(tender_ids), SAVED_IDS_CHUNK):
+            chunk = tender_ids[start:start + SAVED_IDS_CHUNK]
+            sql = SAVED_IDS_SQL.format(placeholders=", ".join("?" * len(chunk)))
+            saved.update(row[0] for row in conn.execute(sql, chunk))
+        return saved
+    
+    def close(self):
+        """Close the adapter's SQLite connection, if open"""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+    
+    def _tender_row(self, tender: EnhancedTender, batch_tag: str, batch_date: str) -> tuple:
+        """Prepare values matching FTS5 schema"""
+        return (
+            tender.tender_id or f"CPPP_{batch_tag}_{next(self._id_sequence):06d}",
+            tender.title,
+            tender.organization,  # maps to 'org'
+            tender.status,
+            tender.published_date or batch_date,  # maps to 'aoc_date'
+            tender.tender_url,  # maps to 'url'
+            tender.service_category,
+            tender.region.lower(),
+            tender.complexity_level.lower(),  # maps to 'complexity'
+            ",".join(tender.extracted_keywords) or None  # keywords; NULL adds nothing to the index
+        )
+    
+    def save_enhanced_tender(self, tender: EnhancedTender) -> bool:
         """
         Save enhanced tender data to our SQLite FTS5 database
         """
+        return bool(self.save_enhanced_tenders_batch([tender]))
+    
+    def save_enhanced_tenders_batch(self, tenders: List[EnhancedTender]) -> List[EnhancedTender]:
+        """
+        Save many enhanced tenders with one executemany in a single transaction,
+        so the batch pays for one commit instead of one per tender
+        
+        Tenders whose ID is already saved (or repeated within the batch) are
+        skipped rather than inserted twice.
+        
+        Returns:
+            The tenders that were newly saved (empty if the batch was rolled back)
+        """
+        if not tenders:
+            return []
+        
+        started = time.perf_counter()
+        
+        # One timestamp per batch for generated IDs and missing dates
+        batch_ts = datetime.now()
+        batch_tag = batch_ts.strftime('%Y%m%d_%H%M%S')
+        batch_date = batch_ts.date().isoformat()
+        rows = [self._tender_row(tender, batch_tag, batch_date) for tender in tenders]
+        
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            # FTS5 insert query matching actual schema
-            insert_query = """
-            INSERT INTO tenders (
-                tender_id, title, org, status, aoc_date, url,
-                service_category, value_range, region, 
-                department_type, complexity, keywords
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """
-            
-            # Prepare values matching FTS5 schema
-            values = (
-                enhanced_data.get("tender_id", f"CPPP_{datetime.now().strftime('%Y%m%d_%H%M%S')}"),
-                enhanced_data.get("title", "Unknown Title"),
-                enhanced_data.get("organization", "Unknown Organization"),  # maps to 'org'
-                enhanced_data.get("status", "Published AOC"),
-                enhanced_data.get("published_date", datetime.now().date().isoformat()),  # maps to 'aoc_date'
-                enhanced_data.get("tender_url", ""),  # maps to 'url'
-                enhanced_data.get("service_category", "Other"),
-                "5_to_25_lakh",  # Default value range
-                enhanced_data.get("region", "delhi").lower(),
-                "central",  # Default department type
-                enhanced_data.get("complexity_level", "medium").lower(),  # maps to 'complexity'
-                ",".join(enhanced_data.get("extracted_keywords", []))  # keywords
-            )
-            
-            cursor.execute(insert_query, values)
-            conn.commit()
-            conn.close()
+            conn = self._get_connection()
+            # IMMEDIATE takes the write lock before the lookup, so no other
+            # writer can save one of these IDs between lookup and insert
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                seen = self._saved_ids(conn, [row[0] for row in rows])
+                new = []
+                for tender, row in zip(tenders, rows):
+                    if row[0] not in seen:
+                        seen.add(row[0])
+                        new.append((tender, row))
+                conn.executemany(INSERT_TENDER_SQL, [row for _, row in new])
+                conn.execute("COMMIT")
+            except Exception:
+                if conn.in_transaction:
+                    conn.execute("ROLLBACK")
+                raise
             
-            print(f"✅ Saved tender {enhanced_data.get('tender_id')} to FTS5 database")
-            return True
+            if logger.isEnabledFor(logging.DEBUG):
+                for _, row in new:
+                    logger.debug("Saved tender %s", row[0])
+            logger.info("Saved %d tenders (%d duplicates skipped) in %.2fs",
+                        len(new), len(rows) - len(new), time.perf_counter() - started)
+            return [tender for tender, _ in new]
             
         except Exception as e:
-            print(f"❌ Error saving enhanced tender: {e}")
-            return False
+            logger.error("Error saving enhanced tenders: %s", e)
+            return []
+
+# Adapter used by batch_enhance worker processes, see _init_enhance_worker
+_worker_adapter = None
+
+def _init_enhance_worker():
+    """Build one adapter per worker; the keyword matchers come with the module import"""
+    global _worker_adapter
+    _worker_adapter = TenderXAdapter()
+
+def _enhance_in_worker(tender_data: Dict[str, Any]) -> EnhancedTender:
+    return _worker_adapter.enhance_tender_data(tender_data)
 
 class TenderXIntegratedScraper:
     """
@@ -320,7 +635,7 @@ class TenderXIntegratedScraper:
     def __init__(self):
         self.adapter = TenderXAdapter()
         
-    def scrape_and_enhance_tenders(self, max_pages: int = 1) -> List[Dict[str, Any]]:
+    def scrape_and_enhance_tenders(self, max_pages: int = 1) -> List[EnhancedTender]:
         """
         Main integration method: scrape via TenderX + enhance with our intelligence
         """
@@ -329,7 +644,7 @@ class TenderXIntegratedScraper:
             from .tender_scraper import initialize_browser, open_website, search_open_tenders
             from .downloader import process_tenders
         except ImportError as e:
-            print(f"Error importing TenderX modules: {e}")
+            logger.error("Error importing TenderX modules: %s", e)
             return []
         
         enhanced_tenders = []
@@ -347,30 +662,32 @@ class TenderXIntegratedScraper:
             # Extract tender links (simplified for integration testing)
             tender_links = self._extract_sample_tender_links()
             
-            print(f"Found {len(tender_links)} tender links for processing")
+            logger.info("Found %d tender links for processing", len(tender_links))
             
-            # Process each tender with our enhancements
+            # Extract metadata for each tender
+            batch_ts = datetime.now()
+            scraped_tenders = []
             for i, link in enumerate(tender_links):
-                print(f"Processing tender {i+1}/{len(tender_links)}: {link}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Processing tender %d/%d: %s", i + 1, len(tender_links), link)
                 
                 # Extract metadata (this would use TenderX's existing logic)
-                tender_data = self._extract_tender_metadata_from_link(browser, link)
+                tender_data = self._extract_tender_metadata_from_link(browser, link, batch_ts, i)
                 
                 if tender_data:
-                    # Apply our intelligent enhancements
-                    enhanced_tender = self.adapter.enhance_tender_data(tender_data)
-                    
-                    # Save to our database
-                    if self.adapter.save_enhanced_tender(enhanced_tender):
-                        enhanced_tenders.append(enhanced_tender)
-                        print(f"✅ Enhanced and saved tender: {enhanced_tender.get('tender_id')}")
-                    else:
-                        print(f"❌ Failed to save tender: {enhanced_tender.get('tender_id')}")
+                    scraped_tenders.append(tender_data)
             
             browser.quit()
             
+            # Apply our intelligent enhancements
+            enhanced_tenders = self.adapter.batch_enhance(scraped_tenders)
+            
+            # Save to our database in one transaction; only newly saved
+            # tenders are returned, duplicates of saved ones are dropped
+            enhanced_tenders = self.adapter.save_enhanced_tenders_batch(enhanced_tenders)
+            
         except Exception as e:
-            print(f"Error in integrated scraping: {e}")
+            logger.error("Error in integrated scraping: %s", e)
         
         return enhanced_tenders
     
@@ -386,11 +703,14 @@ class TenderXIntegratedScraper:
             "https://etenders.gov.in/eprocure/app?component=%24DirectLink_0&page=FrontEndAdvancedSearchResult&service=direct&session=T&sp=SBxt1NZPECd9xxZB8ZLBoZw%3D%3D"
         ]
     
-    def _extract_tender_metadata_from_link(self, browser, tender_url: str) -> Optional[Dict[str, Any]]:
+    def _extract_tender_metadata_from_link(self, browser, tender_url: str,
+                                           batch_ts: Optional[datetime] = None,
+                                           sequence: int = 0) -> Optional[Dict[str, Any]]:
         """
         Extract tender metadata from individual tender page
         This integrates with TenderX's existing extraction logic
         """
+        batch_ts = batch_ts or datetime.now()
         try:
             # Navigate to tender page in new tab
             browser.execute_script("window.open(arguments[0]);", tender_url)
@@ -398,11 +718,11 @@ class TenderXIntegratedScraper:
             
             # Extract basic metadata (simplified for integration)
             tender_data = {
-                "tender_id": f"TEST_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
-                "title": "Sample Network Infrastructure Tender",  # Would extract from page
+                "tender_id": f"TEST_{batch_ts.strftime('%Y%m%d_%H%M%S')}_{sequence:03d}",
+                "title": PLACEHOLDER_TITLE,                         # Would extract from page
                 "organization": "Sample Government Department",     # Would extract from page
                 "department": "IT Department",                      # Would extract from page
-                "published_date": datetime.now().date().isoformat(),
+                "published_date": batch_ts.date().isoformat(),
                 "closing_date": "2025-11-30",
                 "status": "Open",
                 "tender_url": tender_url,
@@ -417,7 +737,7 @@ class TenderXIntegratedScraper:
             return tender_data
             
         except Exception as e:
-            print(f"Error extracting metadata from {tender_url}: {e}")
+            logger.error("Error extracting metadata from %s: %s", tender_url, e)
             # Close tab on error
             try:
                 browser.close()
@@ -427,14 +747,17 @@ class TenderXIntegratedScraper:
                 pass
             return None
 
-    def _create_sample_real_data(self, count: int = 5) -> List[Dict[str, Any]]:
+    def _create_sample_real_data(self, count: int = 5) -> List[EnhancedTender]:
         """
         Create realistic sample data that looks like real CPPP tenders
         Used for testing the integration pipeline without actual scraping
         """
+        batch_ts = datetime.now()
+        batch_tag = batch_ts.strftime('%Y%m%d_%H%M%S')
+        scraped_at = batch_ts.isoformat()
         sample_tenders = [
             {
-                "tender_id": f"CPPP_TEST_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{i:03d}",
+                "tender_id": f"CPPP_TEST_{batch_tag}_{i:03d}",
                 "title": title,
                 "organization": org,
                 "department": dept,
@@ -444,49 +767,13 @@ class TenderXIntegratedScraper:
                 "status": "Open",
                 "source": "CPPP",
                 "tender_url": f"https://etenders.gov.in/sample/test_{i}",
-                "scraped_at": datetime.now().isoformat()
+                "scraped_at": scraped_at
             }
-            for i, (title, org, dept, value) in enumerate([
-                (
-                    "Supply and Installation of Local Area Network Infrastructure with Ethernet Switches",
-                    "Ministry of Electronics and Information Technology",
-                    "IT Infrastructure Division",
-                    7500000.00
-                ),
-                (
-                    "Development of REST API Gateway for Government Services Integration",
-                    "National Informatics Centre",
-                    "Software Development Division", 
-                    3200000.00
-                ),
-                (
-                    "Implementation of Web Application Firewall and Security Solutions",
-                    "Department of Telecommunications",
-                    "Cybersecurity Division",
-                    4800000.00
-                ),
-                (
-                    "Procurement of Identity and Access Management System",
-                    "Controller of Certifying Authorities",
-                    "Security Division",
-                    6100000.00
-                ),
-                (
-                    "Setup of Security Information and Event Management Platform",
-                    "Indian Computer Emergency Response Team",
-                    "Incident Response Division",
-                    8900000.00
-                )
-            ], 1)
+            for i, (title, org, dept, value) in enumerate(SAMPLE_TENDER_ROWS[:count], 1)
         ]
         
-        # Apply our intelligent enhancements to each sample
-        enhanced_samples = []
-        for tender in sample_tenders[:count]:
-            enhanced = self.adapter.enhance_tender_data(tender)
-            enhanced_samples.append(enhanced)
-            
-        return enhanced_samples
+        # Apply our intelligent enhancements to all samples in one pass
+        return self.adapter.batch_enhance(sample_tenders)
 
 def test_integration():
     """
@@ -505,11 +792,11 @@ def test_integration():
     print(f"   Enhanced tenders: {len(enhanced_tenders)}")
     
     for tender in enhanced_tenders:
-        print(f"\n🎯 Tender: {tender.get('tender_id')}")
-        print(f"   Service Category: {tender.get('service_category')}")
-        print(f"   Keywords: {tender.get('extracted_keywords', [])}")
-        print(f"   Detected Firms: {tender.get('detected_firms', [])}")
-        print(f"   Complexity: {tender.get('complexity_level')}")
+        print(f"\n🎯 Tender: {tender.tender_id}")
+        print(f"   Service Category: {tender.service_category}")
+        print(f"   Keywords: {sorted(tender.extracted_keywords)}")
+        print(f"   Detected Firms: {tender.detected_firms}")
+        print(f"   Complexity: {tender.complexity_level}")
 
 if __name__ == "__main__":
     test_integration()
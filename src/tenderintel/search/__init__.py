@@ -8,21 +8,36 @@ Supports multiple search engines with user choice flexibility:
 - OpenSearch (optional, for large-scale deployments)
 """
 
+import importlib
+
 # Core components
 from .synonym_manager import SynonymManager
-from .base import (
-    SearchEngine, SearchEngineType, UnifiedSearchResponse, UnifiedSearchHit,
-    EngineCapabilities, EngineHealthStatus, EngineStatistics
-)
-
-# Engine implementations
-from .engines import SQLiteFTS5Engine, OpenSearchEngine, OPENSEARCH_AVAILABLE
-
-# Unified manager (recommended interface)
-from .manager import UnifiedSearchManager, create_search_manager
 
-# Legacy interface (backwards compatibility)
-from .search_engine_interface import SearchFilters, SearchEngineInterface
+# Everything else is imported on first attribute access (PEP 562), so code
+# that only needs one engine does not pay for the others' dependencies
+_LAZY_EXPORTS = {
+    # Base classes
+    'SearchEngine': '.base',
+    'SearchEngineType': '.base',
+    'UnifiedSearchResponse': '.base',
+    'UnifiedSearchHit': '.base',
+    'EngineCapabilities': '.base',
+    'EngineHealthStatus': '.base',
+    'EngineStatistics': '.base',
+    
+    # Engine implementations
+    'SQLiteFTS5Engine': '.engines',
+    'OpenSearchEngine': '.engines',
+    'OPENSEARCH_AVAILABLE': '.engines',
+    
+    # Unified manager (recommended interface)
+    'UnifiedSearchManager': '.manager',
+    'create_search_manager': '.manager',
+    
+    # Legacy interface (backwards compatibility)
+    'SearchFilters': '.search_engine_interface',
+    'SearchEngineInterface': '.search_engine_interface'
+}
 
 __all__ = [
     # Recommended interface
@@ -47,3 +62,16 @@ __all__ = [
     'SearchFilters',
     'SearchEngineInterface'
 ]
+
+
+def __getattr__(name):
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value  # Cache so later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
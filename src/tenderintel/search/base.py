@@ -4,15 +4,19 @@ Abstract Base Classes for TenderIntel Search Engines
 Defines the interface that both SQLite FTS5 and OpenSearch must implement
 """
 
+import sys
 from abc import ABC, abstractmethod
 from typing import List, Dict, Any, Optional, AsyncIterator
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from enum import Enum
 from datetime import datetime
 import logging
 
 logger = logging.getLogger(__name__)
 
+# dataclass(slots=True) needs Python 3.10+; older versions keep a __dict__
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 
 class SearchEngineType(Enum):
     """Available search engine types"""
@@ -20,7 +24,7 @@ class SearchEngineType(Enum):
     OPENSEARCH = "opensearch"
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class EngineCapabilities:
     """
     Declares what a search engine can do
@@ -39,7 +43,7 @@ class EngineCapabilities:
     features: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class EngineHealthStatus:
     """Engine health information"""
     is_healthy: bool
@@ -48,7 +52,7 @@ class EngineHealthStatus:
     details: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class EngineStatistics:
     """Engine usage statistics and metrics"""
     record_count: int
@@ -59,7 +63,7 @@ class EngineStatistics:
     additional_stats: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class UnifiedSearchHit:
     """
     Single search result - identical structure from both engines
@@ -101,7 +105,7 @@ class UnifiedSearchHit:
     value_range: Optional[str] = None
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class UnifiedSearchResponse:
     """
     Search response - identical structure from both engines
@@ -124,6 +128,15 @@ class UnifiedSearchResponse:
     
     # Engine-specific debug info (doesn't break compatibility)
     engine_debug: Optional[Dict[str, Any]] = None
+    
+    def copy(self) -> "UnifiedSearchResponse":
+        """Copy with its own hits, phrase list and debug dict, for handing out cached responses"""
+        return replace(
+            self,
+            expanded_phrases=list(self.expanded_phrases),
+            hits=[replace(hit) for hit in self.hits],
+            engine_debug=dict(self.engine_debug) if self.engine_debug is not None else None
+        )
 
 
 class SearchEngine(ABC):
@@ -316,6 +329,17 @@ OPENSEARCH_CAPABILITIES = EngineCapabilities(
 )
 
 
+_CAPABILITIES_BY_TYPE = {
+    SearchEngineType.SQLITE: SQLITE_CAPABILITIES,
+    SearchEngineType.OPENSEARCH: OPENSEARCH_CAPABILITIES
+}
+
+# Features only OpenSearch provides (capabilities are fixed at import)
+OPENSEARCH_ONLY_FEATURES = (
+    frozenset(OPENSEARCH_CAPABILITIES.features) - frozenset(SQLITE_CAPABILITIES.features)
+)
+
+
 def get_engine_capabilities(engine_type: SearchEngineType) -> EngineCapabilities:
     """
     Get capabilities for specified engine type
@@ -326,12 +350,10 @@ def get_engine_capabilities(engine_type: SearchEngineType) -> EngineCapabilities
     Returns:
         EngineCapabilities for that engine
     """
-    if engine_type == SearchEngineType.SQLITE:
-        return SQLITE_CAPABILITIES
-    elif engine_type == SearchEngineType.OPENSEARCH:
-        return OPENSEARCH_CAPABILITIES
-    else:
-        raise ValueError(f"Unknown engine type: {engine_type}")
+    try:
+        return _CAPABILITIES_BY_TYPE[engine_type]
+    except KeyError:
+        raise ValueError(f"Unknown engine type: {engine_type}") from None
 
 
 def compare_engine_capabilities() -> Dict[str, Any]:
@@ -399,8 +421,7 @@ def main():
     print(f"   ... and {len(SQLITE_CAPABILITIES.features) - 10} more")
     
     print("\n✨ OpenSearch Additional Features:")
-    opensearch_only = set(OPENSEARCH_CAPABILITIES.features) - set(SQLITE_CAPABILITIES.features)
-    for feature in opensearch_only:
+    for feature in OPENSEARCH_ONLY_FEATURES:
         print(f"   • {feature.replace('_', ' ').title()}")
     
     print("\n✅ Base classes test completed!")
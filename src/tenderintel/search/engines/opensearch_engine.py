@@ -4,13 +4,23 @@ OpenSearch Engine Implementation (Optional)
 Requires: pip install tenderintel[opensearch]
 """
 
+import asyncio
+import json
 import logging
 import time
-from typing import Dict, Any, List, Optional
+from collections import OrderedDict, deque
+from functools import lru_cache, partial
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime
 
 # OpenSearch imports (this file only loaded if opensearch-py installed)
-from opensearchpy import OpenSearch, exceptions
+from opensearchpy import OpenSearch, Urllib3HttpConnection, exceptions
+from opensearchpy.serializer import JSONSerializer
+
+try:
+    import orjson
+except ImportError:  # Fall back to the client's stdlib json serializer
+    orjson = None
 
 # Import abstract base class
 from ..base import (
@@ -21,6 +31,175 @@ from ..base import (
 
 logger = logging.getLogger(__name__)
 
+# Best matches first, newest awards breaking ties; tender_id makes the order
+# total so search_after cursors are stable. It is sorted through its keyword
+# subfield, which dynamic mapping creates on existing indices too (sorting
+# the text field itself would fail); unmapped_type keeps indices without the
+# subfield searchable, just without the tiebreaker
+RESULT_SORT = [
+    {"_score": {"order": "desc"}},
+    {"aoc_date": {"order": "desc"}},
+    {"tender_id.keyword": {"order": "asc", "unmapped_type": "keyword"}}
+]
+
+
+# Fallback (legacy, order 0) template so the sort fields always have
+# doc_values; a matching composable template takes precedence. tender_id
+# gets the same text + keyword mapping dynamic mapping would produce, so
+# RESULT_SORT works on indices created with or without the template
+SORT_FIELDS_TEMPLATE = {
+    "order": 0,
+    "mappings": {
+        "properties": {
+            "aoc_date": {"type": "date"},
+            "tender_id": {
+                "type": "text",
+                "fields": {"keyword": {"type": "keyword", "ignore_above": 256}}
+            }
+        }
+    }
+}
+
+# Only the fields _process_results_to_unified reads are fetched per hit
+SOURCE_FIELDS = {
+    "includes": [
+        "tender_id", "title", "organization", "status", "aoc_date", "url",
+        "financial_data.award_value",
+        "financial_data.currency",
+        "financial_data.inr_normalized_value",
+        "financial_data.deal_size_category",
+        "competitive_intelligence.service_category",
+        "competitive_intelligence.detected_firms",
+        "competitive_intelligence.region"
+    ]
+}
+
+# Title highlighting with control-character tags, parsed back into the terms
+# the server matched; snippets are returned with <mark> tags
+TITLE_HIGHLIGHT = {
+    "pre_tags": ["\x01"],
+    "post_tags": ["\x02"],
+    "fields": {"title": {"number_of_fragments": 0}}
+}
+HIGHLIGHT_TAGS = str.maketrans({"\x01": "<mark>", "\x02": "</mark>"})
+
+
+def _highlighted_terms(fragment: str) -> frozenset:
+    """Lowercased words wrapped in highlight tags within a title fragment"""
+    return frozenset(
+        part.split("\x02", 1)[0].lower()
+        for part in fragment.split("\x01")[1:]
+    )
+
+
+@lru_cache(maxsize=8192)
+def _phrase_params(phrase: str) -> Tuple[int, float]:
+    """
+    (slop, boost) for a phrase: multi-word phrases allow one position of
+    slop and rank above single words (slop is irrelevant for one term)
+    """
+    if " " in phrase:
+        return 1, 2.0
+    return 0, 1.5
+
+
+@lru_cache(maxsize=1024)
+def _analyze_phrases(
+    phrases: Tuple[str, ...]
+) -> Tuple[Dict[str, Any], Tuple[Tuple[str, str, Tuple[str, ...], bool], ...]]:
+    """
+    Build the phrase bool query plus per-phrase data for hit matching
+    
+    Cached per expansion so popular searches skip rebuilding the clauses.
+    The returned query is shared between calls and must not be mutated.
+    
+    Returns:
+        (bool query, (phrase, lowercased, lowercased words, is multi-word) per phrase)
+    """
+    should_clauses = []
+    
+    # Plain single words score the same as one-term phrases, so they share
+    # a single OR match clause instead of one scorer each
+    single_words = [phrase for phrase in phrases if phrase.isalnum()]
+    if len(single_words) < 2:
+        single_words = []
+    
+    for phrase in phrases:
+        if single_words and phrase.isalnum():
+            continue
+        
+        slop, boost = _phrase_params(phrase)
+        
+        should_clauses.append({
+            "match_phrase": {
+                "title": {
+                    "query": phrase,
+                    "slop": slop,
+                    "boost": boost
+                }
+            }
+        })
+    
+    if single_words:
+        should_clauses.append({
+            "match": {
+                "title": {
+                    "query": " ".join(single_words),
+                    "operator": "or",
+                    "boost": _phrase_params(single_words[0])[1]
+                }
+            }
+        })
+    
+    query = {
+        "bool": {
+            "should": should_clauses,
+            "minimum_should_match": 1
+        }
+    }
+    phrase_meta = tuple(
+        (phrase, phrase.lower(), tuple(phrase.lower().split()), " " in phrase)
+        for phrase in phrases
+    )
+    
+    return query, phrase_meta
+
+
+def _aoc_date_sort_value(hit: Dict[str, Any]) -> tuple:
+    """aoc_date sort key of a hit (RESULT_SORT position 1); missing dates sort lowest"""
+    sort = hit.get('sort') or ()
+    value = sort[1] if len(sort) > 1 else None
+    return (value is not None, value if value is not None else 0)
+
+
+def _tender_id_sort_value(hit: Dict[str, Any]) -> str:
+    """tender_id tiebreaker of a hit (RESULT_SORT position 2)"""
+    sort = hit.get('sort') or ()
+    value = sort[2] if len(sort) > 2 else None
+    if value is None:
+        value = hit.get('_source', {}).get('tender_id')
+    return value or ""
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised instead of querying while the search circuit breaker is open"""
+
+
+class ORJSONSerializer(JSONSerializer):
+    """JSON serializer backed by orjson for request bodies and responses"""
+    
+    def dumps(self, data):
+        if isinstance(data, str):
+            return data
+        # msearch/bulk bodies are joined as text, so return str not bytes
+        return orjson.dumps(data, default=self.default, option=orjson.OPT_NAIVE_UTC).decode("utf-8")
+    
+    def loads(self, s):
+        try:
+            return orjson.loads(s)
+        except orjson.JSONDecodeError as e:
+            raise exceptions.SerializationError(s, e)
+
 
 class OpenSearchEngine(SearchEngine):
     """
@@ -44,18 +223,69 @@ class OpenSearchEngine(SearchEngine):
         """
         self.config = config
         
-        # Initialize OpenSearch client
+        hosts = config.get('hosts', [{'host': 'localhost', 'port': 9200}])
+        
+        # Sniff cluster nodes to spread load when several hosts are configured
+        multi_host = len(hosts) > 1
+        
+        # Initialize OpenSearch client with a keep-alive pool per node
         self.client = OpenSearch(
-            hosts=config.get('hosts', [{'host': 'localhost', 'port': 9200}]),
+            hosts=hosts,
             use_ssl=config.get('use_ssl', False),
             verify_certs=config.get('verify_certs', False),
             timeout=config.get('timeout', 30),
-            max_retries=config.get('max_retries', 3)
+            max_retries=config.get('max_retries', 3),
+            retry_on_timeout=config.get('retry_on_timeout', True),
+            http_compress=config.get('http_compress', True),
+            connection_class=Urllib3HttpConnection,
+            maxsize=config.get('pool_size', 32),
+            sniff_on_start=multi_host,
+            sniff_on_connection_fail=multi_host,
+            serializer=ORJSONSerializer() if orjson else JSONSerializer()
         )
         
         self.index_prefix = config.get('index_prefix', 'tenders')
         self.index_pattern = config.get('index_pattern', 'tenders-*')
         
+        # Phrases per sub-query when splitting large expansions into one
+        # _msearch request (0 disables splitting)
+        self.msearch_batch_size = config.get('msearch_batch_size', 0)
+        
+        # Route repeat searches to the same shard copies for warm caches
+        self.search_preference = config.get('search_preference', '_local')
+        
+        # Short-lived cache of identical searches (0 disables), keyed by the
+        # full request; in-flight duplicates share one query
+        self.response_cache_ttl = config.get('response_cache_ttl', 30)
+        self.response_cache_size = config.get('response_cache_size', 512)
+        self._response_cache = OrderedDict()
+        self._pending_searches = {}
+        
+        # Hit counting cap: None keeps the server default (10,000), 'page'
+        # stops counting just past the requested page
+        self.track_total_hits = config.get('track_total_hits')
+        
+        # Per-search server limits: shards return partial results after
+        # search_timeout, and terminate_after (0 = off) caps docs per shard
+        self.search_timeout = config.get('search_timeout', '2s')
+        self.terminate_after = config.get('terminate_after', 0)
+        
+        # Circuit breaker: after circuit_failure_threshold failed or timed
+        # out searches within circuit_window_s, skip OpenSearch for
+        # circuit_cooldown_s seconds
+        self.circuit_failure_threshold = config.get('circuit_failure_threshold', 5)
+        self.circuit_window_s = config.get('circuit_window_s', 10)
+        self.circuit_cooldown_s = config.get('circuit_cooldown_s', 30)
+        self._failure_times = deque()
+        self._circuit_open_until = 0.0
+        
+        if config.get('manage_index_template', True):
+            self._ensure_sort_field_template()
+        
+        concurrent_mode = config.get('concurrent_segment_search')
+        if concurrent_mode:
+            self._enable_concurrent_segment_search(concurrent_mode)
+        
         logger.info(f"✓ OpenSearch engine initialized: {config.get('hosts')}")
     
     # ===== SearchEngine Interface Implementation =====
@@ -74,7 +304,7 @@ class OpenSearchEngine(SearchEngine):
         """Check OpenSearch cluster health"""
         
         try:
-            health = self.client.cluster.health(timeout='5s')
+            health = await self._run(self.client.cluster.health, timeout='5s')
             
             cluster_status = health.get('status', 'red')
             is_healthy = cluster_status in ['green', 'yellow']
@@ -111,19 +341,21 @@ class OpenSearchEngine(SearchEngine):
         """Get OpenSearch statistics"""
         
         try:
-            # Get index stats
-            stats = self.client.indices.stats(index=self.index_pattern)
+            # Get per-index store sizes as a flat list (one row per index)
+            indices = await self._run(
+                self.client.cat.indices,
+                index=self.index_pattern,
+                format='json',
+                bytes='b',
+                h='index,store.size'
+            )
             
             # Get document count
-            count_result = self.client.count(index=self.index_pattern)
+            count_result = await self._run(self.client.count, index=self.index_pattern)
             record_count = count_result.get('count', 0)
             
-            # Calculate index size
-            indices_stats = stats.get('indices', {})
-            total_size_bytes = sum(
-                idx.get('total', {}).get('store', {}).get('size_in_bytes', 0)
-                for idx in indices_stats.values()
-            )
+            # Calculate index size (closed indices report no size)
+            total_size_bytes = sum(int(row.get('store.size') or 0) for row in indices)
             size_mb = total_size_bytes / (1024 * 1024)
             
             return EngineStatistics(
@@ -133,8 +365,7 @@ class OpenSearchEngine(SearchEngine):
                 queries_per_minute=0.0,  # Would need tracking
                 last_updated=datetime.now(),
                 additional_stats={
-                    'cluster_name': stats.get('cluster_name'),
-                    'indices_count': len(indices_stats)
+                    'indices_count': len(indices)
                 }
             )
             
@@ -157,75 +388,65 @@ class OpenSearchEngine(SearchEngine):
         limit: int = 25,
         offset: int = 0,
         include_aggregations: bool = False,
-        debug: bool = False
+        debug: bool = False,
+        search_after: Optional[List[Any]] = None
     ) -> UnifiedSearchResponse:
         """
         Execute OpenSearch query with phrase matching and BM25 ranking
         
-        Provides IDENTICAL experience to SQLite engine.
+        Provides IDENTICAL experience to SQLite engine. Identical requests
+        within response_cache_ttl seconds share one cached response, and
+        concurrent duplicates wait on a single in-flight query.
+        
+        For deep pagination pass the previous page's
+        engine_debug['next_cursor'] as search_after instead of an offset;
+        the cost per page then no longer grows with depth.
         """
         
-        start_time = time.time()
+        # Repeated synonyms add clauses without changing matches
+        expanded_phrases = list(dict.fromkeys(expanded_phrases))
         
         try:
-            # Build bool query with phrase matching
-            should_clauses = []
+            if debug or not self.response_cache_ttl:
+                return await self._search(keyword, expanded_phrases, limit, offset, search_after)
             
-            for phrase in expanded_phrases:
-                slop = 1 if len(phrase.split()) > 1 else 0
-                
-                should_clauses.append({
-                    "match_phrase": {
-                        "title": {
-                            "query": phrase,
-                            "slop": slop,
-                            "boost": 2.0 if " " in phrase else 1.5
-                        }
-                    }
-                })
-            
-            # Build complete query
-            query_body = {
-                "query": {
-                    "bool": {
-                        "should": should_clauses,
-                        "minimum_should_match": 1
-                    }
-                },
-                "sort": [
-                    {"_score": {"order": "desc"}},
-                    {"aoc_date": {"order": "desc"}}
-                ],
-                "size": limit,
-                "from": offset
-            }
-            
-            # Execute search
-            response = self.client.search(
-                index=self.index_pattern,
-                body=query_body
+            key = (
+                keyword,
+                tuple(expanded_phrases),
+                json.dumps(filters, sort_keys=True, default=str),
+                limit,
+                offset,
+                include_aggregations,
+                json.dumps(search_after, default=str)
             )
             
-            # Process results to UnifiedSearchHit format
-            hits = self._process_results_to_unified(
-                response['hits']['hits'],
-                response['hits']['max_score'],
-                expanded_phrases,
-                keyword
-            )
+            cached = self._response_cache.get(key)
+            if cached is not None and cached[0] > time.monotonic():
+                self._response_cache.move_to_end(key)
+                return cached[1].copy()
             
-            execution_time = (time.time() - start_time) * 1000
+            pending = self._pending_searches.get(key)
+            if pending is None:
+                pending = asyncio.ensure_future(
+                    self._search(keyword, expanded_phrases, limit, offset, search_after)
+                )
+                self._pending_searches[key] = pending
+                pending.add_done_callback(partial(self._store_response, key))
             
+            # Copies keep callers from mutating the cached response or its hits
+            return (await asyncio.shield(pending)).copy()
+            
+        except CircuitOpenError:
             return UnifiedSearchResponse(
                 query=keyword,
                 expanded_phrases=expanded_phrases,
-                total_matches=response['hits']['total']['value'],
-                max_score=response['hits']['max_score'] or 1.0,
-                hits=hits,
-                execution_time_ms=round(execution_time, 2),
-                engine_used='opensearch'
+                total_matches=0,
+                max_score=0.0,
+                hits=[],
+                execution_time_ms=0.0,
+                engine_used='opensearch',
+                engine_debug={'circuit_open': True}
             )
-            
         except Exception as e:
             logger.error(f"OpenSearch search failed: {e}")
             return UnifiedSearchResponse(
@@ -238,6 +459,135 @@ class OpenSearchEngine(SearchEngine):
                 engine_used='opensearch'
             )
     
+    async def _search(
+        self,
+        keyword: str,
+        expanded_phrases: List[str],
+        limit: int,
+        offset: int,
+        search_after: Optional[List[Any]] = None
+    ) -> UnifiedSearchResponse:
+        """Run the phrase query against the cluster (raises on failure)"""
+        
+        if time.monotonic() < self._circuit_open_until:
+            raise CircuitOpenError("OpenSearch circuit breaker is open")
+        
+        start_time = time.time()
+        phrases = tuple(expanded_phrases)
+        
+        # Clause order does not affect scoring, so the query is built from the
+        # sorted phrases; reordered expansions then send identical JSON and
+        # share the cluster's request cache and our query cache
+        canonical = tuple(sorted(phrases))
+        
+        # Merged msearch pages have no single sort position to resume from
+        use_msearch = bool(search_after is None and self.msearch_batch_size
+                           and len(expanded_phrases) > self.msearch_batch_size)
+        
+        try:
+            if use_msearch:
+                # Split large expansions across one multi-search request
+                response = await self._run(self._msearch_phrase_batches, canonical, limit, offset)
+            else:
+                # Build complete query
+                query_body = {
+                    "query": _analyze_phrases(canonical)[0],
+                    "sort": RESULT_SORT,
+                    "highlight": TITLE_HIGHLIGHT,
+                    "_source": SOURCE_FIELDS,
+                    "size": limit,
+                    **self._search_limits(),
+                    **self._total_hits_limit(offset, limit)
+                }
+                if search_after is not None:
+                    query_body["search_after"] = search_after
+                else:
+                    query_body["from"] = offset
+                
+                # Execute search
+                response = await self._run(
+                    self.client.search,
+                    index=self.index_pattern,
+                    body=query_body,
+                    preference=self.search_preference
+                )
+        except Exception:
+            self._record_search_outcome(failed=True)
+            raise
+        
+        # Timed-out shards still return partial hits, but count as failures
+        self._record_search_outcome(failed=response.get('timed_out', False))
+        
+        # Process results to UnifiedSearchHit format
+        hits = self._process_results_to_unified(
+            response['hits']['hits'],
+            response['hits']['max_score'],
+            phrases,
+            keyword
+        )
+        
+        execution_time = (time.time() - start_time) * 1000
+        
+        # Sort values of the last hit resume the next page via search_after
+        page = response['hits']['hits']
+        next_cursor = page[-1].get('sort') if page and not use_msearch else None
+        
+        return UnifiedSearchResponse(
+            query=keyword,
+            expanded_phrases=expanded_phrases,
+            total_matches=response['hits']['total']['value'],
+            max_score=response['hits']['max_score'] or 1.0,
+            hits=hits,
+            execution_time_ms=round(execution_time, 2),
+            engine_used='opensearch',
+            engine_debug={'next_cursor': next_cursor}
+        )
+    
+    def _search_limits(self) -> Dict[str, Any]:
+        """Server-side timeout and early termination for a search body"""
+        limits = {"timeout": self.search_timeout} if self.search_timeout else {}
+        if self.terminate_after:
+            limits["terminate_after"] = self.terminate_after
+        return limits
+    
+    def _total_hits_limit(self, offset: int, limit: int) -> Dict[str, Any]:
+        """track_total_hits setting for a search body ('page' counts one past the page)"""
+        if self.track_total_hits == 'page':
+            return {"track_total_hits": offset + limit + 1}
+        if self.track_total_hits is not None:
+            return {"track_total_hits": self.track_total_hits}
+        return {}
+    
+    def _record_search_outcome(self, failed: bool):
+        """Track recent failures and open the circuit when they pile up"""
+        if not failed:
+            self._failure_times.clear()
+            return
+        
+        now = time.monotonic()
+        self._failure_times.append(now)
+        while self._failure_times[0] < now - self.circuit_window_s:
+            self._failure_times.popleft()
+        
+        if len(self._failure_times) >= self.circuit_failure_threshold:
+            self._failure_times.clear()
+            self._circuit_open_until = now + self.circuit_cooldown_s
+            logger.warning(
+                f"OpenSearch circuit open for {self.circuit_cooldown_s}s "
+                f"after {self.circuit_failure_threshold} failed searches"
+            )
+    
+    def _store_response(self, key: Tuple, task: "asyncio.Future"):
+        """Cache a finished search (failures are not cached) and evict the oldest entries"""
+        self._pending_searches.pop(key, None)
+        if task.cancelled() or task.exception() is not None:
+            return
+        
+        self._response_cache[key] = (time.monotonic() + self.response_cache_ttl, task.result())
+        self._response_cache.move_to_end(key)
+        while len(self._response_cache) > self.response_cache_size:
+            self._response_cache.popitem(last=False)
+    
     async def get_service_firm_aggregation(
         self,
         filters: Optional[Dict[str, Any]] = None
@@ -273,11 +623,113 @@ class OpenSearchEngine(SearchEngine):
     
     # ===== Private Helper Methods =====
     
+    async def _run(self, func, *args, **kwargs):
+        """
+        Run a blocking client call in the default thread pool so concurrent
+        requests do not serialize on the event loop
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, partial(func, *args, **kwargs))
+    
+    def _ensure_sort_field_template(self):
+        """
+        Map aoc_date as date and give tender_id a keyword subfield in new
+        indices so sorting reads doc_values instead of loading fielddata;
+        existing indices keep their mapping until reindexed
+        """
+        try:
+            self.client.indices.put_template(
+                name=f"{self.index_prefix}-sort-fields",
+                body={"index_patterns": [self.index_pattern], **SORT_FIELDS_TEMPLATE}
+            )
+        except Exception as e:
+            logger.warning(f"Could not install sort field template: {e}")
+    
+    def _enable_concurrent_segment_search(self, mode: str):
+        """
+        Set search.concurrent_segment_search.mode ('auto', 'all' or 'none') so
+        shards score their segments in parallel on the index_searcher pool
+        """
+        try:
+            self.client.cluster.put_settings(body={
+                "persistent": {"search.concurrent_segment_search.mode": mode}
+            })
+            logger.info(f"✓ Concurrent segment search mode: {mode}")
+        except Exception as e:
+            # Older clusters (< 2.17) lack the setting; searches still work
+            logger.warning(f"Could not enable concurrent segment search: {e}")
+    
+    def _msearch_phrase_batches(
+        self,
+        expanded_phrases: Tuple[str, ...],
+        limit: int,
+        offset: int
+    ) -> Dict[str, Any]:
+        """
+        Run groups of msearch_batch_size phrases as sub-queries of a single
+        _msearch request and merge their hits client-side
+        
+        Each sub-query fetches the first offset + limit hits; a document found
+        by several sub-queries keeps its best score, and the merged hits are
+        ordered like RESULT_SORT. The total is the largest sub-query total, a
+        lower bound on the true union. Merged pages cannot be resumed with
+        search_after, so callers get no next_cursor for them.
+        
+        Returns:
+            A search-response-shaped dict with the merged page of hits
+        """
+        batch = self.msearch_batch_size
+        searches = []
+        for start in range(0, len(expanded_phrases), batch):
+            searches.append({"index": self.index_pattern})
+            searches.append({
+                "query": _analyze_phrases(expanded_phrases[start:start + batch])[0],
+                "sort": RESULT_SORT,
+                "highlight": TITLE_HIGHLIGHT,
+                "_source": SOURCE_FIELDS,
+                "size": offset + limit,
+                **self._search_limits(),
+                **self._total_hits_limit(offset, limit)
+            })
+        
+        responses = self.client.msearch(
+            body=searches,
+            preference=self.search_preference
+        )['responses']
+        
+        best_hits = {}
+        total = 0
+        timed_out = False
+        for sub_response in responses:
+            if 'error' in sub_response:
+                raise RuntimeError(f"msearch sub-query failed: {sub_response['error']}")
+            total = max(total, sub_response['hits']['total']['value'])
+            timed_out = timed_out or sub_response.get('timed_out', False)
+            for hit in sub_response['hits']['hits']:
+                best = best_hits.get(hit['_id'])
+                if best is None or hit['_score'] > best['_score']:
+                    best_hits[hit['_id']] = hit
+        
+        # RESULT_SORT order: score desc, aoc_date desc (missing last), tender_id
+        # asc; stable sorts applied from the last key to the first
+        ranked = sorted(best_hits.values(), key=_tender_id_sort_value)
+        ranked.sort(key=_aoc_date_sort_value, reverse=True)
+        ranked.sort(key=lambda hit: hit['_score'], reverse=True)
+        
+        return {
+            'timed_out': timed_out,
+            'hits': {
+                'hits': ranked[offset:offset + limit],
+                'max_score': ranked[0]['_score'] if ranked else None,
+                'total': {'value': total}
+            }
+        }
+    
     def _process_results_to_unified(
         self,
         opensearch_hits: List[Dict],
         max_score: float,
-        expanded_phrases: List[str],
+        expanded_phrases: Tuple[str, ...],
         keyword: str
     ) -> List[UnifiedSearchHit]:
         """Convert OpenSearch hits to UnifiedSearchHit objects"""
@@ -285,23 +737,44 @@ class OpenSearchEngine(SearchEngine):
         if not opensearch_hits:
             return []
         
+        phrase_meta = _analyze_phrases(expanded_phrases)[1]
+        
         hits = []
         max_score = max_score or 1.0
         
+        append = hits.append
+        
         for hit in opensearch_hits:
             source = hit['_source']
             score = hit['_score']
+            title = source.get('title', '')
+            financial = source.get('financial_data') or {}
+            intel = source.get('competitive_intelligence') or {}
             similarity_percent = int((score / max_score) * 100) if max_score > 0 else 0
             
-            # Determine matched phrases
-            title_lower = source.get('title', '').lower()
-            matched_phrases = [p for p in expanded_phrases if p.lower() in title_lower]
+            # A phrase matched if it occurs in the title or the server
+            # highlighted all of its words. Highlighted terms are surface
+            # forms split by the analyzer ("networking", "e" + "procurement"),
+            # so the substring check still catches stemmed and hyphenated
+            # phrases. A matched multi-word phrase makes the hit an exact match
+            matched_phrases = []
+            exact_match = False
+            title_lower = title.lower()
+            fragments = hit.get('highlight', {}).get('title')
+            terms = _highlighted_terms(fragments[0]) if fragments else frozenset()
+            for phrase, lowered, words, multi in phrase_meta:
+                if lowered in title_lower or (terms and terms.issuperset(words)):
+                    matched_phrases.append(phrase)
+                    exact_match = exact_match or multi
+            highlight_snippets = (
+                {'title': [f.translate(HIGHLIGHT_TAGS) for f in fragments]} if fragments else None
+            )
             if not matched_phrases:
                 matched_phrases = [keyword]
             
-            hits.append(UnifiedSearchHit(
+            append(UnifiedSearchHit(
                 tender_id=source.get('tender_id', ''),
-                title=source.get('title', ''),
+                title=title,
                 organization=source.get('organization', ''),
                 status=source.get('status', ''),
                 aoc_date=source.get('aoc_date', ''),
@@ -309,16 +782,17 @@ class OpenSearchEngine(SearchEngine):
                 raw_score=score,
                 similarity_percent=similarity_percent,
                 matched_phrases=matched_phrases,
-                exact_match=any(p.lower() in title_lower for p in expanded_phrases if " " in p),
+                highlight_snippets=highlight_snippets,
+                exact_match=exact_match,
                 # Financial data from nested object
-                award_value=source.get('financial_data', {}).get('award_value'),
-                currency=source.get('financial_data', {}).get('currency'),
-                inr_normalized_value=source.get('financial_data', {}).get('inr_normalized_value'),
-                deal_size_category=source.get('financial_data', {}).get('deal_size_category'),
+                award_value=financial.get('award_value'),
+                currency=financial.get('currency'),
+                inr_normalized_value=financial.get('inr_normalized_value'),
+                deal_size_category=financial.get('deal_size_category'),
                 # Competitive intelligence from nested object
-                service_category=source.get('competitive_intelligence', {}).get('service_category'),
-                detected_firms=source.get('competitive_intelligence', {}).get('detected_firms'),
-                region=source.get('competitive_intelligence', {}).get('region')
+                service_category=intel.get('service_category'),
+                detected_firms=intel.get('detected_firms'),
+                region=intel.get('region')
             ))
         
         return hits
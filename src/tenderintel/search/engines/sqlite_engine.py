@@ -4,13 +4,22 @@ SQLite FTS5 Search Engine Implementation
 Production-grade search engine implementing the SearchEngine abstract base class
 """
 
+import asyncio
+import queue
+import re
 import sqlite3
+import threading
 import time
-from typing import Dict, Any, List, Optional
+from collections import defaultdict, namedtuple
+from contextlib import contextmanager
+from functools import lru_cache, partial
+from typing import Dict, Any, FrozenSet, Iterable, Iterator, List, Optional, Set, Tuple
 from pathlib import Path
 import logging
 from datetime import datetime
 
+import ahocorasick
+
 # Import abstract base class
 from ..base import (
     SearchEngine, SearchEngineType, EngineCapabilities,
@@ -23,6 +32,151 @@ from ..synonym_manager import SynonymManager
 
 logger = logging.getLogger(__name__)
 
+# FTS5 query syntax characters replaced by spaces in search phrases
+FTS5_SPECIAL_CHARS = re.compile(r'[@#$%^&*+=|\\:;"\'<>,.?/]')
+
+# Search result columns in SearchRow order, keyed by the UnifiedSearchHit
+# field each one fills
+SEARCH_COLUMNS = (
+    ("title", "title"),
+    ("organization", "org"),
+    ("status", "status"),
+    ("aoc_date", "aoc_date"),
+    ("tender_id", "tender_id"),
+    ("url", "url"),
+    ("service_category", "service_category"),
+    ("value_range", "value_range"),
+    ("region", "region"),
+    ("department_type", "department_type"),
+    ("complexity", "complexity"),
+    ("keywords", "keywords"),
+)
+SEARCH_FIELDS = frozenset(field for field, _ in SEARCH_COLUMNS)
+
+# Fields every search returns whatever the projection: the title is
+# needed for phrase matching and the tender ID identifies the hit
+REQUIRED_SEARCH_FIELDS = frozenset({"title", "tender_id"})
+
+SEARCH_SQL_TEMPLATE = """
+    SELECT {columns}, bm25(tenders) as bm25_score
+    FROM tenders
+    WHERE tenders MATCH ?
+    ORDER BY bm25_score ASC
+    LIMIT ? OFFSET ?
+"""
+
+
+@lru_cache(maxsize=64)
+def _search_sql(projection: Optional[FrozenSet[str]]) -> str:
+    """
+    Search statement selecting NULL in place of the columns whose hit fields
+    are not in projection (None selects every column); the row layout stays
+    the same, so each projection is still read into SearchRow tuples
+    """
+    columns = ", ".join(
+        column
+        if projection is None or field in projection or field in REQUIRED_SEARCH_FIELDS
+        else f"NULL AS {column}"
+        for field, column in SEARCH_COLUMNS
+    )
+    return SEARCH_SQL_TEMPLATE.format(columns=columns)
+
+
+# Statements the engine runs; kept as constants so pooled connections
+# reuse their prepared forms from the sqlite3 statement cache
+COUNT_SQL = "SELECT COUNT(*) FROM tenders WHERE tenders MATCH ?"
+FACETS_SQL = """
+    SELECT service_category, org, region, COUNT(*) as count
+    FROM tenders
+    GROUP BY service_category, org, region
+"""
+FTS5_PROBE_SQL = "SELECT 1 FROM tenders WHERE tenders MATCH 'test' LIMIT 1"
+INTEGRITY_SQL = "PRAGMA quick_check"
+RECORD_COUNT_SQL = "SELECT COUNT(*) FROM tenders"
+CONTENT_SIGNATURE_SQL = "SELECT COUNT(*), MAX(id) FROM tenders_docsize"
+WAL_CHECKPOINT_SQL = "PRAGMA wal_checkpoint(PASSIVE)"
+
+# Per-connection prepared statement cache; comfortably above the number
+# of distinct statements above
+STATEMENT_CACHE_SIZE = 32
+
+# One row of the search query, in SELECT column order
+SearchRow = namedtuple(
+    "SearchRow",
+    "title org status aoc_date tender_id url service_category value_range "
+    "region department_type complexity keywords bm25_score"
+)
+
+
+def _search_row_factory(cursor: sqlite3.Cursor, row: tuple) -> SearchRow:
+    """Cursor row factory that returns search rows as SearchRow tuples"""
+    return SearchRow._make(row)
+
+
+# Rows fetched per fetchmany() call while streaming search results
+SEARCH_FETCH_SIZE = 64
+
+
+def _stream_rows(cursor: sqlite3.Cursor, first_batch: List[SearchRow]) -> Iterator[SearchRow]:
+    """Yield an already-fetched batch, then the rest of the cursor batch by batch"""
+    batch = first_batch
+    while batch:
+        yield from batch
+        batch = cursor.fetchmany()
+
+
+@lru_cache(maxsize=16384)
+def _sanitize_fts5_phrase(phrase: str) -> str:
+    """Replace FTS5 special characters with spaces and collapse whitespace"""
+    if not phrase:
+        return ""
+    return ' '.join(FTS5_SPECIAL_CHARS.sub(' ', phrase).split())
+
+
+@lru_cache(maxsize=4096)
+def _build_fts5_match(phrases: Tuple[str, ...]) -> str:
+    """
+    OR together sanitized phrases, longest first; multi-word phrases are
+    quoted. Cached per expansion since popular searches repeat it.
+    """
+    query_parts = []
+    sorted_phrases = sorted(phrases, key=lambda p: len(p.split()), reverse=True)
+    
+    for phrase in sorted_phrases:
+        # Sanitize phrase to remove FTS5 special characters
+        sanitized_phrase = _sanitize_fts5_phrase(phrase)
+        if not sanitized_phrase:
+            continue
+            
+        if " " in sanitized_phrase:
+            query_parts.append(f'"{sanitized_phrase}"')
+        else:
+            query_parts.append(sanitized_phrase)
+    
+    return " OR ".join(query_parts)
+
+
+@lru_cache(maxsize=4096)
+def _split_keywords(keywords: str) -> Tuple[str, ...]:
+    """Comma-separated keyword column split once per distinct value"""
+    return tuple(keywords.split(','))
+
+
+@lru_cache(maxsize=256)
+def _phrase_automaton(phrases_lower: Tuple[str, ...]) -> Optional["ahocorasick.Automaton"]:
+    """
+    Aho-Corasick automaton over the lowercased phrases, so one scan of a title
+    finds every phrase it contains (None when no phrase is non-empty)
+    """
+    automaton = ahocorasick.Automaton()
+    for phrase in phrases_lower:
+        if phrase:
+            automaton.add_word(phrase, phrase)
+    if not len(automaton):
+        return None
+    automaton.make_automaton()
+    return automaton
+
 
 class SQLiteFTS5Engine(SearchEngine):
     """
@@ -56,8 +210,37 @@ class SQLiteFTS5Engine(SearchEngine):
         if not self.db_path.exists():
             raise FileNotFoundError(f"Database not found: {self.db_path}")
         
+        # Long-lived connections keep the page cache and per-connection
+        # pragmas across queries; opened lazily up to connection_pool_size
+        self._pool_size = max(1, self.config.get('connection_pool_size', 5))
+        self._conn_pool = queue.LifoQueue()
+        self._connections = []
+        self._pool_lock = threading.Lock()
+        
+        # How long a connection waits on a locked database before failing
+        self._busy_timeout_ms = self.config.get('busy_timeout_ms', 5000)
+        
+        # Ingestion writes go through the WAL; searches trigger a passive
+        # checkpoint at most every wal_checkpoint_interval_s seconds so the
+        # log is recycled instead of growing (0 disables)
+        self._checkpoint_interval = (
+            self.config.get('wal_checkpoint_interval_s', 30)
+            if self.config.get('enable_wal', True) else 0
+        )
+        self._next_checkpoint = 0.0
+        self._checkpoint_lock = threading.Lock()
+        
+        # Facet values change only on ingest, so filter options are reused
+        # for filter_options_ttl_s seconds
+        self._filter_options_ttl = self.config.get('filter_options_ttl_s', 60)
+        self._filter_options_cache = None
+        
+        # Health probes are answered from the last result for
+        # health_cache_ttl_s seconds
+        self._health_cache_ttl = self.config.get('health_cache_ttl_s', 5)
+        self._health_cache = None
+        
         # Apply SQLite optimizations
-        self._conn_pool = []
         self._apply_optimizations()
         
         # Initialize synonym manager for keyword expansion
@@ -82,16 +265,34 @@ class SQLiteFTS5Engine(SearchEngine):
     
     async def health_check(self) -> EngineHealthStatus:
         """Check if SQLite database is healthy"""
+        return await self._run(self._health_check_sync)
+    
+    def _health_check_sync(self) -> EngineHealthStatus:
+        """
+        Synchronous implementation of the health check; the result is
+        reused for health_cache_ttl_s so frequent probes stay cheap
+        """
+        cached = self._health_cache
+        now = time.monotonic()
+        if cached is not None and cached[0] > now:
+            return cached[1]
+        
+        status = self._probe_health()
+        self._health_cache = (now + self._health_cache_ttl, status)
+        return status
+    
+    def _probe_health(self) -> EngineHealthStatus:
+        """Run the connectivity, FTS5 and quick integrity checks"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connection() as conn:
                 # Test basic connectivity
                 conn.execute("SELECT 1").fetchone()
                 
                 # Test FTS5 functionality
-                conn.execute("SELECT COUNT(*) FROM tenders WHERE tenders MATCH 'test'").fetchone()
+                conn.execute(FTS5_PROBE_SQL).fetchone()
                 
                 # Check integrity
-                integrity = conn.execute("PRAGMA integrity_check").fetchone()[0]
+                integrity = conn.execute(INTEGRITY_SQL).fetchone()[0]
                 
                 is_healthy = integrity == "ok"
                 
@@ -111,9 +312,13 @@ class SQLiteFTS5Engine(SearchEngine):
     
     async def get_statistics(self) -> EngineStatistics:
         """Get engine statistics"""
+        return await self._run(self._get_statistics_sync)
+    
+    def _get_statistics_sync(self) -> EngineStatistics:
+        """Synchronous implementation of statistics retrieval"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                record_count = conn.execute("SELECT COUNT(*) FROM tenders").fetchone()[0]
+            with self._connection() as conn:
+                record_count = conn.execute(RECORD_COUNT_SQL).fetchone()[0]
                 db_size_mb = self.db_path.stat().st_size / (1024 * 1024)
                 
                 return EngineStatistics(
@@ -143,9 +348,21 @@ class SQLiteFTS5Engine(SearchEngine):
         limit: int = 25,
         offset: int = 0,
         include_aggregations: bool = False,
-        debug: bool = False
+        debug: bool = False,
+        projection: Optional[Set[str]] = None
     ) -> UnifiedSearchResponse:
-        """Execute search with expansion, filtering, and BM25 ranking"""
+        """
+        Execute search with expansion, filtering, and BM25 ranking
+        
+        projection optionally names the UnifiedSearchHit fields to load
+        (see SEARCH_FIELDS); title and tender_id are always loaded and the
+        other fields are left empty. Useful for light list views.
+        """
+        if projection is not None:
+            unknown = set(projection) - SEARCH_FIELDS
+            if unknown:
+                raise ValueError(f"Unknown projection fields: {sorted(unknown)}")
+            projection = frozenset(projection)
         
         start_time = time.time()
         
@@ -164,30 +381,16 @@ class SQLiteFTS5Engine(SearchEngine):
                     engine_used='sqlite'
                 )
             
-            # Execute search
-            with sqlite3.connect(self.db_path) as conn:
-                sql = """
-                SELECT title, org, status, aoc_date, tender_id, url,
-                       service_category, value_range, region, department_type,
-                       complexity, keywords, bm25(tenders) as bm25_score
-                FROM tenders 
-                WHERE tenders MATCH ?
-                ORDER BY bm25_score ASC
-                LIMIT ? OFFSET ?
-                """
-                
-                cursor = conn.execute(sql, [fts5_query, limit, offset])
-                rows = cursor.fetchall()
-                
-                # Get total count
-                count_cursor = conn.execute(
-                    "SELECT COUNT(*) FROM tenders WHERE tenders MATCH ?",
-                    [fts5_query]
-                )
-                total_matches = count_cursor.fetchone()[0]
+            # Execute search and build hits in a worker thread
+            hits, total_matches, max_score = await self._run(
+                self._execute_search_sync,
+                fts5_query, limit, offset, expanded_phrases, keyword, projection
+            )
             
-            # Process results
-            hits = self._process_results_to_unified(rows, expanded_phrases, keyword)
+            now = time.monotonic()
+            if self._checkpoint_interval and now >= self._next_checkpoint:
+                self._next_checkpoint = now + self._checkpoint_interval
+                asyncio.get_running_loop().run_in_executor(None, self._checkpoint_wal)
             
             execution_time = (time.time() - start_time) * 1000
             
@@ -195,7 +398,7 @@ class SQLiteFTS5Engine(SearchEngine):
                 query=keyword,
                 expanded_phrases=expanded_phrases,
                 total_matches=total_matches,
-                max_score=abs(min(row[12] for row in rows)) if rows else 1.0,
+                max_score=max_score,
                 hits=hits,
                 execution_time_ms=round(execution_time, 2),
                 engine_used='sqlite'
@@ -239,96 +442,217 @@ class SQLiteFTS5Engine(SearchEngine):
     
     async def get_filter_options(self) -> Dict[str, Any]:
         """Get available filter options - wraps sync method"""
-        return self._get_filter_options_sync()
+        return await self._run(self._get_filter_options_sync)
     
     # ===== Private Helper Methods =====
     
+    async def _run(self, func, *args):
+        """
+        Run a blocking database call in the default thread pool so concurrent
+        requests do not serialize on the event loop
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, partial(func, *args))
+    
+    def _execute_search_sync(
+        self,
+        fts5_query: str,
+        limit: int,
+        offset: int,
+        expanded_phrases: List[str],
+        keyword: str,
+        projection: Optional[FrozenSet[str]] = None
+    ) -> Tuple[List[UnifiedSearchHit], int, float]:
+        """
+        Fetch one page of ranked matches, streaming rows straight into hits;
+        returns (hits, total match count, max absolute BM25 score)
+        """
+        with self._connection() as conn:
+            cursor = conn.cursor()
+            cursor.row_factory = _search_row_factory
+            cursor.arraysize = SEARCH_FETCH_SIZE
+            cursor.execute(_search_sql(projection), [fts5_query, limit, offset])
+            
+            # Rows arrive best (most negative BM25) first, so the first row
+            # carries the max score and the rest can be converted as fetched
+            first_batch = cursor.fetchmany()
+            max_score = abs(first_batch[0].bm25_score) if first_batch else 1.0
+            hits = self._process_results_to_unified(
+                _stream_rows(cursor, first_batch), expanded_phrases, keyword, max_score
+            )
+            
+            # Get total count. This stays a separate statement: an
+            # unscored FTS5 count is cheap, whereas COUNT(*) OVER ()
+            # has to materialize and sort every matching row.
+            count_cursor = conn.execute(COUNT_SQL, [fts5_query])
+            return hits, count_cursor.fetchone()[0], max_score
+    
     def _get_filter_options_sync(self) -> Dict[str, Any]:
-        """Synchronous implementation of filter options retrieval"""
+        """
+        Synchronous implementation of filter options retrieval
+        
+        Results are reused for filter_options_ttl_s; after that the table is
+        only rescanned if rows were inserted or deleted in the meantime.
+        """
+        cached = self._filter_options_cache
+        now = time.monotonic()
+        if cached is not None and cached[0] > now:
+            return cached[2]
+        
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                # Get unique service categories
-                categories = conn.execute("""
-                    SELECT DISTINCT service_category, COUNT(*) as count
-                    FROM tenders
-                    WHERE service_category IS NOT NULL
-                    GROUP BY service_category
-                    ORDER BY service_category
-                """).fetchall()
-                
-                # Get unique organizations
-                organizations = conn.execute("""
-                    SELECT org, COUNT(*) as count
-                    FROM tenders
-                    GROUP BY org
-                    ORDER BY count DESC
-                    LIMIT 50
-                """).fetchall()
+            with self._connection() as conn:
+                signature = self._content_signature(conn)
+                if cached is not None and signature is not None and signature == cached[1]:
+                    self._filter_options_cache = (now + self._filter_options_ttl, signature, cached[2])
+                    return cached[2]
                 
-                # Get unique regions
-                regions = conn.execute("""
-                    SELECT DISTINCT region, COUNT(*) as count
-                    FROM tenders
-                    WHERE region IS NOT NULL
-                    GROUP BY region
-                    ORDER BY region
-                """).fetchall()
-                
-                return {
-                    "service_categories": [{"value": cat, "label": cat, "count": count} for cat, count in categories],
-                    "organizations": [{"value": org, "label": org, "count": count} for org, count in organizations],
-                    "regions": [{"value": reg, "label": reg, "count": count} for reg, count in regions]
-                }
+                # One scan of the table grouped by all three facets; the
+                # per-facet counts are summed from the (few) combinations
+                combinations = conn.execute(FACETS_SQL).fetchall()
+            
+            category_counts = defaultdict(int)
+            org_counts = defaultdict(int)
+            region_counts = defaultdict(int)
+            for category, org, region, count in combinations:
+                category_counts[category] += count
+                org_counts[org] += count
+                region_counts[region] += count
+            
+            # Unique service categories and regions by name; the 50 largest
+            # organizations (ties by name, NULL first as in SQL)
+            categories = sorted((c, n) for c, n in category_counts.items() if c is not None)
+            organizations = sorted(
+                org_counts.items(),
+                key=lambda item: (-item[1], item[0] is not None, item[0] or "")
+            )[:50]
+            regions = sorted((r, n) for r, n in region_counts.items() if r is not None)
+            
+            options = {
+                "service_categories": [{"value": cat, "label": cat, "count": count} for cat, count in categories],
+                "organizations": [{"value": org, "label": org, "count": count} for org, count in organizations],
+                "regions": [{"value": reg, "label": reg, "count": count} for reg, count in regions]
+            }
+            self._filter_options_cache = (now + self._filter_options_ttl, signature, options)
+            return options
         except Exception as e:
             logger.error(f"Failed to get filter options: {e}")
             return {"error": str(e)}
     
+    def _content_signature(self, conn: sqlite3.Connection) -> Optional[tuple]:
+        """
+        (row count, max rowid) of the FTS5 docsize shadow table - an index-only
+        read that changes whenever tenders are inserted or deleted (None if
+        the table has no docsize shadow table)
+        """
+        try:
+            return conn.execute(CONTENT_SIGNATURE_SQL).fetchone()
+        except sqlite3.OperationalError:
+            return None
+    
+    def _open_connection(self) -> sqlite3.Connection:
+        """
+        Open a pooled read-only connection with the per-connection pragmas
+        applied; every query the engine serves is a read
+        """
+        conn = sqlite3.connect(
+            f"{self.db_path.resolve().as_uri()}?mode=ro",
+            uri=True,
+            check_same_thread=False,
+            timeout=self._busy_timeout_ms / 1000,
+            cached_statements=STATEMENT_CACHE_SIZE
+        )
+        
+        cache_size = -1 * self.config.get('cache_size_kb', 64000)
+        mmap_size = self.config.get('mmap_size_mb', 256) * 1024 * 1024
+        
+        conn.executescript(
+            f"PRAGMA cache_size = {cache_size};"
+            "PRAGMA temp_store = MEMORY;"
+            f"PRAGMA mmap_size = {mmap_size};"
+            "PRAGMA query_only = ON;"
+        )
+        return conn
+    
+    def _open_write_connection(self) -> sqlite3.Connection:
+        """Open a short-lived writable connection for maintenance pragmas"""
+        conn = sqlite3.connect(self.db_path, timeout=self._busy_timeout_ms / 1000)
+        conn.execute("PRAGMA synchronous = NORMAL")
+        return conn
+    
+    def _checkpoint_wal(self):
+        """
+        Passive WAL checkpoint: copies committed pages into the database
+        without waiting on readers or writers, so the next writer can restart
+        the log from the beginning
+        """
+        if not self._checkpoint_lock.acquire(blocking=False):
+            return
+        try:
+            conn = self._open_write_connection()
+            try:
+                conn.execute(WAL_CHECKPOINT_SQL).fetchone()
+            finally:
+                conn.close()
+        except Exception as e:
+            logger.warning(f"WAL checkpoint failed: {e}")
+        finally:
+            self._checkpoint_lock.release()
+    
+    @contextmanager
+    def _connection(self) -> Iterator[sqlite3.Connection]:
+        """Borrow a pooled connection, opening one if the pool is not yet full"""
+        try:
+            conn = self._conn_pool.get_nowait()
+        except queue.Empty:
+            with self._pool_lock:
+                conn = None
+                if len(self._connections) < self._pool_size:
+                    conn = self._open_connection()
+                    self._connections.append(conn)
+            if conn is None:
+                conn = self._conn_pool.get()
+        
+        try:
+            yield conn
+        finally:
+            self._conn_pool.put(conn)
+    
+    def close(self):
+        """Close all pooled connections"""
+        with self._pool_lock:
+            for conn in self._connections:
+                conn.close()
+            self._connections.clear()
+            self._conn_pool = queue.LifoQueue()
+    
     def _apply_optimizations(self):
-        """Apply SQLite performance optimizations"""
+        """Apply database-wide SQLite optimizations (see _open_connection for per-connection ones)"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cache_size = -1 * self.config.get('cache_size_kb', 64000)
-                mmap_size = self.config.get('mmap_size_mb', 256) * 1024 * 1024
-                
-                conn.execute(f"PRAGMA cache_size = {cache_size}")
-                conn.execute("PRAGMA temp_store = MEMORY")
-                conn.execute(f"PRAGMA mmap_size = {mmap_size}")
-                conn.execute("PRAGMA page_size = 4096")
+            conn = self._open_write_connection()
+            try:
+                # Page size is fixed when DatabaseManager creates the database;
+                # it cannot change once tables exist in WAL mode
+                pragmas = []
                 
                 if self.config.get('enable_wal', True):
-                    conn.execute("PRAGMA journal_mode = WAL")
-                
-                conn.execute("PRAGMA synchronous = NORMAL")
+                    pragmas.append("PRAGMA journal_mode = WAL;")
                 
                 if self.config.get('optimize_on_startup', True):
-                    conn.execute("PRAGMA optimize")
+                    pragmas.append("PRAGMA optimize;")
                 
+                conn.executescript("".join(pragmas))
                 logger.debug("SQLite optimizations applied")
+            finally:
+                conn.close()
         except Exception as e:
             logger.warning(f"Could not apply all optimizations: {e}")
     
     def _build_fts5_query(self, phrases: List[str]) -> str:
         """Build FTS5 MATCH query from phrases with special character sanitization"""
-        if not phrases:
-            return ""
-        
-        query_parts = []
-        sorted_phrases = sorted(phrases, key=lambda p: len(p.split()), reverse=True)
-        
-        for phrase in sorted_phrases:
-            # Sanitize phrase to remove FTS5 special characters
-            sanitized_phrase = self._sanitize_fts5_input(phrase)
-            if not sanitized_phrase:
-                continue
-                
-            if " " in sanitized_phrase:
-                query_parts.append(f'"{sanitized_phrase}"')
-            else:
-                query_parts.append(sanitized_phrase)
-        
-        return " OR ".join(query_parts) if query_parts else ""
+        return _build_fts5_match(tuple(phrases))
     
-    def _sanitize_fts5_input(self, phrase: str) -> str:
+    @staticmethod
+    def _sanitize_fts5_input(phrase: str) -> str:
         """
         Sanitize input for FTS5 to handle special characters gracefully
         
@@ -341,60 +665,58 @@ class SQLiteFTS5Engine(SearchEngine):
         Returns:
             Sanitized phrase safe for FTS5 queries
         """
-        import re
-        
-        if not phrase:
-            return ""
-        
-        # Remove FTS5 special characters and replace with space
-        sanitized = re.sub(r'[@#$%^&*+=|\\:;"\'<>,.?/]', ' ', phrase)
-        
-        # Clean up multiple spaces and strip
-        sanitized = ' '.join(sanitized.split())
-        
-        return sanitized.strip()
+        return _sanitize_fts5_phrase(phrase)
     
     def _process_results_to_unified(
         self,
-        rows: List[tuple],
+        rows: Iterable[SearchRow],
         expanded_phrases: List[str],
-        keyword: str
+        keyword: str,
+        max_score: float
     ) -> List[UnifiedSearchHit]:
-        """Convert SQLite rows to UnifiedSearchHit objects"""
-        
-        if not rows:
-            return []
+        """Convert SQLite rows to UnifiedSearchHit objects (max_score: largest absolute BM25 score)"""
         
         hits = []
-        bm25_scores = [abs(row[12]) for row in rows]
-        max_score = max(bm25_scores) if bm25_scores else 1.0
+        hits_append = hits.append
+        
+        # Lowercase the phrases once; each title is then scanned a single time
+        phrases_lower = tuple(p.lower() for p in expanded_phrases)
+        multi_word = frozenset(p for p in phrases_lower if " " in p)
+        automaton = _phrase_automaton(phrases_lower)
+        # An empty phrase is a substring of every title
+        always_found = frozenset(p for p in phrases_lower if not p)
         
         for row in rows:
-            raw_score = abs(row[12])
+            raw_score = abs(row.bm25_score)
             similarity_percent = int((raw_score / max_score) * 100) if max_score > 0 else 0
             
-            title_lower = row[0].lower()
-            matched_phrases = [p for p in expanded_phrases if p.lower() in title_lower]
+            title_lower = row.title.lower()
+            found = always_found
+            if automaton is not None:
+                found = found.union(phrase for _, phrase in automaton.iter(title_lower))
+            matched_phrases = [
+                p for p, lowered in zip(expanded_phrases, phrases_lower) if lowered in found
+            ]
             if not matched_phrases:
                 matched_phrases = [keyword]
             
-            hits.append(UnifiedSearchHit(
-                tender_id=row[4],
-                title=row[0],
-                organization=row[1],
-                status=row[2],
-                aoc_date=row[3],
-                url=row[5],
+            hits_append(UnifiedSearchHit(
+                tender_id=row.tender_id,
+                title=row.title,
+                organization=row.org,
+                status=row.status,
+                aoc_date=row.aoc_date,
+                url=row.url,
                 raw_score=raw_score,
                 similarity_percent=similarity_percent,
                 matched_phrases=matched_phrases,
-                exact_match=any(p.lower() in title_lower for p in expanded_phrases if " " in p),
-                service_category=row[6],
-                value_range=row[7],
-                region=row[8],
-                department_type=row[9],
-                complexity=row[10],
-                keywords=row[11].split(',') if row[11] else []
+                exact_match=not multi_word.isdisjoint(found),
+                service_category=row.service_category,
+                value_range=row.value_range,
+                region=row.region,
+                department_type=row.department_type,
+                complexity=row.complexity,
+                keywords=list(_split_keywords(row.keywords)) if row.keywords else []
             ))
         
         return hits
@@ -402,8 +724,8 @@ class SQLiteFTS5Engine(SearchEngine):
     def _validate_fts5_support(self):
         """Validate that SQLite has FTS5 support enabled"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                conn.execute("SELECT COUNT(*) FROM tenders WHERE tenders MATCH 'test'").fetchone()
+            with self._connection() as conn:
+                conn.execute(FTS5_PROBE_SQL).fetchone()
                 logger.debug("FTS5 functionality validated")
         except Exception as e:
             logger.error(f"FTS5 validation failed: {e}")
@@ -6,7 +6,12 @@ Single interface that handles engine selection, fallback, and transparent routin
 
 import logging
 import asyncio
-from typing import Dict, Any, Optional, List
+import copy
+import json
+import threading
+import time
+from functools import partial
+from typing import Dict, Any, Optional, List, Tuple
 from datetime import datetime
 
 from .base import (
@@ -50,6 +55,24 @@ class UnifiedSearchManager:
         # Current active engine
         self.current_engine: Optional[SearchEngine] = None
         
+        # Private event loop for the startup/reload health probe, created on
+        # first use and reused instead of a fresh asyncio.run() loop per probe
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_lock = threading.Lock()
+        
+        # Engine statistics and filter options change slowly, so dashboard
+        # polling is answered from (expires, engine, value) entries for a few
+        # seconds; engine health is always checked live
+        self._engine_info_ttl = self.search_config.get('engine_info_cache_ttl_s', 30)
+        self._filter_options_ttl = self.search_config.get('filter_options_cache_ttl_s', 300)
+        self._engine_info_cache: Optional[tuple] = None
+        self._filter_options_cache: Optional[tuple] = None
+        
+        # Identical searches already in flight share one engine call; filter
+        # options are warmed in the background alongside the first search
+        self._pending_searches: Dict[Tuple, "asyncio.Future"] = {}
+        self._filter_options_warmup: Optional["asyncio.Future"] = None
+        
         # Initialize engine with fallback logic
         self._initialize_engine()
     
@@ -118,7 +141,7 @@ class UnifiedSearchManager:
             engine = OpenSearchEngine(opensearch_config)
             
             # Test connection with timeout
-            health = asyncio.run(
+            health = self._run_sync(
                 asyncio.wait_for(engine.health_check(), timeout=5.0)
             )
             
@@ -149,6 +172,13 @@ class UnifiedSearchManager:
             )
             return self._initialize_sqlite()
     
+    def _run_sync(self, coro):
+        """Run a coroutine to completion on the manager's private event loop"""
+        with self._loop_lock:
+            if self._loop is None or self._loop.is_closed():
+                self._loop = asyncio.new_event_loop()
+            return self._loop.run_until_complete(coro)
+    
     def _initialize_sqlite(self) -> SearchEngine:
         """
         Initialize SQLite engine - should always succeed
@@ -198,6 +228,28 @@ class UnifiedSearchManager:
         Returns:
             UnifiedSearchResponse with consistent structure
         """
+        if self._filter_options_cache is None and self._filter_options_warmup is None:
+            self._filter_options_warmup = asyncio.ensure_future(self._warm_filter_options())
+        
+        key = (keyword, json.dumps(filters, sort_keys=True, default=str), limit, offset, debug)
+        pending = self._pending_searches.get(key)
+        if pending is None:
+            pending = asyncio.ensure_future(self._search(keyword, filters, limit, offset, debug))
+            self._pending_searches[key] = pending
+            pending.add_done_callback(partial(self._search_done, key))
+        
+        # Copies keep concurrent callers from sharing one response or its hits
+        return (await asyncio.shield(pending)).copy()
+    
+    async def _search(
+        self,
+        keyword: str,
+        filters: Optional[Dict[str, Any]],
+        limit: int,
+        offset: int,
+        debug: bool
+    ) -> UnifiedSearchResponse:
+        """Expand the keyword and run the search on the current engine"""
         
         # Step 1: Expand keyword (engine-agnostic)
         expansion = self.synonym_manager.expand_keyword(keyword)
@@ -218,6 +270,18 @@ class UnifiedSearchManager:
         
         return result
     
+    def _search_done(self, key: Tuple, future: "asyncio.Future"):
+        """Forget a finished in-flight search"""
+        if self._pending_searches.get(key) is future:
+            del self._pending_searches[key]
+    
+    async def _warm_filter_options(self):
+        """Load filter options into the cache while the first search runs"""
+        try:
+            await self.get_filter_options()
+        except Exception as e:
+            logger.warning(f"Filter options warmup failed: {e}")
+    
     async def get_service_firm_heatmap(
         self,
         filters: Optional[Dict[str, Any]] = None
@@ -270,33 +334,58 @@ class UnifiedSearchManager:
         Returns:
             Available categories, organizations, regions for UI dropdowns
         """
-        return await self.current_engine.get_filter_options()
+        engine = self.current_engine
+        cached = self._filter_options_cache
+        if cached is not None and cached[1] is engine and cached[0] > time.monotonic():
+            return cached[2]
+        
+        options = await engine.get_filter_options()
+        if 'error' not in options:
+            self._filter_options_cache = (time.monotonic() + self._filter_options_ttl, engine, options)
+        return options
     
     async def get_engine_info(self) -> Dict[str, Any]:
         """
         Get information about current engine and recommendations
         
+        Health is checked on every call; statistics and the recommendation
+        are reused for engine_info_cache_ttl_s seconds.
+        
         Returns:
             Engine type, capabilities, health, statistics, and recommendations
         """
+        engine = self.current_engine
+        health = await engine.health_check()
         
-        # Get engine health and statistics
-        health = await self.current_engine.health_check()
-        stats = await self.current_engine.get_statistics()
-        
-        # Get recommendation based on usage
-        recommendation = self._get_recommendation(stats)
+        cached = self._engine_info_cache
+        if cached is not None and cached[1] is engine and cached[0] > time.monotonic():
+            statistics, recommendation = cached[2]
+        else:
+            stats = await engine.get_statistics()
+            statistics = {
+                'record_count': stats.record_count,
+                'index_size_mb': stats.index_size_mb,
+                'avg_query_time_ms': stats.avg_query_time_ms,
+                'last_updated': stats.last_updated.isoformat()
+            }
+            
+            # Get recommendation based on usage
+            recommendation = self._get_recommendation(stats)
+            self._engine_info_cache = (
+                time.monotonic() + self._engine_info_ttl, engine, (statistics, recommendation)
+            )
         
+        capabilities = engine.capabilities
         return {
-            'engine_type': self.current_engine.engine_type.value,
-            'engine_name': self.current_engine.capabilities.name,
+            'engine_type': engine.engine_type.value,
+            'engine_name': capabilities.name,
             'capabilities': {
-                'max_records': self.current_engine.capabilities.max_recommended_records,
-                'max_users': self.current_engine.capabilities.max_concurrent_users,
-                'setup_complexity': self.current_engine.capabilities.setup_complexity,
-                'operational_overhead': self.current_engine.capabilities.operational_overhead,
-                'supports_distributed': self.current_engine.capabilities.supports_distributed_search,
-                'features': self.current_engine.capabilities.features
+                'max_records': capabilities.max_recommended_records,
+                'max_users': capabilities.max_concurrent_users,
+                'setup_complexity': capabilities.setup_complexity,
+                'operational_overhead': capabilities.operational_overhead,
+                'supports_distributed': capabilities.supports_distributed_search,
+                'features': list(capabilities.features)
             },
             'health': {
                 'is_healthy': health.is_healthy,
@@ -304,13 +393,9 @@ class UnifiedSearchManager:
                 'message': health.message,
                 'details': health.details
             },
-            'statistics': {
-                'record_count': stats.record_count,
-                'index_size_mb': stats.index_size_mb,
-                'avg_query_time_ms': stats.avg_query_time_ms,
-                'last_updated': stats.last_updated.isoformat()
-            },
-            'recommendation': recommendation
+            # Copies keep callers from editing the cached entry
+            'statistics': dict(statistics),
+            'recommendation': copy.deepcopy(recommendation)
         }
     
     def _get_recommendation(self, stats: EngineStatistics) -> Dict[str, Any]:
@@ -414,7 +499,12 @@ class UnifiedSearchManager:
         old_engine_type = self.current_engine.engine_type.value
         
         try:
-            self._initialize_engine()
+            # The health probe blocks on the private loop, which cannot run
+            # inside the caller's loop, so initialization runs in a worker thread
+            await asyncio.get_running_loop().run_in_executor(None, self._initialize_engine)
+            self._engine_info_cache = None
+            self._filter_options_cache = None
+            self._filter_options_warmup = None
             new_engine_type = self.current_engine.engine_type.value
             
             return {
@@ -429,6 +519,17 @@ class UnifiedSearchManager:
                 'error': str(e),
                 'message': f'Engine reload failed: {e}'
             }
+    
+    def close(self) -> None:
+        """Close the health probe event loop and the active engine's connections"""
+        with self._loop_lock:
+            if self._loop is not None and not self._loop.is_closed():
+                self._loop.close()
+            self._loop = None
+        
+        close_engine = getattr(self.current_engine, 'close', None)
+        if close_engine is not None:
+            close_engine()
 
 
 def create_search_manager(config: Optional[Dict[str, Any]] = None) -> UnifiedSearchManager:
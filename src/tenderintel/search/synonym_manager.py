@@ -18,6 +18,7 @@ class SynonymManager:
     def __init__(self):
         self.synonyms = self._initialize_comprehensive_synonyms()
         self.domain_mapping = self._create_domain_mapping()
+        self._keyword_domains = self._index_keyword_domains()
         self.anti_patterns = self._initialize_anti_patterns()
     
     def _initialize_comprehensive_synonyms(self) -> Dict[str, List[str]]:
@@ -348,6 +349,15 @@ class SynonymManager:
             }
         }
     
+    def _index_keyword_domains(self) -> Dict[str, str]:
+        """Map each keyword to its first domain in domain_mapping order"""
+        
+        keyword_domains = {}
+        for domain, keywords in self.domain_mapping.items():
+            for keyword in keywords:
+                keyword_domains.setdefault(keyword, domain)
+        return keyword_domains
+    
     def _initialize_anti_patterns(self) -> Dict[str, List[str]]:
         """Initialize anti-patterns to avoid false positive expansions"""
         
@@ -406,11 +416,7 @@ class SynonymManager:
     def _detect_domain(self, keyword: str) -> Optional[str]:
         """Detect the most likely domain for a keyword"""
         
-        for domain, keywords in self.domain_mapping.items():
-            if keyword in keywords:
-                return domain
-        
-        return "general"
+        return self._keyword_domains.get(keyword, "general")
     
     def _calculate_expansion_confidence(self, keyword: str, expansions: List[str]) -> float:
         """Calculate confidence score for expansion quality"""
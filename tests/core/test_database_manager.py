@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Tests for DatabaseManager database creation and bulk loading
+
+Each test builds a fresh FTS5 database in a temporary directory.
+"""
+
+import pytest
+import sqlite3
+from pathlib import Path
+import sys
+
+# Add src to Python path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root / "src"))
+
+from tenderintel.core.database_manager import DatabaseManager, PAGE_SIZE_BYTES, TENDER_COLUMNS
+
+
+def make_row(tender_id, title="Cloud Migration"):
+    values = dict.fromkeys(TENDER_COLUMNS, "")
+    values.update(title=title, tender_id=tender_id)
+    return tuple(values[column] for column in TENDER_COLUMNS)
+
+
+def count_tenders(db_path):
+    with sqlite3.connect(db_path) as conn:
+        return conn.execute("SELECT COUNT(*) FROM tenders").fetchone()[0]
+
+
+@pytest.fixture
+def manager(tmp_path):
+    manager = DatabaseManager(str(tmp_path / "tenders.db"))
+    manager.create_database()
+    return manager
+
+
+class TestBulkInsert:
+    """bulk_insert loads a batch in one transaction"""
+    
+    def test_inserts_all_rows(self, manager):
+        rows = [make_row(f"T-{i}") for i in range(50)]
+        
+        assert manager.bulk_insert(rows) == 50
+        assert count_tenders(manager.db_path) == 50
+    
+    def test_empty_batch_is_a_no_op(self, manager):
+        assert manager.bulk_insert([]) == 0
+        assert count_tenders(manager.db_path) == 0
+    
+    def test_failed_row_rolls_back_the_batch(self, manager):
+        rows = [make_row("T-1"), ("too", "short")]
+        
+        with pytest.raises(sqlite3.ProgrammingError):
+            manager.bulk_insert(rows)
+        assert count_tenders(manager.db_path) == 0
+    
+    def test_locked_database_reports_the_lock(self, manager, monkeypatch):
+        # Fail BEGIN IMMEDIATE at once instead of waiting out the busy timeout
+        monkeypatch.setattr(manager, "_connect", lambda: sqlite3.connect(manager.db_path, timeout=0))
+        writer = sqlite3.connect(manager.db_path, isolation_level=None)
+        writer.execute("BEGIN IMMEDIATE")
+        try:
+            with pytest.raises(sqlite3.OperationalError, match="locked"):
+                manager.bulk_insert([make_row("T-1")])
+        finally:
+            writer.execute("ROLLBACK")
+            writer.close()
+        
+        assert manager.bulk_insert([make_row("T-1")]) == 1
+
+
+class TestCreateDatabase:
+    """create_database applies the configured page size"""
+    
+    def page_size(self, db_path):
+        with sqlite3.connect(db_path) as conn:
+            return conn.execute("PRAGMA page_size").fetchone()[0]
+    
+    def test_default_page_size(self, manager):
+        assert self.page_size(manager.db_path) == PAGE_SIZE_BYTES
+    
+    def test_configured_page_size(self, tmp_path):
+        manager = DatabaseManager(str(tmp_path / "tenders.db"), page_size=4096)
+        manager.create_database()
+        
+        assert self.page_size(manager.db_path) == 4096
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+Tests for the top-level tenderintel package's lazy re-exports
+"""
+
+import pytest
+import subprocess
+from pathlib import Path
+import sys
+
+# Add src to Python path
+project_root = Path(__file__).parent.parent.parent
+src_path = str(project_root / "src")
+sys.path.insert(0, src_path)
+
+
+def run_python(code):
+    """Run code in a fresh interpreter so earlier imports do not leak in"""
+    return subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=src_path, capture_output=True, text=True, check=True
+    ).stdout.split()
+
+
+class TestLazyExports:
+    """Heavy re-exports load on first attribute access only"""
+    
+    def test_import_does_not_load_engine_or_scraper(self):
+        loaded = run_python(
+            "import sys, tenderintel\n"
+            "for name in ('tenderintel.core.client', 'tenderintel.search.sqlite_fts5_engine',"
+            " 'tenderintel.scraper.tenderx_integration'):\n"
+            "    print(name in sys.modules)"
+        )
+        
+        assert loaded == ["False", "False", "False"]
+    
+    def test_attribute_access_resolves_export(self):
+        import tenderintel
+        from tenderintel.search.sqlite_fts5_engine import SQLiteFTS5Engine
+        
+        assert tenderintel.SQLiteFTS5Engine is SQLiteFTS5Engine
+        assert "TenderXAdapter" in dir(tenderintel)
+    
+    def test_unknown_attribute_raises(self):
+        import tenderintel
+        
+        with pytest.raises(AttributeError):
+            tenderintel.NoSuchThing
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Tests for the accepted-CAPTCHA cache keyed by image hash
+"""
+
+import pytest
+from pathlib import Path
+import sys
+
+# Add src to Python path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root / "src"))
+
+Image = pytest.importorskip("PIL.Image")
+
+from tenderintel.scraper import captcha_cache
+from tenderintel.scraper.captcha_cache import (
+    forget_captcha, image_hash, lookup_captcha, remember_captcha
+)
+
+
+@pytest.fixture(autouse=True)
+def cache_path(tmp_path, monkeypatch):
+    """Point the shelve file at a temporary directory"""
+    monkeypatch.setattr(captcha_cache, "CACHE_PATH", str(tmp_path / "captcha_cache"))
+    monkeypatch.setattr(captcha_cache, "_cache", None)
+    yield
+    if captcha_cache._cache is not None:
+        captcha_cache._cache.close()
+
+
+def gradient(reverse=False):
+    image = Image.new("L", (120, 40))
+    image.putdata([(255 - x * 2 if reverse else x * 2) for _ in range(40) for x in range(120)])
+    return image
+
+
+class TestImageHash:
+    """Difference hash of CAPTCHA images"""
+    
+    def test_hash_is_64_bit_hex(self):
+        key = image_hash(gradient())
+        assert len(key) == 16
+        int(key, 16)
+    
+    def test_same_image_at_other_size_hashes_equal(self):
+        assert image_hash(gradient()) == image_hash(gradient().resize((240, 80)))
+    
+    def test_different_images_hash_differently(self):
+        assert image_hash(gradient()) != image_hash(gradient(reverse=True))
+
+
+class TestAnswerCache:
+    """Accepted answers are remembered, rejected ones forgotten"""
+    
+    def test_remember_and_lookup(self):
+        remember_captcha("abc123", "X7KQ2P")
+        assert lookup_captcha("abc123") == "X7KQ2P"
+    
+    def test_unknown_and_empty_keys(self):
+        assert lookup_captcha("missing") is None
+        assert lookup_captcha(None) is None
+        remember_captcha("", "X7KQ2P")
+        remember_captcha("abc123", "")
+        assert lookup_captcha("abc123") is None
+    
+    def test_forget(self):
+        remember_captcha("abc123", "X7KQ2P")
+        forget_captcha("abc123")
+        forget_captcha("never-stored")
+        assert lookup_captcha("abc123") is None
+    
+    def test_answers_persist_across_reopen(self):
+        remember_captcha("abc123", "X7KQ2P")
+        captcha_cache._cache.close()
+        captcha_cache._cache = None
+        
+        assert lookup_captcha("abc123") == "X7KQ2P"
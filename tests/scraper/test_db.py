@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+Tests for the Supabase record buffer, batched upserts and ID lookups
+
+The Supabase client is replaced by an in-memory fake that records every
+request, so no credentials or network access are needed.
+"""
+
+import pytest
+from pathlib import Path
+import sys
+from types import SimpleNamespace
+
+# Add src to Python path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root / "src"))
+
+pytest.importorskip("supabase")
+pytest.importorskip("dotenv")
+
+from tenderintel.scraper import db
+
+
+class FakeTable:
+    """Chainable stand-in for a PostgREST table query"""
+    
+    def __init__(self, client):
+        self.client = client
+        self.request = {}
+    
+    def upsert(self, records, on_conflict=None):
+        self.request = {"upsert": records, "on_conflict": on_conflict}
+        return self
+    
+    def select(self, columns):
+        self.request["select"] = columns
+        return self
+    
+    def in_(self, column, values):
+        self.request["in"] = list(values)
+        return self
+    
+    def range(self, start, end):
+        self.request["range"] = (start, end)
+        return self
+    
+    def execute(self):
+        self.client.requests.append(self.request)
+        if "upsert" in self.request:
+            records = self.request["upsert"]
+            rows = records if isinstance(records, list) else [records]
+            if any(row["tender_id"] in self.client.rejected for row in rows):
+                raise RuntimeError("rejected")
+            self.client.rows.update((row["tender_id"], row) for row in rows)
+            return SimpleNamespace(data=rows)
+        
+        stored = sorted(self.client.rows)
+        if "in" in self.request:
+            return SimpleNamespace(data=[{"tender_id": i} for i in stored if i in self.request["in"]])
+        start, end = self.request["range"]
+        return SimpleNamespace(data=[{"tender_id": i} for i in stored[start:end + 1]])
+
+
+class FakeClient:
+    def __init__(self, rejected=()):
+        self.rows = {}
+        self.requests = []
+        self.rejected = set(rejected)
+    
+    def table(self, name):
+        assert name == "tenders"
+        return FakeTable(self)
+
+
+@pytest.fixture
+def client(monkeypatch):
+    fake = FakeClient()
+    monkeypatch.setattr(db, "_get_client", lambda: fake)
+    monkeypatch.setattr(db, "_buffer", [])
+    monkeypatch.setattr(db, "BATCH_SIZE", 3)
+    return fake
+
+
+def upserts(client):
+    return [request["upsert"] for request in client.requests if "upsert" in request]
+
+
+class TestBufferedInserts:
+    """Records are buffered and posted in BATCH_SIZE upserts"""
+    
+    def test_records_wait_for_a_full_batch(self, client):
+        db.insert_tender_record("T-1", "s3://a")
+        db.insert_tender_record("T-2", "s3://b")
+        assert client.requests == []
+        
+        db.insert_tender_record("T-3", "s3://c")
+        
+        assert [[r["tender_id"] for r in batch] for batch in upserts(client)] == [["T-1", "T-2", "T-3"]]
+        assert client.requests[0]["on_conflict"] == "tender_id"
+        assert db._buffer == []
+    
+    def test_flush_posts_in_chunks(self, client):
+        for i in range(2):
+            db.insert_tender_record(f"T-{i}", "s3://x")
+        db._buffer.extend({"tender_id": f"U-{i}", "s3_url": "s3://y"} for i in range(3))
+        
+        posted = db.flush()
+        
+        assert len(posted) == 5
+        assert [len(batch) for batch in upserts(client)] == [3, 2]
+        assert db.flush() == []
+    
+    def test_rejected_batch_falls_back_to_single_rows(self, client):
+        client.rejected.add("T-2")
+        
+        inserted = db.insert_tender_records([
+            {"tender_id": f"T-{i}", "s3_url": "s3://x"} for i in range(1, 4)
+        ])
+        
+        assert [row["tender_id"] for row in inserted] == ["T-1", "T-3"]
+        assert sorted(client.rows) == ["T-1", "T-3"]
+    
+    def test_unconfigured_client_skips_inserts(self, monkeypatch):
+        monkeypatch.setattr(db, "_get_client", lambda: None)
+        monkeypatch.setattr(db, "_buffer", [])
+        
+        assert db.insert_tender_record("T-1", "s3://a") is None
+        assert db._buffer == []
+
+
+class TestBackgroundFlusher:
+    """The flusher thread posts full batches and stop_flusher drains the rest"""
+    
+    def test_stop_flushes_remaining_records(self, client):
+        db.start_flusher(interval=60)
+        try:
+            for i in range(4):
+                db.insert_tender_record(f"T-{i}", "s3://x")
+        finally:
+            db.stop_flusher()
+        
+        assert sorted(client.rows) == ["T-0", "T-1", "T-2", "T-3"]
+        assert db._flusher is None
+
+
+class TestFetchExistingTenderIds:
+    """Stored tender IDs are looked up by ID or paged"""
+    
+    def test_lookup_by_ids_is_one_query(self, client):
+        client.rows.update({"T-1": {}, "T-2": {}})
+        
+        assert db.fetch_existing_tender_ids(tender_ids=["T-2", "T-9"]) == {"T-2"}
+        assert len(client.requests) == 1
+    
+    def test_empty_id_list_needs_no_query(self, client):
+        assert db.fetch_existing_tender_ids(tender_ids=[]) == set()
+        assert client.requests == []
+    
+    def test_full_scan_pages_through_the_table(self, client):
+        client.rows.update({f"T-{i}": {} for i in range(5)})
+        
+        assert len(db.fetch_existing_tender_ids(page_size=2)) == 5
+        assert [request["range"] for request in client.requests] == [(0, 1), (2, 3), (4, 5)]
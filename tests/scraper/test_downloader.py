@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+Tests for skipping tenders that are already stored in Supabase
+
+The tender page and Supabase lookups are replaced by recording fakes, so
+only the skip logic in process_tenders/process_tender is exercised.
+"""
+
+import pytest
+from pathlib import Path
+import sys
+
+# Add src to Python path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root / "src"))
+
+for module in ("selenium", "pytesseract", "boto3", "supabase", "dotenv"):
+    pytest.importorskip(module)
+
+from tenderintel.scraper import downloader
+from tenderintel.scraper import retry as retry_module
+
+# Listing link -> tender ID read from its page
+PAGES = {"link-1": "T-1", "link-2": "T-2", "link-3": "T-3"}
+
+
+@pytest.fixture
+def portal(monkeypatch):
+    """Serve tender IDs from PAGES and record Supabase lookups and downloads"""
+    calls = {"lookups": [], "downloads": []}
+    stored = {"T-2"}
+    
+    def fetch_existing_tender_ids(tender_ids=None, page_size=1000):
+        calls["lookups"].append(tender_ids)
+        return stored & set(tender_ids or ())
+    
+    def fetch_tender_page(browser, tender_link):
+        return PAGES[tender_link]
+    
+    class NoDownloadLink(Exception):
+        pass
+    
+    def wait_for_download_link(*args, **kwargs):
+        # Stands in for WebDriverWait: record the tender and stop there
+        calls["downloads"].append(args)
+        raise NoDownloadLink()
+    
+    monkeypatch.setattr(downloader, "fetch_existing_tender_ids", fetch_existing_tender_ids)
+    monkeypatch.setattr(downloader, "_fetch_tender_page", fetch_tender_page)
+    monkeypatch.setattr(downloader, "WebDriverWait", wait_for_download_link)
+    monkeypatch.setattr(downloader, "wait_for_uploads", lambda: None)
+    monkeypatch.setattr(downloader, "flush_tender_records", lambda: None)
+    monkeypatch.setattr(downloader, "record_failed_tender", lambda *args, **kwargs: None)
+    return calls
+
+
+class TestSkipExistingTenders:
+    """Already-ingested tenders are skipped before any download work"""
+    
+    def test_listing_ids_are_looked_up_once(self, portal):
+        downloader.process_tenders(
+            [("browser", "downloads")], list(PAGES), tender_ids=["T-1", "T-2", "T-3"]
+        )
+        
+        assert portal["lookups"] == [["T-1", "T-2", "T-3"]]
+        assert len(portal["downloads"]) == 2
+    
+    def test_without_listing_ids_each_tender_is_looked_up(self, portal):
+        downloader.process_tenders([("browser", "downloads")], list(PAGES))
+        
+        assert portal["lookups"] == [["T-1"], ["T-2"], ["T-3"]]
+        assert len(portal["downloads"]) == 2
+
+
+@pytest.fixture
+def no_backoff(monkeypatch):
+    monkeypatch.setattr(retry_module.time, "sleep", lambda delay: None)
+
+
+class FlakyBrowser:
+    """Browser whose page loads and submit clicks time out"""
+    
+    def __init__(self, timeouts=0):
+        self.timeouts = timeouts
+        self.loads = 0
+        self.clicks = 0
+    
+    def get(self, url):
+        self.loads += 1
+        if self.loads <= self.timeouts:
+            raise downloader.TimeoutException()
+    
+    def execute_script(self, script):
+        return "T-1"
+    
+    def find_element(self, *locator):
+        return FlakyElement(self)
+
+
+class FlakyElement:
+    def __init__(self, browser):
+        self.browser = browser
+    
+    def clear(self):
+        pass
+    
+    def send_keys(self, text):
+        pass
+    
+    def click(self):
+        self.browser.clicks += 1
+        raise downloader.TimeoutException()
+
+
+class TestRetryScope:
+    """Page loads are retried; CAPTCHA submits never are"""
+    
+    def test_page_load_timeouts_are_retried(self, no_backoff):
+        browser = FlakyBrowser(timeouts=2)
+        
+        assert downloader._fetch_tender_page(browser, "link-1") == "T-1"
+        assert browser.loads == 3
+    
+    def test_captcha_submit_is_not_retried(self, no_backoff):
+        browser = FlakyBrowser()
+        
+        with pytest.raises(downloader.TimeoutException):
+            downloader._submit_captcha(browser, "X7KQ2P")
+        assert browser.clicks == 1
+
+
+class DirectDownloadPage:
+    """Tender page whose download link starts Chrome's download with no CAPTCHA"""
+    
+    def __init__(self):
+        self.clicks = 0
+    
+    def click(self):
+        self.clicks += 1
+    
+    def until(self, condition):
+        return self
+    
+    def find_elements(self, *locator):
+        return []
+
+
+@pytest.fixture
+def browser_download(monkeypatch):
+    """Reach the browser-download fallback and record what happens there"""
+    page = DirectDownloadPage()
+    calls = {"waits": [], "failures": []}
+    
+    def wait_for_zip_file(download_dir, since=None):
+        calls["waits"].append(download_dir)
+        raise TimeoutError("no zip")
+    
+    monkeypatch.setattr(downloader, "_fetch_tender_page", lambda browser, link: "T-1")
+    monkeypatch.setattr(downloader, "WebDriverWait", lambda *args: page)
+    monkeypatch.setattr(downloader.EC, "element_to_be_clickable", lambda locator: locator, raising=False)
+    monkeypatch.setattr(downloader, "wait_for_page_change", lambda *args, **kwargs: True)
+    monkeypatch.setattr(downloader, "wait_for_zip_file", wait_for_zip_file)
+    monkeypatch.setattr(
+        downloader, "record_failed_tender",
+        lambda link, reason: calls["failures"].append(link),
+    )
+    calls["page"] = page
+    return calls
+
+
+class TestSeleniumGridDownloads:
+    """With SELENIUM_HUB the zip lands on the grid node, so it is never awaited"""
+    
+    def test_local_browser_waits_for_the_zip(self, browser_download, monkeypatch):
+        monkeypatch.delenv("SELENIUM_HUB", raising=False)
+        
+        downloader.process_tender(browser_download["page"], "downloads", "link-1", existing_ids=set())
+        assert browser_download["waits"] == ["downloads"]
+    
+    def test_grid_records_the_tender_as_failed(self, browser_download, monkeypatch):
+        monkeypatch.setenv("SELENIUM_HUB", "http://grid:4444/wd/hub")
+        
+        downloader.process_tender(browser_download["page"], "downloads", "link-1", existing_ids=set())
+        assert browser_download["waits"] == []
+        assert browser_download["failures"] == ["link-1"]
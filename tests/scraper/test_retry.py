@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Tests for the scraper's retry decorator and failed-tender log
+"""
+
+import pytest
+from pathlib import Path
+import sys
+
+# Add src to Python path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root / "src"))
+
+from tenderintel.scraper import retry as retry_module
+from tenderintel.scraper.retry import record_failed_tender, retry, take_failed_tenders
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """Record backoff delays instead of sleeping"""
+    delays = []
+    monkeypatch.setattr(retry_module.time, "sleep", delays.append)
+    return delays
+
+
+class TestRetry:
+    """Exponential backoff on the configured exceptions"""
+    
+    def test_retries_until_success_with_doubling_delays(self, sleeps):
+        outcomes = iter([ConnectionError(), ConnectionError(), "ok"])
+        
+        @retry(exceptions=(ConnectionError,), attempts=3, base=0.5)
+        def flaky():
+            outcome = next(outcomes)
+            if isinstance(outcome, Exception):
+                raise outcome
+            return outcome
+        
+        assert flaky() == "ok"
+        assert sleeps == [0.5, 1.0]
+    
+    def test_last_failure_is_raised(self, sleeps):
+        calls = []
+        
+        @retry(exceptions=(ConnectionError,), attempts=3, base=1.0)
+        def broken():
+            calls.append(1)
+            raise ConnectionError("down")
+        
+        with pytest.raises(ConnectionError, match="down"):
+            broken()
+        assert len(calls) == 3
+        assert sleeps == [1.0, 2.0]
+    
+    def test_other_exceptions_are_not_retried(self, sleeps):
+        calls = []
+        
+        @retry(attempts=3, exceptions=(ConnectionError,))
+        def invalid():
+            calls.append(1)
+            raise ValueError("bad input")
+        
+        with pytest.raises(ValueError):
+            invalid()
+        assert len(calls) == 1
+        assert sleeps == []
+    
+    def test_exceptions_must_be_named(self):
+        with pytest.raises(TypeError):
+            retry()
+    
+    def test_wraps_function_metadata(self):
+        @retry(exceptions=(ConnectionError,))
+        def upload():
+            """Upload a file"""
+        
+        assert upload.__name__ == "upload"
+        assert upload.__doc__ == "Upload a file"
+
+
+class TestFailedTenders:
+    """Failed tenders are recorded for the next run and taken once"""
+    
+    def test_record_and_take(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(retry_module, "FAILED_TENDERS_PATH", str(tmp_path / "failed.json"))
+        
+        record_failed_tender("link-1", RuntimeError("timeout"))
+        record_failed_tender("link-2", RuntimeError("captcha"))
+        
+        assert take_failed_tenders() == ["link-1", "link-2"]
+        assert take_failed_tenders() == []
+    
+    def test_corrupt_file_is_ignored(self, tmp_path, monkeypatch):
+        path = tmp_path / "failed.json"
+        path.write_text("{not json")
+        monkeypatch.setattr(retry_module, "FAILED_TENDERS_PATH", str(path))
+        
+        assert take_failed_tenders() == []
+        assert not path.exists()
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Tests for the browser pool's portal session setup
+
+Browsers are replaced by plain objects and the portal steps are recorded,
+so no Chrome or network access is needed (selenium itself still is).
+"""
+
+import pytest
+import threading
+from pathlib import Path
+import sys
+
+# Add src to Python path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root / "src"))
+
+pytest.importorskip("selenium")
+pytest.importorskip("webdriver_manager")
+pytest.importorskip("pytesseract")
+
+from tenderintel.scraper import tender_scraper
+
+
+@pytest.fixture
+def steps(monkeypatch):
+    """Record (step, browser) pairs instead of driving a browser"""
+    recorded = []
+    lock = threading.Lock()
+    
+    def record(step):
+        def _step(browser):
+            with lock:
+                recorded.append((step, browser))
+        return _step
+    
+    monkeypatch.setattr(tender_scraper, "open_website", record("open"))
+    monkeypatch.setattr(tender_scraper, "search_open_tenders", record("search"))
+    return recorded
+
+
+class TestStartSessions:
+    """Every worker browser needs its own portal session"""
+    
+    def test_every_worker_opens_and_searches(self, steps):
+        workers = [(f"browser-{i}", f"downloads/worker_{i}") for i in range(3)]
+        
+        tender_scraper.start_sessions(workers)
+        
+        for browser, _ in workers:
+            assert [step for step, b in steps if b == browser] == ["open", "search"]
+    
+    def test_setup_failure_is_raised(self, monkeypatch, steps):
+        def fail(browser):
+            raise RuntimeError("portal unavailable")
+        
+        monkeypatch.setattr(tender_scraper, "search_open_tenders", fail)
+        
+        with pytest.raises(RuntimeError, match="portal unavailable"):
+            tender_scraper.start_sessions([("browser-0", "downloads/worker_0")])
+
+
+class TestListingTenderId:
+    """Tender IDs are read from the results table cell next to each link"""
+    
+    def test_last_bracketed_value_is_the_id(self):
+        text = "[Supply of desktop computers] [NIC/IT/12/2025] [2025_NIC_123456_1]"
+        assert tender_scraper.listing_tender_id(text) == "2025_NIC_123456_1"
+    
+    def test_missing_id(self):
+        assert tender_scraper.listing_tender_id("Supply of desktop computers") is None
+        assert tender_scraper.listing_tender_id(None) is None
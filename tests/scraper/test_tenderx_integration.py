@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Tests for the TenderX adapter enhancements
+"""
+
+import json
+import pytest
+from pathlib import Path
+import sys
+
+# Add src to Python path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root / "src"))
+
+pytest.importorskip("ahocorasick")
+
+from tenderintel.core.database_manager import DatabaseManager, TENDER_COLUMNS
+from tenderintel.scraper.tenderx_integration import TenderXAdapter, EnhancedTender
+
+
+@pytest.fixture(scope="module")
+def adapter():
+    return TenderXAdapter()
+
+
+class TestEnhanceTenderData:
+    """EnhancedTender construction from raw scraped dicts"""
+    
+    def test_raw_fields_are_carried_over(self, adapter):
+        tender = adapter.enhance_tender_data({
+            "tender_id": "T-1",
+            "title": "Supply of firewall appliances",
+            "organization": "Ministry of Defence",
+            "tender_url": "https://example.org/t/1",
+            "unknown_key": "ignored"
+        })
+        
+        assert isinstance(tender, EnhancedTender)
+        assert tender.tender_id == "T-1"
+        assert tender.tender_url == "https://example.org/t/1"
+    
+    def test_input_enhancement_fields_are_replaced(self, adapter):
+        raw = {
+            "title": "Supply of firewall appliances",
+            "organization": "Ministry of Defence",
+            "region": "Stale Region",
+            "service_category": "Stale Category",
+            "detected_firms": ["Stale Firm"],
+            "technology_stack": ["Stale"]
+        }
+        
+        tender = adapter.enhance_tender_data(raw)
+        expected = adapter.enhance_tender_data({"title": raw["title"], "organization": raw["organization"]})
+        
+        assert tender == expected
+    
+    def test_to_dict_is_json_serializable(self, adapter):
+        tender = adapter.enhance_tender_data({"tender_id": "T-1", "title": "Cloud migration and backup"})
+        data = json.loads(json.dumps(tender.to_dict()))
+        
+        assert data["tender_id"] == "T-1"
+        assert data["extracted_keywords"] == sorted(tender.extracted_keywords)
+        assert data["extracted_keywords"]
+    
+    def test_input_enhancement_fields_are_replaced_without_title(self, adapter):
+        tender = adapter.enhance_tender_data({
+            "organization": "Ministry of Defence",
+            "region": "Stale Region",
+            "sub_category": "Stale"
+        })
+        
+        assert tender.region != "Stale Region"
+        assert tender.sub_category == "General"
+
+
+class TestKeywordMatching:
+    """Whole-word keyword matching shared by the detectors"""
+    
+    def test_dotnet_keyword_does_not_match_plain_net(self, adapter):
+        assert adapter.detect_technology_stack("Net banking portal") == []
+    
+    @pytest.mark.parametrize("title", [
+        "Development of .NET application",
+        "Web portal on .net.",
+        "Maintenance of (.net) services",
+    ])
+    def test_dotnet_keyword_matches_as_written(self, adapter, title):
+        assert "Programming" in adapter.detect_technology_stack(title)
+    
+    def test_keywords_match_whole_words_only(self, adapter):
+        # "lan" is a networking keyword but "plant" must not match it
+        assert adapter.get_subcategory("Water treatment plant") == adapter.get_subcategory("")
+    
+    def test_keyword_punctuation_inside_words_is_kept(self, adapter):
+        assert adapter.detect_competitor_firms("Upgrade of L&T systems") == ["L&T"]
+
+
+@pytest.fixture
+def db_adapter(tmp_path):
+    manager = DatabaseManager(str(tmp_path / "tenders.db"))
+    manager.create_database()
+    adapter = TenderXAdapter(db_path=str(manager.db_path))
+    yield adapter, manager
+    adapter.close()
+
+
+def saved_ids(manager):
+    with manager._connect() as conn:
+        return sorted(row[0] for row in conn.execute("SELECT tender_id FROM tenders"))
+
+
+class TestSaveEnhancedTenders:
+    """Batch saves skip tenders whose ID is already in the tenders table"""
+    
+    def enhance(self, adapter, *tender_ids):
+        return [
+            adapter.enhance_tender_data({"tender_id": tender_id, "title": "Supply of firewall appliances"})
+            for tender_id in tender_ids
+        ]
+    
+    def test_returns_only_newly_saved_tenders(self, db_adapter):
+        adapter, manager = db_adapter
+        
+        first = adapter.save_enhanced_tenders_batch(self.enhance(adapter, "T-1", "T-2", "T-1"))
+        second = adapter.save_enhanced_tenders_batch(self.enhance(adapter, "T-2", "T-3"))
+        
+        assert [tender.tender_id for tender in first] == ["T-1", "T-2"]
+        assert [tender.tender_id for tender in second] == ["T-3"]
+        assert saved_ids(manager) == ["T-1", "T-2", "T-3"]
+        assert adapter.save_enhanced_tender(self.enhance(adapter, "T-3")[0]) is False
+    
+    def test_rows_inserted_by_other_paths_are_duplicates(self, db_adapter):
+        adapter, manager = db_adapter
+        row = dict.fromkeys(TENDER_COLUMNS, "")
+        row.update(tender_id="T-1", title="Existing tender")
+        manager.bulk_insert([tuple(row[column] for column in TENDER_COLUMNS)])
+        
+        saved = adapter.save_enhanced_tenders_batch(self.enhance(adapter, "T-1", "T-2"))
+        
+        assert [tender.tender_id for tender in saved] == ["T-2"]
+    
+    def test_deleted_rows_can_be_saved_again(self, db_adapter):
+        adapter, manager = db_adapter
+        adapter.save_enhanced_tenders_batch(self.enhance(adapter, "T-1"))
+        with manager._connect() as conn:
+            conn.execute("DELETE FROM tenders WHERE tender_id = 'T-1'")
+        
+        saved = adapter.save_enhanced_tenders_batch(self.enhance(adapter, "T-1"))
+        
+        assert [tender.tender_id for tender in saved] == ["T-1"]
+        assert saved_ids(manager) == ["T-1"]
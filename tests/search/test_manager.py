@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+Tests for UnifiedSearchManager request coalescing and caching
+
+The active engine is replaced by a small counting fake, so these tests
+exercise only the manager's own bookkeeping.
+"""
+
+import pytest
+import asyncio
+from datetime import datetime
+from pathlib import Path
+import sys
+
+# Add src to Python path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root / "src"))
+
+from tenderintel.search.base import (
+    EngineHealthStatus, EngineStatistics, SearchEngineType,
+    UnifiedSearchHit, UnifiedSearchResponse, get_engine_capabilities
+)
+from tenderintel.search.manager import UnifiedSearchManager
+
+
+class CountingEngine:
+    """Stands in for a search engine and counts the calls it receives"""
+    
+    engine_type = SearchEngineType.SQLITE
+    capabilities = get_engine_capabilities(SearchEngineType.SQLITE)
+    
+    def __init__(self):
+        self.searches = 0
+        self.health_checks = 0
+        self.statistics_calls = 0
+        self.filter_option_calls = 0
+        self.healthy = True
+    
+    async def execute_search(self, keyword, expanded_phrases, filters=None,
+                             limit=25, offset=0, debug=False):
+        self.searches += 1
+        await asyncio.sleep(0)
+        hit = UnifiedSearchHit(
+            tender_id="T-1", title="Cloud Migration", organization="", status="",
+            aoc_date="", url="", raw_score=1.0, similarity_percent=100,
+            matched_phrases=[keyword]
+        )
+        return UnifiedSearchResponse(
+            query=keyword, expanded_phrases=list(expanded_phrases), total_matches=1,
+            max_score=1.0, hits=[hit], execution_time_ms=1.0, engine_used="sqlite",
+            engine_debug={}
+        )
+    
+    async def get_filter_options(self):
+        self.filter_option_calls += 1
+        return {"organizations": ["NIC"]}
+    
+    async def health_check(self):
+        self.health_checks += 1
+        return EngineHealthStatus(
+            is_healthy=self.healthy, status="green" if self.healthy else "red"
+        )
+    
+    async def get_statistics(self):
+        self.statistics_calls += 1
+        return EngineStatistics(
+            record_count=10, index_size_mb=1.0, avg_query_time_ms=5.0,
+            queries_per_minute=0.0, last_updated=datetime(2025, 1, 1)
+        )
+
+
+@pytest.fixture
+def manager(monkeypatch):
+    engines = iter([CountingEngine(), CountingEngine()])
+    
+    def initialize(self):
+        self.current_engine = next(engines)
+    
+    monkeypatch.setattr(UnifiedSearchManager, "_initialize_engine", initialize)
+    return UnifiedSearchManager({"search": {"engine": "sqlite"}})
+
+
+class TestSearchCoalescing:
+    """Identical concurrent searches share one engine call"""
+    
+    def test_concurrent_duplicates_share_one_engine_call(self, manager):
+        async def run():
+            return await asyncio.gather(
+                manager.search("cloud"),
+                manager.search("cloud")
+            )
+        
+        first, second = asyncio.run(run())
+        
+        assert manager.current_engine.searches == 1
+        assert first is not second
+        assert first.hits is not second.hits
+        assert first.hits[0] is not second.hits[0]
+    
+    def test_caller_mutations_do_not_leak(self, manager):
+        async def run():
+            first, second = await asyncio.gather(
+                manager.search("cloud"),
+                manager.search("cloud")
+            )
+            first.hits[0].title = "changed"
+            first.hits.clear()
+            return second
+        
+        second = asyncio.run(run())
+        
+        assert second.hits[0].title == "Cloud Migration"
+    
+    def test_different_requests_are_not_coalesced(self, manager):
+        async def run():
+            await asyncio.gather(
+                manager.search("cloud"),
+                manager.search("cloud", offset=25)
+            )
+        
+        asyncio.run(run())
+        
+        assert manager.current_engine.searches == 2
+    
+    def test_finished_searches_run_again(self, manager):
+        async def run():
+            await manager.search("cloud")
+            await manager.search("cloud")
+        
+        asyncio.run(run())
+        
+        assert manager.current_engine.searches == 2
+
+
+class TestEngineInfoCache:
+    """Statistics are cached per engine; health is always live"""
+    
+    def test_health_is_checked_on_every_call(self, manager):
+        engine = manager.current_engine
+        
+        async def run():
+            first = await manager.get_engine_info()
+            engine.healthy = False
+            return first, await manager.get_engine_info()
+        
+        first, second = asyncio.run(run())
+        
+        assert first["health"]["is_healthy"]
+        assert not second["health"]["is_healthy"]
+        assert engine.health_checks == 2
+        assert engine.statistics_calls == 1
+    
+    def test_returned_info_is_not_the_cached_entry(self, manager):
+        async def run():
+            first = await manager.get_engine_info()
+            first["statistics"]["record_count"] = -1
+            first["recommendation"]["message"] = "changed"
+            return await manager.get_engine_info()
+        
+        second = asyncio.run(run())
+        
+        assert second["statistics"]["record_count"] == 10
+        assert second["recommendation"]["message"] != "changed"
+    
+    def test_reload_drops_cached_info_and_filter_options(self, manager):
+        first_engine = manager.current_engine
+        
+        async def run():
+            await manager.get_engine_info()
+            await manager.get_filter_options()
+            result = await manager.reload_engine()
+            await manager.get_engine_info()
+            await manager.get_filter_options()
+            return result
+        
+        result = asyncio.run(run())
+        
+        assert result["success"]
+        assert manager.current_engine is not first_engine
+        assert manager.current_engine.statistics_calls == 1
+        assert manager.current_engine.filter_option_calls == 1
+    
+    def test_filter_options_are_cached(self, manager):
+        async def run():
+            await manager.get_filter_options()
+            return await manager.get_filter_options()
+        
+        options = asyncio.run(run())
+        
+        assert options == {"organizations": ["NIC"]}
+        assert manager.current_engine.filter_option_calls == 1
@@ -0,0 +1,331 @@
+#!/usr/bin/env python3
+"""
+Tests for the OpenSearch engine's request building and result handling
+
+The cluster is replaced by a small recording client, so no OpenSearch
+server is needed (opensearch-py itself still is).
+"""
+
+import pytest
+import asyncio
+from pathlib import Path
+import sys
+
+# Add src to Python path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root / "src"))
+
+pytest.importorskip("opensearchpy")
+
+from tenderintel.search.engines.opensearch_engine import (
+    OpenSearchEngine, RESULT_SORT, SORT_FIELDS_TEMPLATE, _analyze_phrases
+)
+
+
+def make_hit(tender_id, title, score=2.0, highlight=None):
+    hit = {
+        "_id": tender_id,
+        "_score": score,
+        "_source": {"tender_id": tender_id, "title": title},
+        "sort": [score, None, tender_id]
+    }
+    if highlight is not None:
+        hit["highlight"] = {"title": highlight}
+    return hit
+
+
+class RecordingClient:
+    """Stands in for the OpenSearch client and records search bodies"""
+    
+    def __init__(self, hits=None, error=None):
+        self.hits = hits if hits is not None else [make_hit("T-1", "Cloud Migration")]
+        self.error = error
+        self.bodies = []
+    
+    def search(self, index, body, preference=None):
+        self.bodies.append(body)
+        if self.error is not None:
+            raise self.error
+        return {
+            "hits": {
+                "hits": self.hits,
+                "max_score": max((h["_score"] for h in self.hits), default=None),
+                "total": {"value": len(self.hits)}
+            }
+        }
+
+
+def make_engine(client=None, **config):
+    engine = OpenSearchEngine({
+        "hosts": [{"host": "localhost", "port": 9200}],
+        "manage_index_template": False,
+        **config
+    })
+    engine.client = client or RecordingClient()
+    return engine
+
+
+class TestResultSort:
+    """Sort keys must work on dynamically mapped indices"""
+    
+    def test_tiebreaker_uses_keyword_subfield(self):
+        tiebreaker = RESULT_SORT[-1]
+        assert list(tiebreaker) == ["tender_id.keyword"]
+        assert tiebreaker["tender_id.keyword"]["unmapped_type"] == "keyword"
+    
+    def test_template_maps_tender_id_like_dynamic_mapping(self):
+        tender_id = SORT_FIELDS_TEMPLATE["mappings"]["properties"]["tender_id"]
+        assert tender_id["type"] == "text"
+        assert tender_id["fields"]["keyword"]["type"] == "keyword"
+    
+    def test_search_and_cursor_requests_share_the_sort(self):
+        client = RecordingClient()
+        engine = make_engine(client, response_cache_ttl=0)
+        
+        first = asyncio.run(engine.execute_search("cloud", ["cloud"]))
+        asyncio.run(engine.execute_search(
+            "cloud", ["cloud"], search_after=first.engine_debug["next_cursor"]
+        ))
+        
+        assert [body["sort"] for body in client.bodies] == [RESULT_SORT, RESULT_SORT]
+        assert client.bodies[1]["search_after"] == [2.0, None, "T-1"]
+        assert "from" not in client.bodies[1]
+
+
+class TestMatchedPhrases:
+    """matched_phrases / exact_match derived from highlights and titles"""
+    
+    def process(self, hit, phrases, keyword="kw"):
+        engine = make_engine()
+        return engine._process_results_to_unified([hit], hit["_score"], tuple(phrases), keyword)[0]
+    
+    def test_highlighted_words_match_phrase(self):
+        hit = make_hit("T-1", "Cloud Migration services", highlight=["\x01Cloud\x02 \x01Migration\x02 services"])
+        result = self.process(hit, ["cloud migration", "storage"])
+        
+        assert result.matched_phrases == ["cloud migration"]
+        assert result.exact_match
+        assert result.highlight_snippets == {"title": ["<mark>Cloud</mark> <mark>Migration</mark> services"]}
+    
+    def test_stemmed_highlight_falls_back_to_substring(self):
+        hit = make_hit("T-1", "Networking equipment", highlight=["\x01Networking\x02 equipment"])
+        result = self.process(hit, ["network"])
+        
+        assert result.matched_phrases == ["network"]
+    
+    def test_hyphenated_phrase_matches(self):
+        hit = make_hit("T-1", "E-Procurement portal upgrade",
+                       highlight=["\x01E\x02-\x01Procurement\x02 portal upgrade"])
+        result = self.process(hit, ["e-procurement", "portal upgrade"])
+        
+        assert result.matched_phrases == ["e-procurement", "portal upgrade"]
+        assert result.exact_match
+    
+    def test_highlight_only_match_is_kept(self):
+        # Stemmed match the title does not contain verbatim
+        hit = make_hit("T-1", "Upgrading switches", highlight=["\x01Upgrading\x02 switches"])
+        result = self.process(hit, ["upgrading"])
+        
+        assert result.matched_phrases == ["upgrading"]
+    
+    def test_no_match_falls_back_to_keyword(self):
+        hit = make_hit("T-1", "Office furniture")
+        result = self.process(hit, ["cloud"], keyword="cloud")
+        
+        assert result.matched_phrases == ["cloud"]
+        assert not result.exact_match
+        assert result.highlight_snippets is None
+
+
+class TestResponseCache:
+    """Cached and coalesced responses are shared without leaking mutations"""
+    
+    def test_repeat_search_is_served_from_cache(self):
+        client = RecordingClient()
+        engine = make_engine(client)
+        
+        async def run():
+            first = await engine.execute_search("cloud", ["cloud"])
+            first.hits[0].title = "changed"
+            first.hits.clear()
+            first.engine_debug.clear()
+            return await engine.execute_search("cloud", ["cloud"])
+        
+        second = asyncio.run(run())
+        
+        assert len(client.bodies) == 1
+        assert second.hits[0].title == "Cloud Migration"
+        assert second.engine_debug["next_cursor"] == [2.0, None, "T-1"]
+    
+    def test_concurrent_duplicates_share_one_query(self):
+        client = RecordingClient()
+        engine = make_engine(client)
+        
+        async def run():
+            return await asyncio.gather(
+                engine.execute_search("cloud", ["cloud"]),
+                engine.execute_search("cloud", ["cloud"])
+            )
+        
+        first, second = asyncio.run(run())
+        
+        assert len(client.bodies) == 1
+        assert first is not second
+        assert first.hits is not second.hits
+        assert first.hits[0] is not second.hits[0]
+    
+    def test_failures_are_not_cached(self):
+        client = RecordingClient(error=RuntimeError("cluster down"))
+        engine = make_engine(client)
+        
+        async def run():
+            await engine.execute_search("cloud", ["cloud"])
+            return await engine.execute_search("cloud", ["cloud"])
+        
+        response = asyncio.run(run())
+        
+        assert len(client.bodies) == 2
+        assert response.hits == []
+
+
+class TestAnalyzePhrases:
+    """Phrase bool query and per-phrase match data"""
+    
+    def test_single_words_share_one_match_clause(self):
+        query, _ = _analyze_phrases(("cloud", "cloud migration", "saas"))
+        clauses = query["bool"]["should"]
+        
+        assert clauses[0] == {"match_phrase": {"title": {"query": "cloud migration", "slop": 1, "boost": 2.0}}}
+        assert clauses[1] == {"match": {"title": {"query": "cloud saas", "operator": "or", "boost": 1.5}}}
+        assert query["bool"]["minimum_should_match"] == 1
+    
+    def test_lone_or_punctuated_words_keep_phrase_clauses(self):
+        query, _ = _analyze_phrases(("cloud", "e-procurement"))
+        
+        assert [list(clause) for clause in query["bool"]["should"]] == [["match_phrase"], ["match_phrase"]]
+        assert query["bool"]["should"][1]["match_phrase"]["title"]["slop"] == 0
+    
+    def test_phrase_meta(self):
+        _, phrase_meta = _analyze_phrases(("Cloud Migration", "SaaS"))
+        
+        assert phrase_meta == (
+            ("Cloud Migration", "cloud migration", ("cloud", "migration"), True),
+            ("SaaS", "saas", ("saas",), False),
+        )
+    
+    def test_reordered_expansions_send_the_same_query(self):
+        client = RecordingClient()
+        engine = make_engine(client, response_cache_ttl=0)
+        
+        asyncio.run(engine.execute_search("cloud", ["cloud migration", "saas", "cloud"]))
+        asyncio.run(engine.execute_search("cloud", ["cloud", "saas", "cloud migration"]))
+        
+        assert client.bodies[0]["query"] == client.bodies[1]["query"]
+
+
+class TestCircuitBreaker:
+    """Repeated failures open the circuit and skip the cluster"""
+    
+    def test_opens_after_threshold_and_recovers(self):
+        client = RecordingClient(error=RuntimeError("cluster down"))
+        engine = make_engine(client, response_cache_ttl=0, circuit_failure_threshold=2)
+        
+        for _ in range(3):
+            response = asyncio.run(engine.execute_search("cloud", ["cloud"]))
+        
+        assert len(client.bodies) == 2
+        assert response.engine_debug == {"circuit_open": True}
+        
+        # After the cooldown the next search reaches the cluster again
+        client.error = None
+        engine._circuit_open_until = 0.0
+        response = asyncio.run(engine.execute_search("cloud", ["cloud"]))
+        
+        assert len(client.bodies) == 3
+        assert response.total_matches == 1
+    
+    def test_success_resets_the_failure_count(self):
+        client = RecordingClient(error=RuntimeError("cluster down"))
+        engine = make_engine(client, response_cache_ttl=0, circuit_failure_threshold=2)
+        
+        asyncio.run(engine.execute_search("cloud", ["cloud"]))
+        client.error = None
+        asyncio.run(engine.execute_search("cloud", ["cloud"]))
+        client.error = RuntimeError("cluster down")
+        asyncio.run(engine.execute_search("cloud", ["cloud"]))
+        
+        assert engine._circuit_open_until == 0.0
+    
+    def test_timed_out_searches_count_as_failures(self):
+        client = RecordingClient()
+        search = client.search
+        client.search = lambda **kwargs: {**search(**kwargs), "timed_out": True}
+        engine = make_engine(client, response_cache_ttl=0, circuit_failure_threshold=2)
+        
+        first = asyncio.run(engine.execute_search("cloud", ["cloud"]))
+        asyncio.run(engine.execute_search("cloud", ["cloud"]))
+        
+        assert first.total_matches == 1
+        assert engine._circuit_open_until > 0.0
+    
+    def test_search_body_carries_the_shard_timeout(self):
+        client = RecordingClient()
+        engine = make_engine(client, response_cache_ttl=0, search_timeout="1s", terminate_after=1000)
+        
+        asyncio.run(engine.execute_search("cloud", ["cloud"]))
+        
+        assert client.bodies[0]["timeout"] == "1s"
+        assert client.bodies[0]["terminate_after"] == 1000
+
+
+class MsearchClient(RecordingClient):
+    """Answers each msearch sub-query with its own list of hits"""
+    
+    def __init__(self, sub_hits):
+        super().__init__()
+        self.sub_hits = sub_hits
+    
+    def msearch(self, body, preference=None):
+        self.bodies.append(body)
+        return {"responses": [
+            {"hits": {"hits": hits, "total": {"value": len(hits)}}} for hits in self.sub_hits
+        ]}
+
+
+def dated_hit(tender_id, score, aoc_date):
+    hit = make_hit(tender_id, "Cloud Migration", score=score)
+    hit["sort"] = [score, aoc_date, tender_id]
+    return hit
+
+
+class TestMsearchMerge:
+    """Large expansions are split into msearch sub-queries and merged"""
+    
+    def search(self, sub_hits, **config):
+        client = MsearchClient(sub_hits)
+        engine = make_engine(client, response_cache_ttl=0, msearch_batch_size=1, **config)
+        response = asyncio.run(engine.execute_search("cloud", ["cloud", "saas migration"]))
+        return client, response
+    
+    def test_merged_hits_follow_result_sort(self):
+        _, response = self.search([
+            [dated_hit("T-3", 2.0, 100), dated_hit("T-9", 1.0, 500)],
+            [dated_hit("T-1", 2.0, 100), dated_hit("T-2", 2.0, 300),
+             dated_hit("T-4", 2.0, None), dated_hit("T-9", 3.0, 500)],
+        ])
+        
+        assert [hit.tender_id for hit in response.hits] == ["T-9", "T-2", "T-1", "T-3", "T-4"]
+        assert response.hits[0].raw_score == 3.0
+    
+    def test_sub_queries_apply_track_total_hits(self):
+        client, _ = self.search([[], []], track_total_hits="page")
+        
+        sub_queries = client.bodies[0][1::2]
+        assert len(sub_queries) == 2
+        assert all(query["track_total_hits"] == 26 for query in sub_queries)
+    
+    def test_merged_pages_have_no_cursor(self):
+        _, response = self.search([[dated_hit("T-1", 2.0, 100)], []])
+        
+        assert response.hits
+        assert response.engine_debug["next_cursor"] is None
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Tests for the SQLite FTS5 engine's query building, matching and projection
+
+A small FTS5 database is built once per module in a temporary directory.
+"""
+
+import pytest
+import asyncio
+import sqlite3
+from pathlib import Path
+import sys
+
+# Add src to Python path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root / "src"))
+
+pytest.importorskip("ahocorasick")
+
+from tenderintel.search.engines.sqlite_engine import (
+    SQLiteFTS5Engine, REQUIRED_SEARCH_FIELDS, _build_fts5_match, _sanitize_fts5_phrase
+)
+
+ROWS = [
+    ("Supply of network switch and test kit", "Org A", "open", "2024-01-10", "T1", "u1",
+     "Networking", "5_to_25_lakh", "North", "central", "medium", "lan,wan"),
+    ("Networking test equipment", "Org B", "open", "2024-02-11", "T2", "u2",
+     "Networking", "under_5_lakh", "South", "state", "low", None),
+    ("Office furniture", "Org C", "closed", "2024-03-12", "T3", "u3",
+     "Other", "under_5_lakh", "East", "state", "low", "chairs"),
+]
+
+
+@pytest.fixture(scope="module")
+def engine(tmp_path_factory):
+    db_path = tmp_path_factory.mktemp("fts5") / "tenders.db"
+    with sqlite3.connect(db_path) as conn:
+        conn.execute(
+            "CREATE VIRTUAL TABLE tenders USING fts5(title, org, status, aoc_date, tender_id, url, "
+            "service_category, value_range, region, department_type, complexity, keywords, "
+            "tokenize=porter)"
+        )
+        conn.executemany("INSERT INTO tenders VALUES (?,?,?,?,?,?,?,?,?,?,?,?)", ROWS)
+    engine = SQLiteFTS5Engine({"database_path": str(db_path), "wal_checkpoint_interval_s": 0})
+    yield engine
+    engine.close()
+
+
+def search(engine, phrases, **kwargs):
+    return asyncio.run(engine.execute_search("network", phrases, **kwargs))
+
+
+class TestBuildFts5Match:
+    """MATCH expressions built from expanded phrases"""
+    
+    def test_longest_phrases_first_and_multi_word_quoted(self):
+        assert _build_fts5_match(("lan", "network switch")) == '"network switch" OR lan'
+    
+    def test_special_characters_are_removed(self):
+        assert _build_fts5_match(('c++ "dev"', "a&b")) == '"c dev" OR "a b"'
+        assert _sanitize_fts5_phrase("  e.g.  value?  ") == "e g value"
+    
+    def test_empty_phrases_are_dropped(self):
+        assert _build_fts5_match(("", "$$", "cloud")) == "cloud"
+        assert _build_fts5_match(("",)) == ""
+
+
+class TestExecuteSearch:
+    """Hits, phrase matching and BM25 normalisation"""
+    
+    def test_matched_phrases_and_exact_match(self, engine):
+        response = search(engine, ["network switch", "network", "test"])
+        hits = {hit.tender_id: hit for hit in response.hits}
+        
+        assert response.total_matches == 2
+        assert hits["T1"].matched_phrases == ["network switch", "network", "test"]
+        assert hits["T1"].exact_match
+        assert hits["T1"].keywords == ["lan", "wan"]
+        assert hits["T2"].matched_phrases == ["network", "test"]
+        assert not hits["T2"].exact_match
+        assert hits["T2"].keywords == []
+        assert max(hit.similarity_percent for hit in response.hits) == 100
+    
+    def test_stemmed_match_falls_back_to_keyword(self, engine):
+        response = search(engine, ["networks"])
+        
+        assert {hit.tender_id for hit in response.hits} == {"T1", "T2"}
+        assert all(hit.matched_phrases == ["network"] for hit in response.hits)
+    
+    def test_empty_query_returns_no_hits(self, engine):
+        response = search(engine, ["", "??"])
+        
+        assert response.total_matches == 0
+        assert response.hits == []
+    
+    def test_pagination(self, engine):
+        first = search(engine, ["network"], limit=1)
+        second = search(engine, ["network"], limit=1, offset=1)
+        
+        assert first.total_matches == second.total_matches == 2
+        assert first.hits[0].tender_id != second.hits[0].tender_id
+
+
+class TestProjection:
+    """projection loads only the requested hit fields"""
+    
+    def test_only_projected_and_required_fields_are_loaded(self, engine):
+        response = search(engine, ["network"], projection={"organization"})
+        hit = next(hit for hit in response.hits if hit.tender_id == "T1")
+        
+        assert REQUIRED_SEARCH_FIELDS == {"title", "tender_id"}
+        assert hit.title == ROWS[0][0]
+        assert hit.organization == "Org A"
+        assert hit.region is None
+        assert hit.keywords == []
+    
+    def test_full_projection_matches_default(self, engine):
+        assert search(engine, ["network"]).hits == search(engine, ["network"], projection=None).hits
+    
+    def test_unknown_field_is_rejected(self, engine):
+        with pytest.raises(ValueError, match="bogus"):
+            search(engine, ["network"], projection={"bogus"})